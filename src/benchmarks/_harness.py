@@ -0,0 +1,71 @@
+# src/benchmarks/_harness.py
+
+import json
+import os
+import resource
+import time
+from typing import Callable
+
+# Set to a file path to collect results as JSON lines (one object per benchmark)
+_RESULTS_ENV = "MCPROTOCOL_BENCH_RESULTS"
+
+
+def report(benchmark: str, metrics: dict) -> None:
+    """Print benchmark metrics and optionally append them as a JSON line.
+
+    Args:
+        benchmark (str): Benchmark name.
+        metrics (dict): Metric name -> value.
+    """
+    print(f"[{benchmark}]")
+    width = max(map(len, metrics), default=0)
+    for name, value in metrics.items():
+        shown = f"{value:,.3f}" if isinstance(value, float) else value
+        print(f"  {name:<{width}}  {shown}")
+
+    path = os.environ.get(_RESULTS_ENV)
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps({"benchmark": benchmark, "metrics": metrics}) + "\n")
+
+
+def per_call_us(func: Callable[[], object], number: int, repeat: int = 3) -> float:
+    """Return the best per-call time of `func` in microseconds.
+
+    Args:
+        func (Callable): Function to time.
+        number (int): Calls per run.
+        repeat (int): Runs; the fastest is kept.
+
+    Returns:
+        float: Microseconds per call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def raise_fd_limit(wanted: int) -> int:
+    """Raise the soft open-file limit towards `wanted` (capped by the hard limit).
+
+    Args:
+        wanted (int): Desired number of file descriptors.
+
+    Returns:
+        int: The resulting soft limit.
+    """
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    if target > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        soft = target
+    return soft
+
+
+def max_rss_kib() -> int:
+    """Return the peak resident set size of this process in KiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
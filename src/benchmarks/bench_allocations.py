@@ -0,0 +1,69 @@
+# src/benchmarks/bench_allocations.py
+
+"""Bytes and objects allocated per packet type when decoding and encoding.
+
+Run from `src/`:
+    python -m benchmarks.bench_allocations
+
+Packets are decoded through `PacketRegistry.instantiate` and re-encoded with
+`Packet.serialize` under an `AllocationProfiler`. Allocation metrics are
+deterministic enough to diff between runs; collect them with
+`MCPROTOCOL_BENCH_RESULTS` and compare with `benchmarks.compare`.
+"""
+
+import argparse
+
+from codec.packets.alloc_profiler import AllocationProfiler
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.registry import PacketRegistry
+from codec.packets.status.clientbound.status_response import StatusResponse
+from benchmarks._harness import report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--sample-interval", type=int, default=10)
+    parser.add_argument("--players", type=int, default=12)
+    args = parser.parse_args()
+
+    registry = PacketRegistry()
+    status = StatusResponse.from_status(
+        {
+            "version": {"name": "1.21.10", "protocol": 773},
+            "players": {
+                "max": 100,
+                "online": args.players,
+                "sample": [
+                    {"name": f"Player_{i}", "id": f"00000000-0000-0000-0000-{i:012d}"}
+                    for i in range(args.players)
+                ],
+            },
+            "description": {"text": "A Minecraft Server"},
+        }
+    )
+    payloads = [
+        ("Handshaking", "serverbound", "0x00", Intention(773, "play.example.com", 25565, 1)),
+        ("Status", "serverbound", "0x01", registry.instantiate("Status", "serverbound", "0x01", 42)),
+        ("Status", "clientbound", "0x00", status),
+        ("Status", "clientbound", "0x01", registry.instantiate("Status", "clientbound", "0x01", 42)),
+    ]
+    bodies = [
+        (state, direction, packet_id, bytes(packet.encode_body()[1:]))
+        for state, direction, packet_id, packet in payloads
+    ]
+
+    with AllocationProfiler(sample_interval=args.sample_interval, registry=registry) as profiler:
+        for _ in range(args.number):
+            for state, direction, packet_id, body in bodies:
+                packet = registry.instantiate(state, direction, packet_id, data=body)
+                packet.serialize()
+                packet.serialize(compression_threshold=64)
+        live = profiler.live_packets()
+
+    report("allocations", profiler.metrics())
+    report("allocations.live", {f"{name}.{k}": v for name, entry in live.items() for k, v in entry.items()})
+
+
+if __name__ == "__main__":
+    main()
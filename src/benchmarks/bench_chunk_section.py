@@ -0,0 +1,71 @@
+# src/benchmarks/bench_chunk_section.py
+
+"""Chunk section decode/encode, vectorized vs. pure-Python bit unpacking.
+
+Run from `src/`:
+    python -m benchmarks.bench_chunk_section
+
+A chunk burst is what a client receives on join: (2 * view distance + 1)^2
+chunks of 24 sections each. Sections use a 20-entry indirect palette
+(5 bits per entry), typical of terrain near the surface.
+"""
+
+import argparse
+import random
+
+from codec.data_types.complex import chunk_section
+from codec.data_types.complex.chunk_section import BIOMES, ChunkSection, PalettedContainer
+from benchmarks._harness import per_call_us, report
+
+_SECTIONS_PER_CHUNK = 24
+
+
+def _section(rng: random.Random) -> ChunkSection:
+    """Return one synthetic section."""
+    palette = rng.sample(range(27000), 20)
+    states = PalettedContainer.from_values([rng.choice(palette) for _ in range(4096)])
+    biomes = PalettedContainer.from_values([rng.choice((1, 7, 12)) for _ in range(64)], BIOMES)
+    return ChunkSection(4096, states, biomes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--view-distance", type=int, default=10)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    data = b"".join(bytes(_section(rng)) for _ in range(_SECTIONS_PER_CHUNK))
+    chunks = (2 * args.view_distance + 1) ** 2
+    sections = ChunkSection.decode_all(data, _SECTIONS_PER_CHUNK)
+
+    def decode():
+        ChunkSection.decode_all(data, _SECTIONS_PER_CHUNK)
+
+    def encode():
+        for section in sections:
+            bytes(section)
+
+    metrics = {"chunk_bytes": len(data), "burst_chunks": chunks}
+    for path, unpack, pack in (
+        ("python", chunk_section._unpack_python, chunk_section._pack_python),
+        ("numpy", chunk_section._unpack_numpy, chunk_section._pack_numpy),
+    ):
+        if path == "numpy" and chunk_section.np is None:
+            continue
+        saved = chunk_section._unpack, chunk_section._pack
+        chunk_section._unpack, chunk_section._pack = unpack, pack
+        try:
+            decode_us = per_call_us(decode, args.number)
+            encode_us = per_call_us(encode, args.number)
+        finally:
+            chunk_section._unpack, chunk_section._pack = saved
+        metrics[f"{path}_decode_chunk_us"] = decode_us
+        metrics[f"{path}_encode_chunk_us"] = encode_us
+        metrics[f"{path}_decode_burst_ms"] = decode_us * chunks / 1e3
+
+    report("chunk_section.burst", metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# src/benchmarks/bench_columnar_store.py
+
+"""Memory and query cost: `ColumnarStore` vs. a list of `Packet` objects.
+
+Run from `src/`:
+    python -m benchmarks.bench_columnar_store --packets 200000
+
+Packets are decoded from wire bytes, as when replaying a capture: Play
+Pong Responses (one Long) and Handshake Intentions (VarInt, String,
+Unsigned Short, VarInt). Memory is what tracemalloc sees for the kept
+packets or columns, per packet and relative to the wire size. The query
+sums one field over rows matching another, with a generator over the
+objects and with `where` + `aggregate` over the columns.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from codec.packets.columnar_store import ColumnarStore
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.play.clientbound.pong_response import PongResponse
+from benchmarks._harness import report
+
+
+def _traced(build):
+    """Return what `build()` returns and the bytes it keeps allocated."""
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size
+
+
+def _best(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packets", type=int, default=200000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cases = {
+        "pong": (
+            PongResponse,
+            [bytes(PongResponse(rng.getrandbits(63)).encode_body()[1:]) for _ in range(args.packets)],
+            "timestamp", "timestamp",
+        ),
+        "intention": (
+            Intention,
+            [
+                bytes(
+                    Intention(773, f"mc{rng.randrange(1000)}.example.com", rng.choice((25565, 25566)), rng.choice((1, 2)))
+                    .encode_body()[1:]
+                )
+                for _ in range(args.packets)
+            ],
+            "intent", "server_port",
+        ),
+    }
+
+    for name, (packet_cls, bodies, filter_field, sum_field) in cases.items():
+        wire = sum(len(body) + 1 for body in bodies)
+        objects, objects_size = _traced(lambda: [packet_cls.from_bytes(body) for body in bodies])
+
+        def build_store():
+            store = ColumnarStore()
+            store.extend(objects)
+            return store
+
+        store, store_size = _traced(build_store)
+        table = store.table(packet_cls)
+        threshold = getattr(objects[len(objects) // 2], filter_field)
+
+        def query_objects():
+            return sum(getattr(p, sum_field) for p in objects if getattr(p, filter_field) >= threshold)
+
+        def query_columns():
+            return table.aggregate(sum_field, "sum", table.where(filter_field, ">=", threshold))
+
+        if query_objects() != query_columns():
+            raise AssertionError(f"{name}: query results differ")
+        report(
+            f"columnar_store.{name}",
+            {
+                "packets": len(bodies),
+                "wire_bytes_per_packet": wire / len(bodies),
+                "objects_bytes_per_packet": objects_size / len(bodies),
+                "columns_bytes_per_packet": store_size / len(bodies),
+                "objects_x_wire": objects_size / wire,
+                "columns_x_wire": store_size / wire,
+                "query_objects_ms": _best(query_objects) * 1e3,
+                "query_columns_ms": _best(query_columns) * 1e3,
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# src/benchmarks/bench_compression_offload.py
+
+"""Event-loop stall while sending and receiving large compressed packets.
+
+Run from `src/`:
+    python -m benchmarks.bench_compression_offload
+
+A ticker coroutine sleeps 1 ms in a loop and records how late it wakes up.
+The same packets are exchanged over loopback with compression done inline
+and with `CompressionOffload`.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Optional
+
+from codec.packets.packet import Packet
+from codec.data_types.primitives.varint import VarInt
+from network.compression_offload import CompressionOffload
+from network.connection_manager import Connection
+from benchmarks._harness import report
+
+_THRESHOLD = 256
+
+
+class _BlobPacket(Packet):
+    """Stand-in for a registry_data / chunk packet carrying an opaque payload."""
+
+    __slots__ = ("blob",)
+
+    def __init__(self, blob: bytes) -> None:
+        super().__init__(VarInt(0x07))
+        self.blob = blob
+
+    def _iter_fields(self):
+        yield self.blob
+
+
+def _make_blob(size: int) -> bytes:
+    """Return `size` bytes of moderately compressible data (3 bits of entropy per byte)."""
+    table = bytes(b"abcdefgh"[i & 7] for i in range(256))
+    return random.Random(0).randbytes(size).translate(table)
+
+
+async def _ticker(stalls: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        stalls.append(time.perf_counter() - start - 0.001)
+
+
+async def _exchange(blob: bytes, count: int, offload: Optional[CompressionOffload]) -> dict:
+    received = asyncio.Event()
+    done = 0
+
+    async def serve(reader, writer):
+        nonlocal done
+        connection = Connection(
+            reader, writer, compression_threshold=_THRESHOLD, offload=offload
+        )
+        for _ in range(count):
+            await connection.inflate(await connection.read_frame())
+            done += 1
+        received.set()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    client = Connection(
+        reader, writer, compression_threshold=_THRESHOLD, role="client", offload=offload
+    )
+
+    stalls: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stalls, stop))
+    start = time.perf_counter()
+    for _ in range(count):
+        client.send_packet(_BlobPacket(blob))
+        await client.drain()
+    await received.wait()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+
+    client.close()
+    server.close()
+    await server.wait_closed()
+    stalls.sort()
+    return {
+        "packets": done,
+        "elapsed_s": elapsed,
+        "max_stall_ms": stalls[-1] * 1e3,
+        "p99_stall_ms": stalls[int(len(stalls) * 0.99)] * 1e3,
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    blob = _make_blob(args.size)
+    report("compression_offload.inline", await _exchange(blob, args.packets, None))
+
+    offload = CompressionOffload(min_size=args.min_size)
+    report("compression_offload.offloaded", await _exchange(blob, args.packets, offload))
+    offload.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=3 * 1024 * 1024)
+    parser.add_argument("--packets", type=int, default=10)
+    parser.add_argument("--min-size", type=int, default=128 * 1024)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# src/benchmarks/bench_connection_manager.py
+
+"""Idle-connection capacity and status throughput of `ConnectionManager`.
+
+Run from `src/`:
+    python -m benchmarks.bench_connection_manager --connections 5000
+
+Server and clients share one event loop on one core, so the status
+throughput figure includes client-side encode/decode as well.
+"""
+
+import argparse
+import asyncio
+import time
+
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.status.serverbound.status_request import StatusRequest
+from codec.packets.status.serverbound.ping_request import PingRequest
+from network.connection_manager import Connection, ConnectionManager
+from benchmarks._harness import max_rss_kib, raise_fd_limit, report
+
+_STATUS = {
+    "version": {"name": "1.21.9", "protocol": 773},
+    "players": {"max": 100, "online": 0},
+    "description": {"text": "benchmark"},
+}
+
+
+async def _open_idle(manager: ConnectionManager, count: int) -> dict:
+    """Open `count` connections that handshake into Status and then idle."""
+    handshake = Intention(773, "localhost", manager.port, 1).serialize()
+    rss_before = max_rss_kib()
+    start = time.perf_counter()
+
+    writers = []
+    for _ in range(count):
+        _, writer = await asyncio.open_connection("127.0.0.1", manager.port)
+        writer.write(handshake)
+        writers.append(writer)
+    while len(manager.connections) < count:
+        await asyncio.sleep(0.01)
+
+    elapsed = time.perf_counter() - start
+    metrics = {
+        "idle_connections": len(manager.connections),
+        "connect_rate_per_s": count / elapsed,
+        "rss_growth_kib": max_rss_kib() - rss_before,
+    }
+    for writer in writers:
+        writer.close()
+    while manager.connections:
+        await asyncio.sleep(0.01)
+    return metrics
+
+
+async def _status_client(manager: ConnectionManager, rounds: int) -> None:
+    """Perform `rounds` full status + ping exchanges on fresh connections."""
+    for i in range(rounds):
+        reader, writer = await asyncio.open_connection("127.0.0.1", manager.port)
+        connection = Connection(reader, writer, role="client", registry=manager.registry)
+        connection.send_packet(Intention(773, "localhost", manager.port, 1))
+        connection.set_state("Status")
+        connection.send_packet(StatusRequest())
+        await connection.read()
+        connection.send_packet(PingRequest(i))
+        await connection.read()
+        connection.close()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    raise_fd_limit(args.connections * 2 + 256)
+    manager = ConnectionManager("127.0.0.1", 0, status_provider=lambda: _STATUS)
+    await manager.start()
+
+    report("connection_manager.idle", await _open_idle(manager, args.connections))
+
+    rounds = args.requests // args.clients
+    start = time.perf_counter()
+    await asyncio.gather(*(_status_client(manager, rounds) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    report(
+        "connection_manager.status",
+        {
+            "exchanges": rounds * args.clients,
+            "exchanges_per_s": rounds * args.clients / elapsed,
+        },
+    )
+    await manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=10000)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
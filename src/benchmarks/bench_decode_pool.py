@@ -0,0 +1,96 @@
+# src/benchmarks/bench_decode_pool.py
+
+"""Decode throughput of `DecodePool` by worker count, GIL and free-threaded.
+
+Run from `src/` with any interpreter, e.g. both `python3.13` and
+`python3.13t`:
+    python -m benchmarks.bench_decode_pool --workers 1 2 4 8
+
+`--connections` streams each receive `--frames` compressed Status
+Response frames (a player sample makes each body a few kilobytes of
+JSON, so decoding is inflate + String + `json.loads` + text component).
+Every frame is submitted up front, then each stream is drained in order.
+The inline row decodes the same frames on the calling thread. With the
+GIL only inflation overlaps; a free-threaded build should scale with
+cores up to `--workers`.
+"""
+
+import argparse
+import sys
+import sysconfig
+import time
+
+from codec.packets.status.clientbound.status_response import StatusResponse
+from network.decode_pool import DecodePool
+from network.packet_codec import PacketCodec
+from benchmarks._harness import report
+
+_THRESHOLD = 256
+
+
+def _frame(players: int, index: int) -> bytes:
+    status = {
+        "version": {"name": "1.21.10", "protocol": 773},
+        "players": {
+            "max": 1000,
+            "online": players,
+            "sample": [
+                {"name": f"Player_{index}_{i}", "id": f"00000000-0000-0000-0000-{i:012d}"}
+                for i in range(players)
+            ],
+        },
+        "description": {"text": "Decode pool", "extra": [{"text": f" #{index}", "color": "gold"}]},
+    }
+    framed = StatusResponse.from_status(status).serialize(_THRESHOLD)
+    length_size = next(i for i, byte in enumerate(framed) if byte < 0x80) + 1
+    return framed[length_size:]
+
+
+def _gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--frames", type=int, default=250, help="frames per connection")
+    parser.add_argument("--players", type=int, default=100)
+    args = parser.parse_args()
+
+    codecs = [PacketCodec(_THRESHOLD, "Status", role="client") for _ in range(args.connections)]
+    frames = [_frame(args.players, i) for i in range(args.frames)]
+    total = args.connections * args.frames
+    build = {
+        "free_threaded_build": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "gil_enabled": _gil_enabled(),
+    }
+
+    start = time.perf_counter()
+    for codec in codecs:
+        for frame in frames:
+            codec._decode_body(codec._inflate(frame))
+    inline = time.perf_counter() - start
+    report("decode_pool.inline", {**build, "frames_per_s": total / inline})
+
+    for workers in args.workers:
+        pool = DecodePool(workers)
+        streams = [pool.stream(codec, max_pending=args.frames) for codec in codecs]
+        start = time.perf_counter()
+        for frame in frames:
+            for stream in streams:
+                stream.submit(frame)
+        for stream in streams:
+            for _ in range(args.frames):
+                stream.get()
+        elapsed = time.perf_counter() - start
+        pool.close()
+        report(
+            f"decode_pool.workers_{workers}",
+            {**build, "frames_per_s": total / elapsed, "speedup": inline / elapsed, **pool.stats()},
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# src/benchmarks/bench_dispatcher.py
+
+"""`PacketDispatcher` routing vs. decode + `isinstance` chains.
+
+Run from `src/`:
+    python -m benchmarks.bench_dispatcher
+
+The baseline decodes a Play Pong Response frame and walks an `isinstance`
+chain with one branch per Play clientbound packet type (the chain uses
+stand-in classes, since most Play classes do not exist yet; Pong is the
+last branch). The dispatcher routes the same frame with a list index.
+Skip rows time frames of unhandled packet IDs, which the baseline would
+have to decode in full: a small uncompressed one and a large compressed
+one (the dispatcher inflates only its first bytes).
+"""
+
+import argparse
+import os
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from codec.packets.play.clientbound.pong_response import PongResponse
+from network.dispatcher import PacketDispatcher
+from network.packet_codec import PacketCodec, decompress_body
+from benchmarks._harness import per_call_us, report
+
+_THRESHOLD = 256
+
+
+def _frame(body: bytes, threshold) -> bytes:
+    framed = Packet.frame(body, threshold)
+    length_size = next(i for i, byte in enumerate(framed) if byte < 0x80) + 1
+    return framed[length_size:]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--large-body", type=int, default=256 * 1024)
+    args = parser.parse_args()
+
+    codec = PacketCodec(_THRESHOLD, "Play", role="client")
+    play_types = len(codec.packets._paths["Play"]["clientbound"])
+    chain = [type(f"_Stub{i}", (Packet,), {"_iter_fields": lambda self: ()}) for i in range(play_types - 1)]
+    chain.append(PongResponse)
+
+    handled = []
+    dispatcher = PacketDispatcher()
+
+    @dispatcher.on("Play", PongResponse)
+    def pong(io, packet):
+        handled.append(packet.timestamp)
+
+    pong_frame = _frame(bytes(PongResponse(42).encode_body()), _THRESHOLD)
+    # 0x01 Add Entity and 0x27 Level Chunk With Light have no handler (nor class)
+    small_frame = _frame(bytes(VarInt(0x01)) + os.urandom(40), _THRESHOLD)
+    large_body = bytes(VarInt(0x27)) + os.urandom(args.large_body // 2) + bytes(args.large_body // 2)
+    large_frame = _frame(large_body, _THRESHOLD)
+
+    def chained():
+        packet = codec._decode_body(codec._inflate(pong_frame))
+        for cls in chain:
+            if isinstance(packet, cls):
+                handled.append(packet.timestamp)
+                break
+
+    data_length, size = VarInt.from_bytes(large_frame, 0)
+
+    metrics = {
+        "play_clientbound_types": play_types,
+        "isinstance_chain_us": per_call_us(chained, args.number),
+        "dispatch_us": per_call_us(lambda: dispatcher.dispatch(codec, pong_frame), args.number),
+        "skip_small_us": per_call_us(lambda: dispatcher.dispatch(codec, small_frame), args.number),
+        "skip_large_us": per_call_us(lambda: dispatcher.dispatch(codec, large_frame), args.number // 10),
+        "inflate_large_us": per_call_us(
+            lambda: decompress_body(large_frame[size:], data_length.value), args.number // 100
+        ),
+        "dispatched": dispatcher.dispatched,
+        "skipped": dispatcher.skipped,
+    }
+    report("dispatcher", metrics)
+
+
+if __name__ == "__main__":
+    main()
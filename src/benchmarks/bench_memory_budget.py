@@ -0,0 +1,81 @@
+# src/benchmarks/bench_memory_budget.py
+
+"""Memory pinned by slow clients trickling maximum-size frames.
+
+Run from `src/`:
+    python -m benchmarks.bench_memory_budget
+
+Each client announces a 2 MiB frame and sends only part of it. Without a
+buffer pool every partial frame sits in its stream reader; with one, the
+global budget caps what is buffered and the surplus clients are paused,
+then dropped. Server-side Python allocations are measured with tracemalloc.
+"""
+
+import argparse
+import asyncio
+import socket
+import tracemalloc
+from typing import Optional
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.constants import _MAX_VARINT_3_BYTES
+from network.buffer_pool import BufferPool
+from network.connection_manager import ConnectionManager
+from benchmarks._harness import raise_fd_limit, report
+
+
+async def _run(
+    pool: Optional[BufferPool], clients: int, sent: int, settle: float
+) -> dict:
+    """Connect `clients` tricklers and return memory metrics."""
+    loop = asyncio.get_running_loop()
+    manager = ConnectionManager(host="127.0.0.1", port=0, buffer_pool=pool)
+    await manager.start()
+
+    blob = bytes(VarInt(_MAX_VARINT_3_BYTES)) + bytes(sent)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+
+    sockets = []
+    for _ in range(clients):
+        sock = socket.create_connection(("127.0.0.1", manager.port))
+        sock.setblocking(False)
+        sockets.append(sock)
+    sends = [loop.create_task(loop.sock_sendall(sock, blob)) for sock in sockets]
+    await asyncio.wait(sends, timeout=settle)
+    await asyncio.sleep(settle)
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    metrics = {
+        "traced_mib": (current - base) / 2**20,
+        "traced_peak_mib": (peak - base) / 2**20,
+        "open_connections": len(manager.connections),
+    }
+    metrics.update(manager.memory_stats())
+
+    for task in sends:
+        task.cancel()
+    for sock in sockets:
+        sock.close()
+    await manager.close()
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--sent-kib", type=int, default=1024)
+    parser.add_argument("--pool-mib", type=int, default=32)
+    parser.add_argument("--settle", type=float, default=2.0)
+    args = parser.parse_args()
+    raise_fd_limit(2 * args.clients + 64)
+
+    sent = args.sent_kib * 1024
+    report("memory_budget.unbounded", asyncio.run(_run(None, args.clients, sent, args.settle)))
+    pool = BufferPool(max_bytes=args.pool_mib * 2**20, wait_timeout=args.settle / 2)
+    report("memory_budget.pooled", asyncio.run(_run(pool, args.clients, sent, args.settle)))
+
+
+if __name__ == "__main__":
+    main()
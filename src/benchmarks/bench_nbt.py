@@ -0,0 +1,104 @@
+# src/benchmarks/bench_nbt.py
+
+"""Lazy NBT decoding on a registry_data-sized payload.
+
+Run from `src/`:
+    python -m benchmarks.bench_nbt
+
+The payload mimics the `worldgen/biome` registry: one network NBT compound
+per entry with nested effects, feature lists and spawner tables.
+"""
+
+import argparse
+
+from codec.data_types.complex.nbt import Nbt
+from benchmarks._harness import per_call_us, report
+
+
+def _biome(index: int) -> dict:
+    """Return one synthetic biome entry."""
+    features = [
+        [f"minecraft:feature_{index}_{step}_{i}" for i in range(12)] for step in range(11)
+    ]
+    spawners = {
+        category: [
+            {"type": f"minecraft:{category}_{i}", "weight": 10 + i, "minCount": 1, "maxCount": 4}
+            for i in range(6)
+        ]
+        for category in ("monster", "creature", "ambient", "water_creature", "misc")
+    }
+    return {
+        "has_precipitation": True,
+        "temperature": 0.8,
+        "downfall": 0.4,
+        "effects": {
+            "fog_color": 12638463,
+            "water_color": 4159204 + index,
+            "water_fog_color": 329011,
+            "sky_color": 7907327,
+            "mood_sound": {
+                "sound": "minecraft:ambient.cave",
+                "tick_delay": 6000,
+                "block_search_extent": 8,
+                "offset": 2.0,
+            },
+            "music": [
+                {
+                    "data": {
+                        "sound": f"minecraft:music.overworld.{index}",
+                        "min_delay": 12000,
+                        "max_delay": 24000,
+                    },
+                    "weight": 1,
+                }
+            ],
+        },
+        "carvers": ["minecraft:cave", "minecraft:cave_extra_underground", "minecraft:canyon"],
+        "features": features,
+        "spawners": spawners,
+        "spawn_costs": {},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=64)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = b"".join(bytes(Nbt(_biome(i))) for i in range(args.entries))
+    view = memoryview(payload)
+
+    def skip_all():
+        offset = 0
+        while offset < len(payload):
+            offset += Nbt.skip(view, offset)
+
+    def lazy_path():
+        offset = 0
+        while offset < len(payload):
+            nbt, size = Nbt.from_bytes(view, offset)
+            nbt.value["effects"]["water_color"]
+            offset += size
+
+    def full_decode():
+        offset = 0
+        while offset < len(payload):
+            nbt, size = Nbt.from_bytes(view, offset)
+            nbt.value.to_python()
+            offset += size
+
+    report(
+        "nbt.registry_data",
+        {
+            "entries": args.entries,
+            "payload_bytes": len(payload),
+            "skip_us": per_call_us(skip_all, args.number),
+            "lazy_one_path_us": per_call_us(lazy_path, args.number),
+            "full_decode_us": per_call_us(full_decode, args.number),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# src/benchmarks/bench_outbound_scheduler.py
+
+"""Queueing delay behind a chunk burst: FIFO `PacketWriter` vs. `OutboundScheduler`.
+
+Run from `src/`:
+    python -m benchmarks.bench_outbound_scheduler --burst-mib 8 --rate-mib 16
+
+A writer thread sends over a socketpair to a reader that drains at a
+fixed rate (a slow client link). The producer queues a burst of bulk
+frames (chunk-sized), then, for the time the burst takes to drain, a
+keep-alive (control) and a player position (normal) frame every few
+milliseconds. Frames carry their class and enqueue time, and the reader
+records the delay from enqueue to arrival per class. Raw frames with
+explicit priorities stand in for the Play packets, most of which have
+no class yet.
+"""
+
+import argparse
+import socket
+import struct
+import threading
+import time
+
+from codec.data_types.primitives.varint import VarInt
+from network.histogram import LatencyHistogram
+from network.outbound_scheduler import BULK, CONTROL, NORMAL, OutboundScheduler
+from network.packet_writer import PacketWriter
+from benchmarks._harness import report
+
+_CLASSES = (CONTROL, NORMAL, BULK)
+_STAMP = struct.Struct(">Bq")
+
+
+def _frame(kind: int, size: int) -> bytes:
+    body = _STAMP.pack(kind, time.perf_counter_ns()) + bytes(max(0, size - _STAMP.size))
+    return bytes(VarInt(len(body))) + body
+
+
+def _read_frames(sock: socket.socket, rate: float, total: int, delays) -> None:
+    """Drain `total` frames at `rate` bytes/s, recording delay by class."""
+    buffer = bytearray()
+    start = time.perf_counter()
+    received = 0
+    while total:
+        chunk = sock.recv(64 * 1024)
+        if not chunk:
+            return
+        received += len(chunk)
+        buffer += chunk
+        while True:
+            try:
+                length, size = VarInt.from_bytes(buffer, 0)
+            except (ValueError, IndexError):
+                break
+            end = size + length.value
+            if len(buffer) < end:
+                break
+            kind, stamp = _STAMP.unpack_from(buffer, size)
+            delays[kind].record(time.perf_counter_ns() - stamp)
+            del buffer[:end]
+            total -= 1
+        ahead = received / rate - (time.perf_counter() - start)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def _run(scheduler, args) -> dict:
+    server, client = socket.socketpair()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024)
+    client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 64 * 1024)
+    writer = PacketWriter(server, max_pending=1 << 20, scheduler=scheduler)
+
+    rate = args.rate_mib * 1024 * 1024
+    bulk = int(args.burst_mib * 1024 // args.chunk_kib)
+    ticks = int(args.burst_mib / args.rate_mib / (args.tick_ms / 1e3))
+    delays = [LatencyHistogram() for _ in _CLASSES]
+    # Daemon: a failing producer must not leave the process waiting on it
+    reader = threading.Thread(
+        target=_read_frames, args=(client, rate, bulk + 2 * ticks, delays), daemon=True
+    )
+    reader.start()
+
+    for _ in range(bulk):
+        writer.put(_frame(2, args.chunk_kib * 1024), priority=BULK)
+    for _ in range(ticks):
+        writer.put(_frame(0, 16), priority=CONTROL)
+        writer.put(_frame(1, 60), priority=NORMAL)
+        time.sleep(args.tick_ms / 1e3)
+
+    reader.join()
+    writer.close()
+    server.close()
+    client.close()
+    metrics = {}
+    for name, histogram in zip(_CLASSES, delays):
+        summary = histogram.summary()
+        metrics[f"{name}_frames"] = summary["count"]
+        metrics[f"{name}_p50_ms"] = summary["p50"]
+        metrics[f"{name}_p99_ms"] = summary["p99"]
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst-mib", type=float, default=8)
+    parser.add_argument("--chunk-kib", type=int, default=64)
+    parser.add_argument("--rate-mib", type=float, default=16)
+    parser.add_argument("--tick-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    report("outbound_scheduler.fifo", _run(None, args))
+    report("outbound_scheduler.scheduled", _run(OutboundScheduler(), args))
+
+
+if __name__ == "__main__":
+    main()
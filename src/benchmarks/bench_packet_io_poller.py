@@ -0,0 +1,109 @@
+# src/benchmarks/bench_packet_io_poller.py
+
+"""Many connections on one thread: `PacketIOPoller` vs. a thread per blocking `PacketIO`.
+
+Run from `src/`:
+    python -m benchmarks.bench_packet_io_poller --connections 2000 --rounds 20
+
+Each connection is a socketpair. Per round, every peer writes one Status
+Pong Response frame, and the receiving side reads all of them: one
+thread iterating a `PacketIOPoller`, or one thread per connection calling
+`PacketIO.read`. Rows report packets per second, threads used and (for
+the poller) select calls and packets per select.
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from codec.packets.status.clientbound.pong_response import PongResponse
+from network.packet_io import PacketIO
+from network.packet_io_poller import PacketIOPoller
+from benchmarks._harness import raise_fd_limit, report
+
+
+def _pairs(count: int):
+    pairs = [socket.socketpair() for _ in range(count)]
+    ios = [PacketIO(ours, initial_state="Status", role="client") for ours, _ in pairs]
+    return ios, [peer for _, peer in pairs]
+
+
+def _close(ios, peers) -> None:
+    for io, peer in zip(ios, peers):
+        io.sock.close()
+        peer.close()
+
+
+def _run_poller(args, frame: bytes) -> dict:
+    ios, peers = _pairs(args.connections)
+    poller = PacketIOPoller()
+    for io in ios:
+        poller.register(io)
+
+    received = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for peer in peers:
+            peer.sendall(frame)
+        expected = received + args.connections
+        for _ in poller:
+            received += 1
+            if received == expected:
+                break
+    elapsed = time.perf_counter() - start
+
+    poller.close()
+    _close(ios, peers)
+    return {
+        "connections": args.connections,
+        "threads": 1,
+        "packets_per_s": received / elapsed,
+        "polls": poller.polls,
+        "packets_per_poll": received / poller.polls,
+    }
+
+
+def _run_threads(args, frame: bytes) -> dict:
+    ios, peers = _pairs(args.connections)
+    counts = [0] * len(ios)
+
+    def reader(index: int, io: PacketIO) -> None:
+        for _ in range(args.rounds):
+            io.read()
+            counts[index] += 1
+
+    threads = [threading.Thread(target=reader, args=(i, io), daemon=True) for i, io in enumerate(ios)]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for peer in peers:
+            peer.sendall(frame)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    _close(ios, peers)
+    return {
+        "connections": args.connections,
+        "threads": len(threads) + 1,
+        "packets_per_s": sum(counts) / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    raise_fd_limit(args.connections * 2 + 256)
+    frame = PongResponse(42).serialize()
+    report("packet_io_poller.poller", _run_poller(args, frame))
+    report("packet_io_poller.threads", _run_threads(args, frame))
+
+
+if __name__ == "__main__":
+    main()
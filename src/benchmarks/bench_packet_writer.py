@@ -0,0 +1,95 @@
+# src/benchmarks/bench_packet_writer.py
+
+"""Many threads sending on one `PacketIO`: caller lock vs. writer thread.
+
+Run from `src/`:
+    python -m benchmarks.bench_packet_writer --threads 8
+
+`--threads` game-logic threads each send `--packets` Ping Requests over a
+socket pair while a reader thread drains the other end. With a lock,
+every sender serializes and blocks in `sendall`; with `start_writer`,
+senders only queue packets and a writer thread serializes and coalesces
+them. Reported: packets per second, CPU time the sending threads spent per
+packet (packet construction included), and the writer's queue depth and
+enqueue-to-sent latency.
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from codec.packets.status.serverbound.ping_request import PingRequest
+from network.packet_io import PacketIO
+from benchmarks._harness import report
+
+
+def _drain(sock: socket.socket, stop: threading.Event) -> None:
+    while not stop.is_set():
+        if not sock.recv(1 << 20):
+            return
+
+
+def _run(args: argparse.Namespace, threaded: bool) -> dict:
+    left, right = socket.socketpair()
+    stop = threading.Event()
+    reader = threading.Thread(target=_drain, args=(right, stop), daemon=True)
+    reader.start()
+
+    io = PacketIO(left, compression_threshold=args.threshold)
+    if threaded:
+        io.start_writer(max_pending=args.max_pending, on_full=args.on_full)
+    lock = threading.Lock()
+    caller_cpu = [0.0] * args.threads
+
+    def sender(index: int) -> None:
+        start = time.thread_time()
+        for i in range(args.packets):
+            packet = PingRequest(i)
+            if threaded:
+                io.send_packet(packet)
+            else:
+                with lock:
+                    io.send_packet(packet)
+        caller_cpu[index] = time.thread_time() - start
+
+    threads = [threading.Thread(target=sender, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if threaded:
+        io.writer.flush()
+    elapsed = time.perf_counter() - start
+
+    total = args.threads * args.packets
+    metrics = {
+        "packets_per_s": total / elapsed,
+        "caller_cpu_us": sum(caller_cpu) / total * 1e6,
+    }
+    if threaded:
+        metrics.update(io.writer.stats())
+        io.stop_writer()
+    stop.set()
+    left.close()
+    reader.join()
+    right.close()
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--packets", type=int, default=20000, help="packets per thread")
+    parser.add_argument("--threshold", type=int, default=256)
+    parser.add_argument("--max-pending", type=int, default=4096)
+    parser.add_argument("--on-full", choices=("block", "drop", "raise"), default="block")
+    args = parser.parse_args()
+
+    report("packet_writer.locked", _run(args, threaded=False))
+    report("packet_writer.threaded", _run(args, threaded=True))
+
+
+if __name__ == "__main__":
+    main()
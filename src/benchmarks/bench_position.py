@@ -0,0 +1,51 @@
+# src/benchmarks/bench_position.py
+
+"""Packed Position encode/decode, scalar vs. PositionArray.
+
+Run from `src/`:
+    python -m benchmarks.bench_position
+"""
+
+import argparse
+import random
+
+from codec.data_types.primitives.position import Position
+from codec.data_types.complex import position_array
+from codec.data_types.complex.position_array import PositionArray
+from benchmarks._harness import per_call_us, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=4096)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    positions = [
+        Position(rng.randint(-30_000_000, 30_000_000), rng.randint(-64, 319), rng.randint(-30_000_000, 30_000_000))
+        for _ in range(args.count)
+    ]
+    data = b"".join(bytes(p) for p in positions)
+    array = PositionArray.from_positions(positions)
+
+    def scalar_decode():
+        for offset in range(0, len(data), 8):
+            Position.from_bytes(data, offset)
+
+    def scalar_encode():
+        b"".join(bytes(p) for p in positions)
+
+    metrics = {
+        "positions": args.count,
+        "scalar_decode_us": per_call_us(scalar_decode, args.number),
+        "scalar_encode_us": per_call_us(scalar_encode, args.number),
+        "array_decode_us": per_call_us(lambda: PositionArray.from_bytes(data, 0, args.count), args.number),
+        "array_encode_us": per_call_us(lambda: bytes(array), args.number),
+        "numpy": position_array.np is not None,
+    }
+    report("position.bulk", metrics)
+
+
+if __name__ == "__main__":
+    main()
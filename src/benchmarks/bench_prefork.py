@@ -0,0 +1,79 @@
+# src/benchmarks/bench_prefork.py
+
+"""Status-ping throughput of `PreforkServer` by worker count.
+
+Run from `src/`:
+    python -m benchmarks.bench_prefork --server-workers 1 2 4 8 16
+
+For each worker count a `PreforkServer` is started on a loopback port and
+`benchmarks.load_generator` drives status + ping exchanges against it. Give
+the clients enough processes (`--client-workers`) that they are not the
+bottleneck; on a host with fewer cores than server plus client processes
+the numbers flatten out.
+"""
+
+import argparse
+import os
+
+from codec.packets.constants import _DEFAULT_PROTOCOL_VERSION
+from network.prefork import PreforkServer
+from benchmarks._harness import raise_fd_limit, report
+from benchmarks.load_generator import generate_load
+
+_STATUS = {
+    "version": {"name": "1.21.10", "protocol": _DEFAULT_PROTOCOL_VERSION},
+    "players": {"max": 100, "online": 0},
+    "description": {"text": "benchmark"},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server-workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--client-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=200, help="clients per client worker")
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    raise_fd_limit(65536)
+
+    baseline = None
+    for workers in args.server_workers:
+        server = PreforkServer(
+            "127.0.0.1", 0, workers, health_interval=0.2, status_provider=lambda: _STATUS
+        )
+        server.start()
+        try:
+            load = argparse.Namespace(
+                flow="status",
+                host="127.0.0.1",
+                workers=args.client_workers,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                timeout=5.0,
+                publish_interval=0.5,
+            )
+            metrics = generate_load(load, server.port, progress=False)
+            server.supervise()
+            served = server.metrics()
+        finally:
+            server.stop()
+
+        baseline = baseline or metrics["flows_per_s"]
+        report(
+            f"prefork.{workers}_workers",
+            {
+                "server_workers": workers,
+                "exchanges_per_s": metrics["flows_per_s"],
+                "speedup": metrics["flows_per_s"] / baseline,
+                "flow_p50_ms": metrics["flow_p50_ms"],
+                "flow_p99_ms": metrics["flow_p99_ms"],
+                "failures": metrics["failures"],
+                "accepted": served["accepted"],
+                "min_worker_accepted": min(w["accepted"] for w in served["workers"]),
+                "restarts": served["restarts"],
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
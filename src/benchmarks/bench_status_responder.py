@@ -0,0 +1,95 @@
+# src/benchmarks/bench_status_responder.py
+
+"""Status Response frames per second: `StatusResponder` vs. `StatusResponse.from_status`.
+
+Run from `src/`:
+    python -m benchmarks.bench_status_responder --favicon-kib 24 --players 12
+
+The status carries a base64 favicon and a player sample. Each request
+changes the online count; every `--sample-every` requests the sample
+changes too. The naive path builds the packet with `from_status` and
+frames it with `serialize()`; the responder splices the values into its
+template, given either the counts (`response`) or the whole status object
+as a provider returns it (`response_for`). All three produce identical
+frames.
+"""
+
+import argparse
+import base64
+import os
+
+from codec.packets.status.clientbound.status_response import StatusResponse
+from network.status_responder import StatusResponder
+from benchmarks._harness import per_call_us, report
+
+
+def _sample(players: int, offset: int) -> list:
+    return [
+        {"name": f"Player_{offset + i}", "id": f"00000000-0000-0000-0000-{offset + i:012d}"}
+        for i in range(players)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--favicon-kib", type=int, default=24)
+    parser.add_argument("--players", type=int, default=12)
+    parser.add_argument("--sample-every", type=int, default=100)
+    args = parser.parse_args()
+
+    favicon = "data:image/png;base64," + base64.b64encode(os.urandom(args.favicon_kib * 1024 * 3 // 4)).decode()
+    samples = [_sample(args.players, offset) for offset in range(4)]
+    status = {
+        "version": {"name": "1.21.10", "protocol": 773},
+        "players": {"max": 100, "online": 0, "sample": samples[0]},
+        "description": {"text": "A Minecraft Server", "color": "gold"},
+        "favicon": favicon,
+        "enforcesSecureChat": False,
+    }
+    responder = StatusResponder(status)
+    counter = [0]
+
+    def status_now() -> dict:
+        counter[0] += 1
+        n = counter[0]
+        sample = samples[n // args.sample_every % len(samples)]
+        return {**status, "players": {"max": 100, "online": n % 1000, "sample": sample}}
+
+    def naive():
+        return StatusResponse.from_status(status_now()).serialize()
+
+    def templated():
+        counter[0] += 1
+        n = counter[0]
+        return responder.response(n % 1000, sample=samples[n // args.sample_every % len(samples)])
+
+    def templated_full():
+        return responder.response_for(status_now())
+
+    for build in (naive, templated, templated_full):
+        counter[0] = 41
+        frame = build()
+        counter[0] = 41
+        if frame != naive():
+            raise AssertionError(f"{build.__name__}: frame differs from StatusResponse.serialize()")
+
+    naive_us = per_call_us(naive, args.number)
+    templated_us = per_call_us(templated, args.number)
+    templated_full_us = per_call_us(templated_full, args.number)
+    report(
+        "status_responder",
+        {
+            "frame_bytes": len(frame),
+            "naive_us": naive_us,
+            "templated_us": templated_us,
+            "templated_full_us": templated_full_us,
+            "naive_per_s": 1e6 / naive_us,
+            "templated_per_s": 1e6 / templated_us,
+            "templated_full_per_s": 1e6 / templated_full_us,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# src/benchmarks/bench_streaming_serialize.py
+
+"""Streaming vs. buffered serialization of large packets.
+
+Run from `src/`:
+    python -m benchmarks.bench_streaming_serialize
+
+Two packet shapes are serialized with compression enabled, once with
+`Packet.serialize` and once with `serialize_streaming` into a `BufferPool`:
+
+- a Chunk Data-like packet: coordinates, then `--sections` encoded chunk
+  sections, one field each (the default is the full 4064-block build
+  height, 254 sections);
+- a Registry Data-like packet: an identifier, then `--entries` entries of
+  an identifier and an NBT compound.
+
+Neither packet class exists in the registry yet; both are built here from
+the codec's primitives. Peak memory is the tracemalloc peak above the
+already-built packet; time to first byte is measured up to the first
+`write` on a null writer, which is where a socket send would start.
+"""
+
+import argparse
+import random
+import struct
+import time
+import tracemalloc
+import zlib
+
+from codec.data_types.complex.chunk_section import BIOMES, ChunkSection, PalettedContainer
+from codec.data_types.complex.nbt import Nbt
+from codec.data_types.primitives.boolean import Boolean
+from codec.data_types.primitives.string import String
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from network.buffer_pool import BufferPool
+from network.stream_serializer import serialize_streaming
+from benchmarks._harness import report
+
+
+class _ChunkData(Packet):
+    """Chunk Data-like packet holding its sections already encoded, as a chunk cache would."""
+
+    def __init__(self, x: int, z: int, sections: list):
+        super().__init__(VarInt(0x27))
+        self.x, self.z, self.sections = x, z, sections
+
+    def _iter_fields(self):
+        yield struct.pack(">ii", self.x, self.z)  # no Int primitive yet
+        yield bytes(VarInt(sum(map(len, self.sections))))
+        yield from self.sections
+
+
+class _RegistryData(Packet):
+    """Registry Data-like packet: (identifier, optional NBT) entries."""
+
+    def __init__(self, registry: str, entries: list):
+        super().__init__(VarInt(0x07))
+        self.registry, self.entries = registry, entries
+
+    def _iter_fields(self):
+        yield bytes(String(self.registry))
+        yield bytes(VarInt(len(self.entries)))
+        for name, data in self.entries:
+            yield bytes(String(name))
+            yield bytes(Boolean(True))
+            yield bytes(Nbt(data))
+
+
+class _NullWriter:
+    """Discards writes, remembering when the first one happened."""
+
+    def __init__(self):
+        self.first = None
+        self.size = 0
+
+    def write(self, data) -> None:
+        if self.first is None:
+            self.first = time.perf_counter()
+        self.size += len(data)
+
+
+def _section(rng: random.Random) -> bytes:
+    palette = rng.sample(range(27000), 20)
+    section = ChunkSection(
+        4096,
+        PalettedContainer.from_values([rng.choice(palette) for _ in range(4096)]),
+        PalettedContainer.from_values([rng.choice((1, 7, 12)) for _ in range(64)], BIOMES),
+    )
+    return bytes(section)
+
+
+def _chunk(rng: random.Random, sections: int) -> _ChunkData:
+    return _ChunkData(3, -7, [_section(rng) for _ in range(sections)])
+
+
+def _registry(rng: random.Random, entries: int) -> _RegistryData:
+    return _RegistryData(
+        "minecraft:worldgen/biome",
+        [
+            (
+                f"minecraft:biome_{i}",
+                {
+                    "has_precipitation": 1,
+                    "temperature": rng.random(),
+                    "downfall": rng.random(),
+                    "effects": {
+                        "fog_color": rng.randrange(1 << 24),
+                        "sky_color": rng.randrange(1 << 24),
+                        "water_color": rng.randrange(1 << 24),
+                        "mood_sound": {"sound": "minecraft:ambient.cave", "tick_delay": 6000},
+                    },
+                    "features": [[f"minecraft:feature_{rng.randrange(500)}" for _ in range(8)] for _ in range(11)],
+                },
+            )
+            for i in range(entries)
+        ],
+    )
+
+
+def _measure(send, number: int) -> dict:
+    """Return peak traced bytes (one run) and the best TTFB and total time."""
+    tracemalloc.start()
+    send(_NullWriter())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ttfb = total = float("inf")
+    for _ in range(number):
+        writer = _NullWriter()
+        start = time.perf_counter()
+        send(writer)
+        total = min(total, time.perf_counter() - start)
+        ttfb = min(ttfb, writer.first - start)
+    return {"peak_kib": peak / 1024, "ttfb_ms": ttfb * 1e3, "total_ms": total * 1e3, "frame_bytes": writer.size}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=254)
+    parser.add_argument("--entries", type=int, default=1500)
+    parser.add_argument("--threshold", type=int, default=256)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pool = BufferPool()
+    for name, packet in (("chunk", _chunk(rng, args.sections)), ("registry_data", _registry(rng, args.entries))):
+        streamed = serialize_streaming(packet, args.threshold, pool)
+        frame = bytes(streamed)
+        streamed.release()
+        expected = packet.encode_body()
+        if zlib.decompress(frame[len(streamed.header):]) != expected:
+            raise AssertionError(f"{name}: streamed frame does not round-trip")
+
+        def buffered(writer):
+            writer.write(packet.serialize(args.threshold))
+
+        def streaming(writer):
+            serialize_streaming(packet, args.threshold, pool).write_to(writer)
+
+        metrics = {"body_bytes": len(expected)}
+        for path, send in (("buffered", buffered), ("streaming", streaming)):
+            metrics.update({f"{path}_{key}": value for key, value in _measure(send, args.number).items()})
+        report(f"streaming_serialize.{name}", metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# src/benchmarks/bench_timer_wheel.py
+
+"""Shared timer wheel vs. per-connection asyncio timers.
+
+Run from `src/`:
+    python -m benchmarks.bench_timer_wheel --connections 50000
+
+Every simulated connection has a read-idle timeout and a periodic
+keepalive. The naive scheme re-creates the read timeout with
+`loop.call_later` on every received frame, as a `wait_for` around each
+read does; the wheel scheme only stamps the connection with the wheel's
+tick. Both run for `--duration` seconds with keepalives firing, and the
+loop's CPU time over that window is reported along with arm/activity
+costs and the memory held by the timers.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from network.timer_wheel import TimerWheel
+from benchmarks._harness import report
+
+
+class _Conn:
+    __slots__ = ("read", "keepalive", "last_read", "sent")
+
+    def __init__(self):
+        self.read = self.keepalive = None
+        self.last_read = 0
+        self.sent = 0
+
+
+def _traced(func) -> int:
+    """Return the bytes still allocated after calling `func` (untimed)."""
+    tracemalloc.start()
+    func()
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return traced
+
+
+async def _naive(args: argparse.Namespace) -> dict:
+    loop = asyncio.get_running_loop()
+    conns = [_Conn() for _ in range(args.connections)]
+
+    def expire(conn):
+        conn.read = None
+
+    def keepalive(conn):
+        conn.sent += 1
+        conn.keepalive = loop.call_later(args.keepalive, keepalive, conn)
+
+    def arm_all():
+        for conn in conns:
+            conn.read = loop.call_later(args.read_timeout, expire, conn)
+            conn.keepalive = loop.call_later(args.keepalive, keepalive, conn)
+
+    traced = _traced(arm_all)
+    for conn in conns:
+        conn.read.cancel()
+        conn.keepalive.cancel()
+    start = time.perf_counter()
+    arm_all()
+    arm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for conn in conns:
+            conn.read.cancel()
+            conn.read = loop.call_later(args.read_timeout, expire, conn)
+    activity = time.perf_counter() - start
+
+    cpu = time.process_time()
+    await asyncio.sleep(args.duration)
+    cpu = time.process_time() - cpu
+
+    start = time.perf_counter()
+    for conn in conns:
+        conn.read.cancel()
+        conn.keepalive.cancel()
+    cancel = time.perf_counter() - start
+    await asyncio.sleep(0)
+    return {
+        "arm_us_per_conn": arm / args.connections * 1e6,
+        "frame_us": activity / (args.frames * args.connections) * 1e6,
+        "cancel_us_per_conn": cancel / args.connections * 1e6,
+        "idle_cpu_s": cpu,
+        "keepalives_sent": sum(conn.sent for conn in conns),
+        "timer_kib": traced / 1024,
+    }
+
+
+async def _wheel(args: argparse.Namespace) -> dict:
+    wheel = TimerWheel(tick=args.tick)
+    conns = [_Conn() for _ in range(args.connections)]
+
+    def check_idle(conn):
+        idle = (wheel.ticks - conn.last_read) * wheel.tick
+        if idle < args.read_timeout:
+            conn.read = wheel.schedule(args.read_timeout - idle, check_idle, conn)
+
+    def keepalive(conn):
+        conn.sent += 1
+        conn.keepalive = wheel.schedule(args.keepalive, keepalive, conn)
+
+    def arm_all():
+        for conn in conns:
+            conn.read = wheel.schedule(args.read_timeout, check_idle, conn)
+            conn.keepalive = wheel.schedule(args.keepalive, keepalive, conn)
+
+    traced = _traced(arm_all)
+    for conn in conns:
+        conn.read.cancel()
+        conn.keepalive.cancel()
+    start = time.perf_counter()
+    arm_all()
+    arm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for conn in conns:
+            conn.last_read = wheel.ticks
+    activity = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for conn in conns:
+            conn.read.cancel()
+            conn.read = wheel.schedule(args.read_timeout, check_idle, conn)
+    reschedule = time.perf_counter() - start
+
+    cpu = time.process_time()
+    await asyncio.sleep(args.duration)
+    cpu = time.process_time() - cpu
+
+    start = time.perf_counter()
+    for conn in conns:
+        conn.read.cancel()
+        conn.keepalive.cancel()
+    cancel = time.perf_counter() - start
+    await asyncio.sleep(2 * args.tick)
+    return {
+        "arm_us_per_conn": arm / args.connections * 1e6,
+        "frame_us": activity / (args.frames * args.connections) * 1e6,
+        "reschedule_us": reschedule / (args.frames * args.connections) * 1e6,
+        "cancel_us_per_conn": cancel / args.connections * 1e6,
+        "idle_cpu_s": cpu,
+        "keepalives_sent": sum(conn.sent for conn in conns),
+        "timer_kib": traced / 1024,
+        "pending_after_cancel": len(wheel),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=50000)
+    parser.add_argument("--frames", type=int, default=10, help="frames received per connection")
+    parser.add_argument("--read-timeout", type=float, default=30.0)
+    parser.add_argument("--keepalive", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--tick", type=float, default=0.1)
+    args = parser.parse_args()
+
+    report("timer_wheel.naive", asyncio.run(_naive(args)))
+    report("timer_wheel.wheel", asyncio.run(_wheel(args)))
+
+
+if __name__ == "__main__":
+    main()
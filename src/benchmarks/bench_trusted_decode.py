@@ -0,0 +1,82 @@
+# src/benchmarks/bench_trusted_decode.py
+
+"""Decoding with trusted constructors vs. re-validating every decoded value.
+
+Run from `src/`:
+    python -m benchmarks.bench_trusted_decode
+
+The "validated" path rebuilds each decoded value through its public
+constructor, which is what decoders did before `_trusted` existed. Payloads
+are string-heavy: handshakes and a player-list-sized run of names and UUIDs.
+"""
+
+import argparse
+import uuid
+
+from codec.data_types.primitives.string import String
+from codec.data_types.primitives.uuid import UUID
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.handshaking.serverbound.intention import Intention
+from benchmarks._harness import per_call_us, report
+
+
+def _validated_string(data: bytes, offset: int):
+    """Decode a String, re-validating like the public constructors do."""
+    length, size = VarInt.from_bytes(data, offset)
+    VarInt(length.value)
+    string, consumed = String.from_bytes(data, offset)
+    return String(string.value), consumed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    entries = b"".join(
+        bytes(String(f"Player_{i:05d}_éè")) + uuid.uuid4().bytes
+        + bytes(String(f"textures/skin/{i:032x}" * 8))
+        for i in range(args.entries)
+    )
+    handshake = Intention(773, "play.example.com", 25565, 2).encode_body()[1:]
+
+    def trusted_entries():
+        offset = 0
+        while offset < len(entries):
+            _, size = String.from_bytes(entries, offset)
+            offset += size
+            UUID.decode(entries, offset)
+            offset += 16
+            _, size = String.from_bytes(entries, offset)
+            offset += size
+
+    def validated_entries():
+        offset = 0
+        while offset < len(entries):
+            _, size = _validated_string(entries, offset)
+            offset += size
+            decoded, _ = UUID.decode(entries, offset)
+            UUID(decoded.value)
+            offset += 16
+            _, size = _validated_string(entries, offset)
+            offset += size
+
+    def trusted_handshakes():
+        for _ in range(100):
+            Intention.from_bytes(handshake)
+
+    report(
+        "trusted_decode",
+        {
+            "entries": args.entries,
+            "payload_bytes": len(entries),
+            "validated_entries_us": per_call_us(validated_entries, args.number),
+            "trusted_entries_us": per_call_us(trusted_entries, args.number),
+            "handshake_x100_us": per_call_us(trusted_handshakes, args.number),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# src/benchmarks/compare.py
+
+"""Compare two benchmark result files and fail on regressions.
+
+Run from `src/`:
+    MCPROTOCOL_BENCH_RESULTS=base.jsonl python -m benchmarks.bench_allocations
+    MCPROTOCOL_BENCH_RESULTS=new.jsonl python -m benchmarks.bench_allocations
+    python -m benchmarks.compare base.jsonl new.jsonl
+
+Only "lower is better" metrics are compared: names containing one of the
+`--match` substrings (allocation bytes and blocks by default). The exit
+status is 1 if any of them grew by more than `--tolerance`.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict
+
+
+def _load(path: str) -> Dict[str, float]:
+    """Read a results file into `"benchmark:metric" -> value` (last run wins)."""
+    results = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                for name, value in entry["metrics"].items():
+                    if isinstance(value, (int, float)):
+                        results[f"{entry['benchmark']}:{name}"] = value
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed relative growth")
+    parser.add_argument("--match", nargs="+", default=["bytes", "blocks"])
+    args = parser.parse_args()
+
+    baseline = _load(args.baseline)
+    current = _load(args.current)
+    regressions = 0
+    for name in sorted(baseline.keys() & current.keys()):
+        if not any(pattern in name for pattern in args.match):
+            continue
+        before, after = baseline[name], current[name]
+        if after > before * (1 + args.tolerance) and after - before > 1:
+            regressions += 1
+            print(f"REGRESSION {name}: {before:,.3f} -> {after:,.3f}")
+    print(f"{regressions} regression(s)")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+# src/benchmarks/load_generator.py
+
+"""Multi-process synthetic client load generator.
+
+Run from `src/` against the built-in loopback stand-in server:
+    python -m benchmarks.load_generator --workers 4 --concurrency 1000 --flow status
+
+or against a real server or proxy:
+    python -m benchmarks.load_generator HOST PORT --flow login
+
+Each worker process runs `--concurrency` asyncio clients that repeat one
+scripted flow on fresh connections until `--duration` elapses:
+
+- `handshake`: `Intention` only, then close;
+- `status`: handshake, Status Request/Response, Ping/Pong;
+- `login`: handshake with the Login intent and Login Start, until the
+  first clientbound frame (the stand-in answers with a Login Disconnect).
+
+Workers publish their counters and latency histograms into their own slot
+of a shared memory block; the parent merges the slots for progress lines
+and the final report (connection rate, packets/sec, latency percentiles).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+import uuid
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from codec.data_types.primitives.string import String
+from codec.data_types.primitives.uuid import UUID
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.constants import _DEFAULT_PROTOCOL_VERSION
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.packet import Packet
+from codec.packets.registry import PacketRegistry
+from codec.packets.status.serverbound.ping_request import PingRequest
+from codec.packets.status.serverbound.status_request import StatusRequest
+from network.connection_manager import Connection, ConnectionManager
+from network.histogram import LatencyHistogram
+from benchmarks._harness import raise_fd_limit, report
+
+_STATUS = {
+    "version": {"name": "1.21.10", "protocol": _DEFAULT_PROTOCOL_VERSION},
+    "players": {"max": 100, "online": 0},
+    "description": {"text": "load generator stand-in"},
+}
+
+# Login Start and Login Disconnect are listed in the registry but their
+# classes are not implemented yet, so their bodies are encoded here
+_LOGIN_START_ID = "0x00"
+_LOGIN_DISCONNECT = Packet.frame(
+    bytes(VarInt(0x00)) + bytes(String(json.dumps({"text": "load generator stand-in"})))
+)
+
+# Per-worker slot: these counters, then the connect and flow histograms
+_COUNTERS = ("connections", "flows", "failures", "packets_sent", "packets_received")
+
+
+class _StandInServer(ConnectionManager):
+    """`ConnectionManager` answering Status and ending Login with a disconnect."""
+
+    async def _process(self, connection: Connection, frame: bytes) -> None:
+        if connection.state == "Login":
+            connection.write(_LOGIN_DISCONNECT)
+            await connection.drain()
+            connection.close()
+            return
+        await super()._process(connection, frame)
+
+
+class _WorkerStats:
+    """Counters and histograms of one worker, published to shared memory."""
+
+    def __init__(self):
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        self.connect = LatencyHistogram()
+        self.flow = LatencyHistogram()
+
+    @staticmethod
+    def word_count() -> int:
+        """Size of one worker slot in 64-bit words."""
+        return len(_COUNTERS) + 2 * LatencyHistogram().word_count
+
+    def store(self, words: memoryview) -> None:
+        """Write the stats into a worker slot."""
+        for index, name in enumerate(_COUNTERS):
+            words[index] = self.counters[name]
+        offset = len(_COUNTERS)
+        self.connect.store(words[offset:])
+        self.flow.store(words[offset + self.connect.word_count :])
+
+    def load(self, words: memoryview) -> None:
+        """Read the stats from a worker slot."""
+        for index, name in enumerate(_COUNTERS):
+            self.counters[name] = words[index]
+        offset = len(_COUNTERS)
+        self.connect.load(words[offset:])
+        self.flow.load(words[offset + self.connect.word_count :])
+
+
+async def _handshake(connection: Connection, host: str, port: int, index: int) -> Tuple[int, int]:
+    connection.send_packet(Intention(_DEFAULT_PROTOCOL_VERSION, host, port, 1))
+    await connection.drain()
+    return 1, 0
+
+
+async def _status(connection: Connection, host: str, port: int, index: int) -> Tuple[int, int]:
+    connection.send_packet(Intention(_DEFAULT_PROTOCOL_VERSION, host, port, 1))
+    connection.set_state("Status")
+    connection.send_packet(StatusRequest())
+    await connection.read()
+    connection.send_packet(PingRequest(index))
+    await connection.read()
+    return 3, 2
+
+
+async def _login(connection: Connection, host: str, port: int, index: int) -> Tuple[int, int]:
+    connection.send_packet(Intention(_DEFAULT_PROTOCOL_VERSION, host, port, 2))
+    connection.set_state("Login")
+    if connection.packets.path("Login", "serverbound", _LOGIN_START_ID) is None:
+        raise ValueError("Login Start is not in the registry")
+    name = f"load{index % 10**8:08d}"
+    body = bytes(VarInt(int(_LOGIN_START_ID, 16))) + bytes(String(name)) + bytes(
+        UUID(uuid.uuid3(uuid.NAMESPACE_OID, name))
+    )
+    connection.write(Packet.frame(body, connection.compression_threshold))
+    await connection.drain()
+    await connection.read_frame()
+    return 2, 1
+
+
+_FLOWS = {"handshake": _handshake, "status": _status, "login": _login}
+
+
+async def _client(
+    flow: str,
+    host: str,
+    port: int,
+    deadline: float,
+    timeout: float,
+    stats: _WorkerStats,
+    registry: PacketRegistry,
+    first_index: int,
+) -> None:
+    """Repeat `flow` on fresh connections until `deadline`."""
+    run = _FLOWS[flow]
+    counters = stats.counters
+    index = first_index
+    while time.monotonic() < deadline:
+        index += 1
+        start = time.perf_counter_ns()
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError):
+            counters["failures"] += 1
+            await asyncio.sleep(0.05)
+            continue
+        stats.connect.record(time.perf_counter_ns() - start)
+        counters["connections"] += 1
+
+        connection = Connection(reader, writer, role="client", registry=registry)
+        try:
+            sent, received = await asyncio.wait_for(run(connection, host, port, index), timeout)
+        except (ConnectionError, ValueError, asyncio.TimeoutError):
+            counters["failures"] += 1
+        else:
+            stats.flow.record(time.perf_counter_ns() - start)
+            counters["flows"] += 1
+            counters["packets_sent"] += sent
+            counters["packets_received"] += received
+        finally:
+            connection.close()
+
+
+async def _run_worker(
+    words: memoryview, flow: str, host: str, port: int, concurrency: int,
+    duration: float, timeout: float, publish_interval: float, worker: int,
+) -> None:
+    stats = _WorkerStats()
+    registry = PacketRegistry()
+    deadline = time.monotonic() + duration
+    clients = asyncio.gather(
+        *(
+            _client(flow, host, port, deadline, timeout, stats, registry, (worker * concurrency + i) << 32)
+            for i in range(concurrency)
+        )
+    )
+    while not clients.done():
+        await asyncio.wait([clients], timeout=publish_interval)
+        stats.store(words)
+    await clients
+
+
+def _worker_main(shm_name: str, worker: int, args: argparse.Namespace, port: int) -> None:
+    """Entry point of a worker process."""
+    raise_fd_limit(args.concurrency + 256)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        slot = _WorkerStats.word_count()
+        words = shm.buf.cast("Q")[worker * slot : (worker + 1) * slot]
+        asyncio.run(
+            _run_worker(
+                words, args.flow, args.host, port, args.concurrency,
+                args.duration, args.timeout, args.publish_interval, worker,
+            )
+        )
+        words.release()
+    finally:
+        shm.close()
+
+
+def _server_main(port_pipe, backlog: int) -> None:
+    """Entry point of the stand-in server process."""
+    raise_fd_limit(65536)
+
+    async def serve() -> None:
+        server = _StandInServer("127.0.0.1", 0, status_provider=lambda: _STATUS, backlog=backlog)
+        await server.start()
+        port_pipe.send(server.port)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def _aggregate(shm: shared_memory.SharedMemory, workers: int) -> _WorkerStats:
+    """Merge every worker slot into one `_WorkerStats`."""
+    total, slot = _WorkerStats(), _WorkerStats()
+    size = _WorkerStats.word_count()
+    words = shm.buf.cast("Q")
+    for worker in range(workers):
+        slot.load(words[worker * size : (worker + 1) * size])
+        for name in _COUNTERS:
+            total.counters[name] += slot.counters[name]
+        total.connect.merge(slot.connect)
+        total.flow.merge(slot.flow)
+    words.release()
+    return total
+
+
+def generate_load(args: argparse.Namespace, port: int, progress: bool = True) -> dict:
+    """
+    Run the worker processes against `args.host:port` and aggregate their stats.
+
+    Args:
+        args: Parsed options (`flow`, `host`, `workers`, `concurrency`,
+            `duration`, `timeout`, `publish_interval`).
+        port: Target port.
+        progress: Print aggregated counters to stderr every second.
+
+    Returns:
+        dict: Report metrics.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=8 * _WorkerStats.word_count() * args.workers)
+    try:
+        processes: List[multiprocessing.Process] = [
+            multiprocessing.Process(target=_worker_main, args=(shm.name, worker, args, port))
+            for worker in range(args.workers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        while any(process.is_alive() for process in processes):
+            time.sleep(1.0)
+            if not progress:
+                continue
+            counters = _aggregate(shm, args.workers).counters
+            elapsed = time.perf_counter() - start
+            print(
+                f"{elapsed:6.1f}s  connections {counters['connections']:>9,}  "
+                f"flows {counters['flows']:>9,}  failures {counters['failures']:>7,}",
+                file=sys.stderr,
+            )
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        total = _aggregate(shm, args.workers)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    counters = total.counters
+    metrics = {
+        "flow": args.flow,
+        "workers": args.workers,
+        "concurrency": args.workers * args.concurrency,
+        **counters,
+        "connections_per_s": counters["connections"] / elapsed,
+        "flows_per_s": counters["flows"] / elapsed,
+        "packets_per_s": (counters["packets_sent"] + counters["packets_received"]) / elapsed,
+    }
+    metrics.update({f"connect_{k}_ms": v for k, v in total.connect.summary().items() if k != "count"})
+    metrics.update({f"flow_{k}_ms": v for k, v in total.flow.summary().items() if k != "count"})
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("host", nargs="?", help="target; a loopback stand-in is started when omitted")
+    parser.add_argument("port", type=int, nargs="?", default=25565)
+    parser.add_argument("--flow", choices=sorted(_FLOWS), default="status")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--concurrency", type=int, default=1000, help="clients per worker")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--publish-interval", type=float, default=0.5)
+    parser.add_argument("--backlog", type=int, default=4096)
+    args = parser.parse_args()
+
+    server: Optional[multiprocessing.Process] = None
+    port = args.port
+    if args.host is None:
+        args.host = "127.0.0.1"
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        server = multiprocessing.Process(target=_server_main, args=(sender, args.backlog), daemon=True)
+        server.start()
+        port = receiver.recv()
+
+    try:
+        metrics = generate_load(args, port)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    report(f"load_generator.{args.flow}", metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+# src/codec/data_types/complex/bitset.py
+
+from array import array
+import sys
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; words are copied into array('Q') instead
+    np = None
+
+from ..primitives.varint import VarInt
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class BitSet:
+    """Represents a length-prefixed BitSet.
+
+    Encoding:
+        [VarInt number of longs][big-endian Longs]
+        Bit `i` is bit `i % 64` of long `i // 64`.
+
+    Decoding keeps the long array as is: with NumPy `words` is a zero-copy
+    `>u8` view of the packet buffer, otherwise a native `array('Q')` copy.
+    The integer form, used for bit tests and popcount, is built on first use.
+
+    Attributes:
+        words: The longs, least significant first.
+    """
+
+    __slots__ = ("words", "_value")
+
+    def __init__(self, words=()):
+        """
+        Wrap a sequence of 64-bit words.
+
+        Args:
+            words: Unsigned 64-bit words, least significant first.
+        """
+        if np is not None and isinstance(words, np.ndarray):
+            self.words = words.astype(">u8", copy=False)
+        else:
+            self.words = array("Q", words)
+        self._value = None
+
+    @classmethod
+    def from_int(cls, value: int) -> "BitSet":
+        """Build a BitSet whose bit `i` is bit `i` of `value`."""
+        if value < 0:
+            raise ValueError("BitSet value must be non-negative")
+        count = -(-value.bit_length() // 64)
+        bitset = cls(((value >> (64 * i)) & 0xFFFFFFFFFFFFFFFF) for i in range(count))
+        bitset._value = value
+        return bitset
+
+    @classmethod
+    def from_indices(cls, indices: Iterable[int]) -> "BitSet":
+        """Build a BitSet with the given bits set."""
+        value = 0
+        for index in indices:
+            value |= 1 << index
+        return cls.from_int(value)
+
+    def __int__(self) -> int:
+        if self._value is None:
+            if np is not None and isinstance(self.words, np.ndarray):
+                raw = self.words.astype("<u8").tobytes()
+            else:
+                raw = self.words.tobytes() if _LITTLE_ENDIAN else _byteswapped(self.words)
+            self._value = int.from_bytes(raw, "little")
+        return self._value
+
+    def __contains__(self, index: int) -> bool:
+        word = index >> 6
+        return 0 <= word < len(self.words) and bool((int(self.words[word]) >> (index & 63)) & 1)
+
+    def __len__(self) -> int:
+        """Return the capacity in bits (64 per word)."""
+        return 64 * len(self.words)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield the indices of set bits in ascending order."""
+        if np is not None and isinstance(self.words, np.ndarray):
+            # Per word, reverse the big-endian bytes so bits come out in index order
+            raw = self.words.view(np.uint8).reshape(-1, 8)[:, ::-1]
+            yield from np.flatnonzero(np.unpackbits(raw, axis=None, bitorder="little")).tolist()
+            return
+        value = int(self)
+        while value:
+            low = value & -value
+            yield low.bit_length() - 1
+            value ^= low
+
+    def popcount(self) -> int:
+        """Return the number of set bits."""
+        return int(self).bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return int(self) == int(other)
+
+    def __hash__(self) -> int:
+        return hash(int(self))
+
+    def __repr__(self) -> str:
+        return f"<BitSet words={len(self.words)} set={self.popcount()}>"
+
+    def __bytes__(self) -> bytes:
+        """Serialize the BitSet.
+
+        Returns:
+            bytes: VarInt word count followed by the big-endian words.
+        """
+        if np is not None and isinstance(self.words, np.ndarray):
+            raw = self.words.astype(">u8").tobytes()
+        else:
+            raw = _byteswapped(self.words) if _LITTLE_ENDIAN else self.words.tobytes()
+        return bytes(VarInt(len(self.words))) + raw
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple["BitSet", int]:
+        """Decode a BitSet starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the BitSet.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[BitSet, int]: Decoded BitSet and bytes consumed.
+
+        Raises:
+            ValueError: If the long array is truncated.
+        """
+        length, size = VarInt.from_bytes(data, offset)
+        start = offset + size
+        end = start + 8 * length.value
+        if len(data) < end:
+            raise ValueError(f"Not enough bytes to unpack BitSet of {length.value} longs")
+        if np is not None:
+            words = np.frombuffer(data, dtype=">u8", count=length.value, offset=start)
+        else:
+            words = array("Q", bytes(data[start:end]))
+            if _LITTLE_ENDIAN:
+                words.byteswap()
+        return cls(words), end - offset
+
+
+class FixedBitSet:
+    """Represents a Fixed BitSet of `size` bits.
+
+    Encoding:
+        ceil(size / 8) bytes; bit `i` is bit `i % 8` of byte `i // 8`.
+
+    Attributes:
+        size (int): Number of bits.
+        value (int): Bits as an integer (bit `i` is bit `i` of the set).
+    """
+
+    __slots__ = ("size", "value")
+
+    def __init__(self, size: int, value: int = 0):
+        """
+        Initialize a Fixed BitSet.
+
+        Args:
+            size: Number of bits.
+            value: Initial bits.
+
+        Raises:
+            ValueError: If `value` has bits at or beyond `size`.
+        """
+        if value < 0 or value.bit_length() > size:
+            raise ValueError(f"FixedBitSet value does not fit in {size} bits")
+        self.size = size
+        self.value = value
+
+    @classmethod
+    def from_indices(cls, size: int, indices: Iterable[int]) -> "FixedBitSet":
+        """Build a Fixed BitSet with the given bits set."""
+        value = 0
+        for index in indices:
+            value |= 1 << index
+        return cls(size, value)
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < self.size and bool((self.value >> index) & 1)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield the indices of set bits in ascending order."""
+        value = self.value
+        while value:
+            low = value & -value
+            yield low.bit_length() - 1
+            value ^= low
+
+    def popcount(self) -> int:
+        """Return the number of set bits."""
+        return self.value.bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FixedBitSet):
+            return NotImplemented
+        return (self.size, self.value) == (other.size, other.value)
+
+    def __hash__(self) -> int:
+        return hash((self.size, self.value))
+
+    def __repr__(self) -> str:
+        return f"<FixedBitSet size={self.size} value={self.value:#x}>"
+
+    def __bytes__(self) -> bytes:
+        """Serialize the Fixed BitSet.
+
+        Returns:
+            bytes: ceil(size / 8) bytes.
+        """
+        return self.value.to_bytes(-(-self.size // 8), "little")
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0, size: int = 0) -> tuple["FixedBitSet", int]:
+        """Decode a Fixed BitSet of `size` bits starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the bits.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+            size (int): Number of bits.
+
+        Returns:
+            tuple[FixedBitSet, int]: Decoded set and bytes consumed.
+
+        Raises:
+            ValueError: If the data is truncated or has bits beyond `size`.
+        """
+        length = -(-size // 8)
+        if len(data) - offset < length:
+            raise ValueError(f"Not enough bytes to unpack FixedBitSet of {size} bits")
+        return cls(size, int.from_bytes(data[offset : offset + length], "little")), length
+
+
+def _byteswapped(words: array) -> bytes:
+    """Return the words' bytes with each word byte-swapped."""
+    swapped = array("Q", words)
+    swapped.byteswap()
+    return swapped.tobytes()
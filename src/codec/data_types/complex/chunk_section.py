@@ -0,0 +1,300 @@
+# src/codec/data_types/complex/chunk_section.py
+
+from array import array
+from dataclasses import dataclass
+import struct
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; a pure-Python bit unpacker is used instead
+    np = None
+
+from ..primitives.varint import VarInt
+
+_SHORT = struct.Struct(">h")
+
+
+@dataclass(slots=True, frozen=True)
+class ContainerKind:
+    """Layout parameters of a paletted container.
+
+    Attributes:
+        size (int): Number of entries (4096 block states, 64 biomes).
+        min_indirect_bits (int): Smallest bits per entry used with a palette.
+        max_indirect_bits (int): Largest bits per entry used with a palette.
+        direct_bits (int): Bits per entry of the direct (global) format,
+            ceil(log2(registry size)).
+    """
+
+    size: int
+    min_indirect_bits: int
+    max_indirect_bits: int
+    direct_bits: int
+
+
+BLOCK_STATES = ContainerKind(size=4096, min_indirect_bits=4, max_indirect_bits=8, direct_bits=15)
+BIOMES = ContainerKind(size=64, min_indirect_bits=1, max_indirect_bits=3, direct_bits=6)
+
+
+def _long_count(size: int, bits: int) -> int:
+    """Return the number of longs holding `size` entries (entries never span longs)."""
+    per_long = 64 // bits
+    return -(-size // per_long)
+
+
+def _unpack_numpy(data, offset: int, size: int, bits: int):
+    """Unpack bit-packed entries with vectorized shifts and masks."""
+    per_long = 64 // bits
+    longs = np.frombuffer(data, dtype=">u8", count=_long_count(size, bits), offset=offset)
+    shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(bits)
+    entries = (longs[:, None] >> shifts) & np.uint64((1 << bits) - 1)
+    return entries.reshape(-1)[:size].astype(np.uint16)
+
+
+def _unpack_python(data, offset: int, size: int, bits: int) -> array:
+    """Unpack bit-packed entries one long at a time."""
+    per_long = 64 // bits
+    mask = (1 << bits) - 1
+    count = _long_count(size, bits)
+    entries = array("H")
+    for long in struct.unpack_from(f">{count}Q", data, offset):
+        entries.extend((long >> (bits * i)) & mask for i in range(per_long))
+    del entries[size:]
+    return entries
+
+
+def _pack_numpy(indices, size: int, bits: int) -> bytes:
+    """Pack entries into big-endian longs with vectorized shifts."""
+    per_long = 64 // bits
+    count = _long_count(size, bits)
+    padded = np.zeros(count * per_long, dtype=np.uint64)
+    padded[:size] = indices
+    shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(bits)
+    # Entries occupy disjoint bits, so summing is the same as OR-ing
+    longs = (padded.reshape(count, per_long) << shifts).sum(axis=1, dtype=np.uint64)
+    return longs.astype(">u8").tobytes()
+
+
+def _pack_python(indices: Sequence[int], size: int, bits: int) -> bytes:
+    """Pack entries into big-endian longs one long at a time."""
+    per_long = 64 // bits
+    longs = []
+    for start in range(0, size, per_long):
+        long = 0
+        for i, index in enumerate(indices[start : start + per_long]):
+            long |= int(index) << (bits * i)
+        longs.append(long)
+    return struct.pack(f">{len(longs)}Q", *longs)
+
+
+_unpack = _unpack_numpy if np is not None else _unpack_python
+_pack = _pack_numpy if np is not None else _pack_python
+
+
+def _lookup(palette: Tuple[int, ...], indices):
+    """Map palette indices to global IDs."""
+    if np is not None:
+        return np.asarray(palette, dtype=np.uint16)[indices]
+    return array("H", [palette[index] for index in indices])
+
+
+@dataclass(slots=True, frozen=True)
+class PalettedContainer:
+    """Represents a paletted container (block states or biomes of a chunk section).
+
+    Encoding (1.21.5+ layout, no data array length):
+        [Unsigned Byte bits per entry]
+        [palette: single VarInt | VarInt-prefixed VarInts | nothing (direct)]
+        [ceil(size / (64 // bits)) big-endian Longs, entries never spanning longs]
+
+    Formats:
+        - bits == 0: single-valued; the palette holds the one ID, no data.
+        - indirect: the data stores indices into the palette.
+        - direct: the data stores global IDs; the palette is empty.
+
+    Attributes:
+        values: Global IDs, one per entry, as a uint16 NumPy array (or
+            `array('H')` without NumPy).
+        bits (int): Bits per entry on the wire.
+        palette (tuple[int, ...]): Palette; empty for the direct format.
+    """
+
+    values: object
+    bits: int
+    palette: Tuple[int, ...]
+
+    @classmethod
+    def from_values(cls, values: Sequence[int], kind: ContainerKind = BLOCK_STATES) -> "PalettedContainer":
+        """Build a container choosing the smallest wire format for `values`.
+
+        Args:
+            values (Sequence[int]): Global IDs, `kind.size` of them.
+            kind (ContainerKind): Block states or biomes layout.
+
+        Returns:
+            PalettedContainer: Container ready to encode.
+
+        Raises:
+            ValueError: If the number of values does not match `kind.size`.
+        """
+        if len(values) != kind.size:
+            raise ValueError(f"Expected {kind.size} values, got {len(values)}")
+        if np is not None:
+            values = np.asarray(values, dtype=np.uint16)
+            palette = tuple(int(v) for v in np.unique(values))
+        else:
+            values = array("H", values)
+            palette = tuple(sorted(set(values)))
+
+        if len(palette) == 1:
+            return cls(values, 0, palette)
+        bits = max((len(palette) - 1).bit_length(), kind.min_indirect_bits)
+        if bits > kind.max_indirect_bits:
+            return cls(values, kind.direct_bits, ())
+        return cls(values, bits, palette)
+
+    def __bytes__(self) -> bytes:
+        """Serialize the container.
+
+        Returns:
+            bytes: Bits per entry, palette and packed data.
+        """
+        if self.bits == 0:
+            return b"\x00" + bytes(VarInt(self.palette[0]))
+
+        size = len(self.values)
+        if not self.palette:
+            return bytes((self.bits,)) + _pack(self.values, size, self.bits)
+
+        if np is not None:
+            lut = np.zeros(max(self.palette) + 1, dtype=np.uint16)
+            lut[list(self.palette)] = np.arange(len(self.palette), dtype=np.uint16)
+            indices = lut[self.values]
+        else:
+            positions = {value: index for index, value in enumerate(self.palette)}
+            indices = [positions[value] for value in self.values]
+
+        header = bytearray((self.bits,))
+        header += bytes(VarInt(len(self.palette)))
+        for value in self.palette:
+            header += bytes(VarInt(value))
+        return bytes(header) + _pack(indices, size, self.bits)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, offset: int = 0, kind: ContainerKind = BLOCK_STATES
+    ) -> tuple["PalettedContainer", int]:
+        """Decode a container starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the container.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+            kind (ContainerKind): Block states or biomes layout.
+
+        Returns:
+            tuple[PalettedContainer, int]: Decoded container and bytes consumed.
+
+        Raises:
+            ValueError: If the data is truncated.
+        """
+        start = offset
+        if len(data) <= offset:
+            raise ValueError("Data too short for paletted container")
+        bits = data[offset]
+        offset += 1
+
+        if bits == 0:
+            value, size = VarInt.from_bytes(data, offset)
+            offset += size
+            if np is not None:
+                values = np.full(kind.size, value.value, dtype=np.uint16)
+            else:
+                values = array("H", [value.value]) * kind.size
+            return cls(values, 0, (value.value,)), offset - start
+
+        if bits <= kind.max_indirect_bits:
+            bits = max(bits, kind.min_indirect_bits)
+            length, size = VarInt.from_bytes(data, offset)
+            offset += size
+            palette = []
+            for _ in range(length.value):
+                value, size = VarInt.from_bytes(data, offset)
+                offset += size
+                palette.append(value.value)
+            palette = tuple(palette)
+        else:
+            bits = kind.direct_bits
+            palette = ()
+
+        data_size = _long_count(kind.size, bits) * 8
+        if len(data) < offset + data_size:
+            raise ValueError("Data too short for paletted container data array")
+        indices = _unpack(data, offset, kind.size, bits)
+        values = _lookup(palette, indices) if palette else indices
+        return cls(values, bits, palette), offset + data_size - start
+
+
+@dataclass(slots=True, frozen=True)
+class ChunkSection:
+    """Represents one 16x16x16 chunk section of Chunk Data.
+
+    Encoding:
+        [Short non-air block count][block states container][biomes container]
+
+    Attributes:
+        block_count (int): Number of non-air blocks.
+        block_states (PalettedContainer): 4096 block state IDs (YZX order).
+        biomes (PalettedContainer): 64 biome IDs (4x4x4).
+    """
+
+    block_count: int
+    block_states: PalettedContainer
+    biomes: PalettedContainer
+
+    def __bytes__(self) -> bytes:
+        """Serialize the section.
+
+        Returns:
+            bytes: Block count followed by both containers.
+        """
+        return _SHORT.pack(self.block_count) + bytes(self.block_states) + bytes(self.biomes)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple["ChunkSection", int]:
+        """Decode a section starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the section.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[ChunkSection, int]: Decoded section and bytes consumed.
+        """
+        if len(data) < offset + 2:
+            raise ValueError("Data too short for chunk section")
+        block_count = _SHORT.unpack_from(data, offset)[0]
+        block_states, states_size = PalettedContainer.from_bytes(data, offset + 2, BLOCK_STATES)
+        biomes, biomes_size = PalettedContainer.from_bytes(
+            data, offset + 2 + states_size, BIOMES
+        )
+        return cls(block_count, block_states, biomes), 2 + states_size + biomes_size
+
+    @classmethod
+    def decode_all(cls, data: bytes, count: int) -> List["ChunkSection"]:
+        """Decode the `count` consecutive sections of a chunk's Data field.
+
+        Args:
+            data (bytes): The Data byte array of a chunk packet.
+            count (int): Number of sections (world height / 16).
+
+        Returns:
+            list[ChunkSection]: Sections from the bottom of the world up.
+        """
+        sections = []
+        offset = 0
+        for _ in range(count):
+            section, size = cls.from_bytes(data, offset)
+            sections.append(section)
+            offset += size
+        return sections
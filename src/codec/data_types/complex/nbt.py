@@ -0,0 +1,561 @@
+# src/codec/data_types/complex/nbt.py
+
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; numeric arrays fall back to `array`
+    np = None
+
+from ..constants import _MIN_INT, _MAX_INT, _MAX_NBT_DEPTH
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+_UNSIGNED_SHORT = struct.Struct(">H")
+_INT = struct.Struct(">i")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# Fixed-width tags: tag -> (size, struct format, array typecode, NumPy dtype)
+_FIXED = {
+    TAG_BYTE: (1, ">b", "b", ">i1"),
+    TAG_SHORT: (2, ">h", "h", ">i2"),
+    TAG_INT: (4, ">i", "i", ">i4"),
+    TAG_LONG: (8, ">q", "q", ">i8"),
+    TAG_FLOAT: (4, ">f", "f", ">f4"),
+    TAG_DOUBLE: (8, ">d", "d", ">f8"),
+}
+_FIXED_SIZE = {tag: spec[0] for tag, spec in _FIXED.items()}
+_SCALAR = {tag: struct.Struct(spec[1]) for tag, spec in _FIXED.items()}
+
+# Array tags -> element tag
+_ARRAY_ELEMENT = {TAG_BYTE_ARRAY: TAG_BYTE, TAG_INT_ARRAY: TAG_INT, TAG_LONG_ARRAY: TAG_LONG}
+# Signed integer item size -> array tag used when encoding an `array` or
+# ndarray (by size, not typecode: "l" is 4 or 8 bytes depending on platform)
+_ARRAY_TAGS = {1: TAG_BYTE_ARRAY, 4: TAG_INT_ARRAY, 8: TAG_LONG_ARRAY}
+_SIGNED_TYPECODES = frozenset("bhilq")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _decode_mutf8(raw: Buffer) -> str:
+    """Decode Java modified UTF-8 (NUL as C0 80, supplementary chars as surrogate pairs)."""
+    raw = bytes(raw)
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+        return text.encode("utf-16-le", "surrogatepass").decode("utf-16-le")
+
+
+def _surrogate_pair(char: str) -> str:
+    """Split a supplementary character into its UTF-16 surrogate pair."""
+    code = ord(char) - 0x10000
+    return chr(0xD800 + (code >> 10)) + chr(0xDC00 + (code & 0x3FF))
+
+
+def _encode_mutf8(text: str) -> bytes:
+    """Encode a string as Java modified UTF-8."""
+    if text.isascii() and "\x00" not in text:
+        return text.encode("ascii")
+    if any(ord(char) > 0xFFFF for char in text):
+        text = "".join(_surrogate_pair(c) if ord(c) > 0xFFFF else c for c in text)
+    return text.encode("utf-8", "surrogatepass").replace(b"\x00", b"\xc0\x80")
+
+
+def _array_length(buf: Buffer, offset: int) -> int:
+    """Return the element count of an array tag payload, rejecting negatives."""
+    count = _INT.unpack_from(buf, offset)[0]
+    if count < 0:
+        raise ValueError(f"Negative NBT array length {count}")
+    return count
+
+
+def _skip(buf: Buffer, offset: int, tag: int, depth: int = 0) -> int:
+    """Return the offset just past the payload of `tag` starting at `offset`.
+
+    Iterative, so deep nesting cannot exhaust the Python stack; compounds
+    and lists nested more than `_MAX_NBT_DEPTH` levels deep (counting
+    `depth` enclosing levels) are rejected. A negative list length means
+    an empty list, as in vanilla.
+    """
+    size = _FIXED_SIZE.get(tag)
+    if size is not None:
+        return offset + size
+    if tag == TAG_STRING:
+        return offset + 2 + _UNSIGNED_SHORT.unpack_from(buf, offset)[0]
+
+    # Open containers: None for a compound, [element tag, elements left] for a list
+    stack: List[Optional[list]] = []
+    while True:
+        size = _FIXED_SIZE.get(tag)
+        if size is not None:
+            offset += size
+        elif tag == TAG_STRING:
+            offset += 2 + _UNSIGNED_SHORT.unpack_from(buf, offset)[0]
+        elif tag == TAG_COMPOUND or tag == TAG_LIST:
+            if depth + len(stack) >= _MAX_NBT_DEPTH:
+                raise ValueError(f"NBT nested deeper than {_MAX_NBT_DEPTH} levels")
+            if tag == TAG_COMPOUND:
+                stack.append(None)
+            else:
+                element = buf[offset]
+                count = _INT.unpack_from(buf, offset + 1)[0]
+                offset += 5
+                if count > 0:
+                    size = _FIXED_SIZE.get(element)
+                    if size is not None:
+                        offset += count * size
+                    else:
+                        stack.append([element, count])
+        elif tag in _ARRAY_ELEMENT:
+            offset += 4 + _array_length(buf, offset) * _FIXED_SIZE[_ARRAY_ELEMENT[tag]]
+        else:
+            raise ValueError(f"Unknown NBT tag type {tag}")
+
+        # Move to the next payload of the innermost open container
+        while stack:
+            top = stack[-1]
+            if top is None:
+                tag = buf[offset]
+                if tag == TAG_END:
+                    offset += 1
+                    stack.pop()
+                    continue
+                offset += 3 + _UNSIGNED_SHORT.unpack_from(buf, offset + 1)[0]
+                break
+            if top[1]:
+                top[1] -= 1
+                tag = top[0]
+                break
+            stack.pop()
+        else:
+            return offset
+
+
+def _scan_compound(buf: Buffer, offset: int, index: Optional[dict]) -> int:
+    """Skip a compound payload, optionally recording `name -> (tag, offset)`."""
+    while True:
+        tag = buf[offset]
+        if tag == TAG_END:
+            return offset + 1
+        name_length = _UNSIGNED_SHORT.unpack_from(buf, offset + 1)[0]
+        name_start = offset + 3
+        offset = name_start + name_length
+        if index is not None:
+            index[_decode_mutf8(buf[name_start:offset])] = (tag, offset)
+        offset = _skip(buf, offset, tag, 1)
+
+
+def _typed(buf: Buffer, offset: int, tag: int, count: int):
+    """Return `count` fixed-width elements as a NumPy view or an `array` copy."""
+    size, _, typecode, dtype = _FIXED[tag]
+    if np is not None:
+        return np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+    values = array(typecode)
+    values.frombytes(buf[offset : offset + size * count])
+    if _LITTLE_ENDIAN and size > 1:
+        values.byteswap()
+    return values
+
+
+def _pack_fixed(values: Any, tag: int) -> bytes:
+    """Return `values` packed as big-endian elements of fixed-width `tag`."""
+    _, _, typecode, dtype = _FIXED[tag]
+    if np is not None:
+        return np.asarray(values, dtype=dtype).tobytes()
+    packed = array(typecode, values)
+    if _LITTLE_ENDIAN and packed.itemsize > 1:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _decode(buf: Buffer, offset: int, tag: int) -> Any:
+    """Decode the payload of `tag` at `offset`; containers are returned lazily."""
+    scalar = _SCALAR.get(tag)
+    if scalar is not None:
+        return scalar.unpack_from(buf, offset)[0]
+    if tag == TAG_STRING:
+        length = _UNSIGNED_SHORT.unpack_from(buf, offset)[0]
+        return _decode_mutf8(buf[offset + 2 : offset + 2 + length])
+    if tag == TAG_COMPOUND:
+        return NbtCompound(buf, offset)
+    if tag == TAG_LIST:
+        element = buf[offset]
+        count = max(_INT.unpack_from(buf, offset + 1)[0], 0)
+        if element in _FIXED:
+            return NbtTypedList(element, _typed(buf, offset + 5, element, count))
+        return NbtList(buf, offset, element, count)
+    if tag == TAG_BYTE_ARRAY:
+        count = _array_length(buf, offset)
+        return bytes(buf[offset + 4 : offset + 4 + count])
+    element = _ARRAY_ELEMENT.get(tag)
+    if element is not None:
+        return _typed(buf, offset + 4, element, _array_length(buf, offset))
+    raise ValueError(f"Unknown NBT tag type {tag}")
+
+
+class NbtCompound(Mapping):
+    """Lazily decoded NBT compound backed by the original buffer.
+
+    The name index (`name -> (tag, offset)`) is built on first access by
+    scanning tag headers and skipping payloads; a value is decoded only when
+    its key is read, so `nbt["a"]["b"]` touches just that path. Nested
+    compounds and lists are lazy in turn. Numeric lists decode to
+    `NbtTypedList` and array tags to NumPy views (or `array` copies without
+    NumPy).
+    """
+
+    __slots__ = ("_buf", "_start", "_end", "_index", "_cache")
+
+    def __init__(self, buf: Buffer, offset: int):
+        """
+        Wrap a compound payload.
+
+        Args:
+            buf: Buffer holding the payload.
+            offset: Offset of the first entry of the compound.
+        """
+        self._buf = buf
+        self._start = offset
+        self._end: Optional[int] = None
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        self._cache: Dict[str, Any] = {}
+
+    def _entries(self) -> Dict[str, Tuple[int, int]]:
+        """Return the name index, building it on first use."""
+        if self._index is None:
+            index: Dict[str, Tuple[int, int]] = {}
+            self._end = _scan_compound(self._buf, self._start, index)
+            self._index = index
+        return self._index
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        tag, offset = self._entries()[name]
+        value = self._cache[name] = _decode(self._buf, offset, tag)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NbtCompound):
+            return self.raw() == other.raw()
+        return NotImplemented
+
+    __hash__ = None
+
+    def tag_type(self, name: str) -> int:
+        """Return the tag type of entry `name` without decoding it."""
+        return self._entries()[name][0]
+
+    def raw(self) -> bytes:
+        """Return the original payload bytes of this compound."""
+        if self._end is None:
+            self._end = _scan_compound(self._buf, self._start, None)
+        return bytes(self._buf[self._start : self._end])
+
+    def to_python(self) -> dict:
+        """Decode the whole compound into plain dicts and lists."""
+        return {name: _to_python(self[name]) for name in self}
+
+    def __repr__(self) -> str:
+        return f"<NbtCompound keys={list(self._entries())}>"
+
+
+class NbtList(Sequence):
+    """Lazily decoded NBT list of variable-width elements (strings, compounds, lists)."""
+
+    __slots__ = ("_buf", "_start", "_element", "_count", "_offsets", "_end")
+
+    def __init__(self, buf: Buffer, offset: int, element: int, count: int):
+        """
+        Wrap a list payload.
+
+        Args:
+            buf: Buffer holding the payload.
+            offset: Offset of the list header (element tag byte).
+            element: Element tag type.
+            count: Number of elements.
+        """
+        self._buf = buf
+        self._start = offset
+        self._element = element
+        self._count = count
+        self._offsets: Optional[List[int]] = None
+        self._end: Optional[int] = None
+
+    @property
+    def element_type(self) -> int:
+        """Return the tag type of the elements."""
+        return self._element
+
+    def _element_offsets(self) -> List[int]:
+        """Return element offsets, scanning the list on first use."""
+        if self._offsets is None:
+            offsets = []
+            offset = self._start + 5
+            for _ in range(self._count):
+                offsets.append(offset)
+                offset = _skip(self._buf, offset, self._element)
+            self._offsets = offsets
+            self._end = offset
+        return self._offsets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return _decode(self._buf, self._element_offsets()[index], self._element)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NbtList):
+            return self.raw() == other.raw()
+        return NotImplemented
+
+    __hash__ = None
+
+    def raw(self) -> bytes:
+        """Return the original payload bytes (header included) of this list."""
+        if self._end is None:
+            self._element_offsets()
+        return bytes(self._buf[self._start : self._end])
+
+    def __repr__(self) -> str:
+        return f"<NbtList element_type={self._element} len={self._count}>"
+
+
+class NbtTypedList(Sequence):
+    """NBT list of fixed-width numbers (Byte, Short, Int, Long, Float or Double).
+
+    Keeps the element tag so the list re-encodes as the same TAG_LIST
+    rather than as an array tag. `values` is a NumPy view (an `array`
+    without NumPy) when decoded; any sequence of numbers when built by
+    hand, e.g. `NbtTypedList(TAG_FLOAT, [0.5, 1.0])` for a List<Float>.
+
+    Attributes:
+        element_type (int): Element tag type.
+        values: The elements.
+    """
+
+    __slots__ = ("element_type", "values")
+
+    def __init__(self, element_type: int, values: Any):
+        """
+        Wrap numeric list elements.
+
+        Args:
+            element_type: Fixed-width element tag (`TAG_BYTE` ... `TAG_DOUBLE`).
+            values: The elements.
+
+        Raises:
+            ValueError: If `element_type` is not a fixed-width numeric tag.
+        """
+        if element_type not in _FIXED:
+            raise ValueError(f"Not a fixed-width NBT tag type: {element_type}")
+        self.element_type = element_type
+        self.values = values
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NbtTypedList):
+            return self.element_type == other.element_type and self.tolist() == other.tolist()
+        return NotImplemented
+
+    __hash__ = None
+
+    def tolist(self) -> list:
+        """Return the elements as a plain list."""
+        return self.values.tolist() if hasattr(self.values, "tolist") else list(self.values)
+
+    def __repr__(self) -> str:
+        return f"<NbtTypedList element_type={self.element_type} len={len(self.values)}>"
+
+
+def _to_python(value: Any) -> Any:
+    """Materialize lazy containers and typed arrays."""
+    if isinstance(value, NbtCompound):
+        return value.to_python()
+    if isinstance(value, NbtList):
+        return [_to_python(item) for item in value]
+    if isinstance(value, NbtTypedList):
+        return value.tolist()
+    if isinstance(value, array) or (np is not None and isinstance(value, np.ndarray)):
+        return value.tolist()
+    return value
+
+
+def _encode(value: Any) -> Tuple[int, bytes]:
+    """Return `(tag, payload)` for a Python value, inferring the tag type."""
+    if isinstance(value, NbtCompound):
+        return TAG_COMPOUND, value.raw()
+    if isinstance(value, NbtList):
+        return TAG_LIST, value.raw()
+    if isinstance(value, NbtTypedList):
+        element = value.element_type
+        return TAG_LIST, bytes((element,)) + _INT.pack(len(value)) + _pack_fixed(value.values, element)
+    if isinstance(value, bool):
+        return TAG_BYTE, b"\x01" if value else b"\x00"
+    if isinstance(value, int):
+        if _MIN_INT <= value <= _MAX_INT:
+            return TAG_INT, _SCALAR[TAG_INT].pack(value)
+        return TAG_LONG, _SCALAR[TAG_LONG].pack(value)
+    if isinstance(value, float):
+        return TAG_DOUBLE, _SCALAR[TAG_DOUBLE].pack(value)
+    if isinstance(value, str):
+        encoded = _encode_mutf8(value)
+        return TAG_STRING, _UNSIGNED_SHORT.pack(len(encoded)) + encoded
+    if isinstance(value, (bytes, bytearray)):
+        return TAG_BYTE_ARRAY, _INT.pack(len(value)) + bytes(value)
+    if isinstance(value, Mapping):
+        parts = []
+        for name, item in value.items():
+            tag, payload = _encode(item)
+            encoded_name = _encode_mutf8(name)
+            parts.append(
+                bytes((tag,))
+                + _UNSIGNED_SHORT.pack(len(encoded_name))
+                + encoded_name
+                + payload
+            )
+        parts.append(b"\x00")
+        return TAG_COMPOUND, b"".join(parts)
+    if isinstance(value, array) or (np is not None and isinstance(value, np.ndarray)):
+        if isinstance(value, array):
+            signed = value.typecode in _SIGNED_TYPECODES
+        else:
+            signed = value.dtype.kind == "i"
+        tag = _ARRAY_TAGS.get(value.itemsize) if signed else None
+        if tag is None:
+            kind = value.typecode if isinstance(value, array) else value.dtype.str
+            raise TypeError(f"Unsupported array type for NBT: {kind!r}")
+        return tag, _INT.pack(len(value)) + _pack_fixed(value, _ARRAY_ELEMENT[tag])
+    if isinstance(value, (list, tuple)):
+        encoded = [_encode(item) for item in value]
+        element = encoded[0][0] if encoded else TAG_END
+        if any(tag != element for tag, _ in encoded):
+            raise TypeError("NBT list elements must all have the same tag type")
+        payload = b"".join(part for _, part in encoded)
+        return TAG_LIST, bytes((element,)) + _INT.pack(len(encoded)) + payload
+    raise TypeError(f"Cannot encode {type(value).__name__} as NBT")
+
+
+@dataclass(slots=True, frozen=True)
+class Nbt:
+    """Represents a network NBT value (Minecraft 1.20.2+).
+
+    Network NBT is a tag type byte followed by the payload; unlike on-disk
+    NBT the root compound has no name. Decoding is lazy: `from_bytes` only
+    scans tag lengths to find where the value ends, and containers decode
+    the entries that are actually read.
+
+    Encoding infers tag types from Python values (int -> Int or Long,
+    float -> Double, bytes -> Byte Array, int8/int32/int64 arrays ->
+    Byte/Int/Long Array); `NbtTypedList` encodes as a list of its element
+    tag. Unmodified decoded compounds and lists re-encode to their original
+    bytes and tags.
+
+    Attributes:
+        value (Any): Root value; `None` for an empty (TAG_End) root.
+    """
+
+    value: Any
+
+    def __bytes__(self) -> bytes:
+        """Serialize as network NBT.
+
+        Returns:
+            bytes: Tag type byte followed by the payload.
+        """
+        if self.value is None:
+            return bytes((TAG_END,))
+        tag, payload = _encode(self.value)
+        return bytes((tag,)) + payload
+
+    @classmethod
+    def from_bytes(cls, data: Buffer, offset: int = 0) -> tuple["Nbt", int]:
+        """Decode network NBT starting at `offset`.
+
+        Args:
+            data (bytes | bytearray | memoryview): Buffer containing the NBT.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[Nbt, int]: Decoded value and number of bytes consumed.
+
+        Raises:
+            ValueError: If the data is truncated, contains unknown tags or
+                negative array lengths, or nests compounds and lists more
+                than 512 levels deep.
+        """
+        try:
+            tag = data[offset]
+            if tag == TAG_END:
+                return cls(None), 1
+            if tag == TAG_COMPOUND:
+                # Build the root index during the length scan instead of rescanning later
+                value = NbtCompound(data, offset + 1)
+                value._entries()
+                end = value._end
+            else:
+                end = _skip(data, offset + 1, tag)
+                value = None
+        except (IndexError, struct.error) as exc:
+            raise ValueError("Truncated NBT data") from exc
+        if end > len(data):
+            raise ValueError("Truncated NBT data")
+        if value is None:
+            value = _decode(data, offset + 1, tag)
+        return cls(value), end - offset
+
+    @staticmethod
+    def skip(data: Buffer, offset: int = 0) -> int:
+        """Return the size of the network NBT value at `offset` without decoding it.
+
+        Args:
+            data (bytes | bytearray | memoryview): Buffer containing the NBT.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            int: Number of bytes the value occupies.
+        """
+        tag = data[offset]
+        if tag == TAG_END:
+            return 1
+        return _skip(data, offset + 1, tag) - offset
@@ -0,0 +1,132 @@
+# src/codec/data_types/complex/position_array.py
+
+from array import array
+import struct
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; positions are packed one at a time instead
+    np = None
+
+from ..primitives.position import Position
+
+
+class PositionArray:
+    """Many packed Positions stored as three coordinate columns.
+
+    Encoding: `len(self)` consecutive 8-byte Positions, without a length
+    prefix (packets prefix it themselves, usually with a VarInt).
+
+    With NumPy the columns are `int32` arrays and packing/unpacking is done
+    with vectorized shifts; without it they are `array('i')` and each
+    position goes through `Position.pack`/`Position.unpack`.
+
+    Attributes:
+        x, y, z: Coordinate columns of equal length.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        """
+        Wrap three coordinate columns.
+
+        Args:
+            x, y, z: Sequences of equal length.
+
+        Raises:
+            ValueError: If the lengths differ.
+        """
+        if not len(x) == len(y) == len(z):
+            raise ValueError("PositionArray columns must have the same length")
+        if np is not None:
+            self.x = np.asarray(x, dtype=np.int32)
+            self.y = np.asarray(y, dtype=np.int32)
+            self.z = np.asarray(z, dtype=np.int32)
+        else:
+            self.x, self.y, self.z = array("i", x), array("i", y), array("i", z)
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position]) -> "PositionArray":
+        """Build an array from Position instances (already validated)."""
+        positions = list(positions)
+        return cls(
+            [p.x for p in positions], [p.y for p in positions], [p.z for p in positions]
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> Position:
+        return Position(int(self.x[index]), int(self.y[index]), int(self.z[index]))
+
+    def __iter__(self) -> Iterator[Position]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PositionArray):
+            return NotImplemented
+        return bytes(self) == bytes(other)
+
+    def __repr__(self) -> str:
+        return f"<PositionArray len={len(self)}>"
+
+    def __bytes__(self) -> bytes:
+        """Serialize all positions, big-endian, back to back.
+
+        Returns:
+            bytes: `8 * len(self)` bytes.
+
+        Raises:
+            ValueError: If a coordinate does not fit its bit width.
+        """
+        if np is None:
+            packed = [Position(x, y, z).pack() for x, y, z in zip(self.x, self.y, self.z)]
+            return struct.pack(f">{len(packed)}q", *packed)
+
+        x, y, z = self.x, self.y, self.z
+        if len(x) and (
+            min(x.min(), z.min()) < -(1 << 25)
+            or max(x.max(), z.max()) >= 1 << 25
+            or y.min() < -(1 << 11)
+            or y.max() >= 1 << 11
+        ):
+            raise ValueError("PositionArray coordinate out of range")
+        packed = (
+            ((x.astype(np.uint64) & np.uint64(0x3FFFFFF)) << np.uint64(38))
+            | ((z.astype(np.uint64) & np.uint64(0x3FFFFFF)) << np.uint64(12))
+            | (y.astype(np.uint64) & np.uint64(0xFFF))
+        )
+        return packed.astype(">u8").tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0, count: int = 0) -> tuple["PositionArray", int]:
+        """Decode `count` consecutive Positions starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the positions.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+            count (int): Number of positions.
+
+        Returns:
+            tuple[PositionArray, int]: Decoded array and bytes consumed.
+
+        Raises:
+            ValueError: If fewer than `8 * count` bytes are available.
+        """
+        size = 8 * count
+        if len(data) - offset < size:
+            raise ValueError(f"Not enough bytes to unpack {count} Positions at offset {offset}")
+
+        if np is None:
+            positions = [Position.unpack(v) for v in struct.unpack_from(f">{count}q", data, offset)]
+            return cls.from_positions(positions), size
+
+        # Arithmetic right shifts on int64 sign-extend each field
+        packed = np.frombuffer(data, dtype=">i8", count=count, offset=offset).astype(np.int64)
+        x = packed >> 38
+        z = (packed << 26) >> 38
+        y = (packed << 52) >> 52
+        return cls(x, y, z), size
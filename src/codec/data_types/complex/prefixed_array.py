@@ -0,0 +1,158 @@
+# src/codec/data_types/complex/prefixed_array.py
+
+import struct
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fixed-width runs are unpacked with struct instead
+    np = None
+
+from ..primitives.boolean import Boolean
+from ..primitives.long import Long
+from ..primitives.position import Position
+from ..primitives.unsigned_short import UnsignedShort
+from ..primitives.varint import VarInt
+from .position_array import PositionArray
+
+# Fixed-width element types decoded as a single run: type -> struct format char
+_FIXED_FORMATS = {
+    Boolean: "?",
+    Long: "q",
+    UnsignedShort: "H",
+}
+
+# Element types with a dedicated bulk container
+_BULK_TYPES = {
+    Position: PositionArray,
+}
+
+
+class PrefixedArray:
+    """Represents a Prefixed Array of X: a VarInt count followed by that many X.
+
+    Subscript with the element type to get a concrete array type:
+    `PrefixedArray[Long]`, `PrefixedArray[String]`, ...
+
+    Fixed-width numeric elements are decoded in one call, to a NumPy view
+    (or a tuple of ints without NumPy), and `values` holds the raw numbers
+    instead of `Long`/`UnsignedShort`/`Boolean` instances. `Position`
+    elements decode to a `PositionArray`. Any other element type must
+    provide `from_bytes(data, offset) -> (element, size)` and is decoded one
+    element at a time into a list.
+
+    Attributes:
+        values: The elements.
+    """
+
+    element_type = None
+    _specialized: dict = {}
+
+    __slots__ = ("values",)
+
+    def __class_getitem__(cls, element_type: type) -> type:
+        specialized = cls._specialized.get(element_type)
+        if specialized is None:
+            specialized = type(
+                f"PrefixedArray[{element_type.__name__}]",
+                (cls,),
+                {"element_type": element_type, "__slots__": ()},
+            )
+            cls._specialized[element_type] = specialized
+        return specialized
+
+    def __init__(self, values: Sequence = ()):
+        """
+        Wrap the elements.
+
+        Args:
+            values: Elements; raw numbers for fixed-width numeric types.
+
+        Raises:
+            TypeError: If the array type has no element type.
+        """
+        if self.element_type is None:
+            raise TypeError("Use PrefixedArray[ElementType] to create an array")
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PrefixedArray):
+            return NotImplemented
+        return self.element_type is other.element_type and bytes(self) == bytes(other)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} len={len(self)}>"
+
+    def __bytes__(self) -> bytes:
+        """Serialize the count followed by the elements.
+
+        Returns:
+            bytes: The encoded array.
+        """
+        prefix = bytes(VarInt(len(self.values)))
+        fmt = _FIXED_FORMATS.get(self.element_type)
+        if fmt is not None:
+            if np is not None:
+                return prefix + np.asarray(self.values).astype(">" + fmt).tobytes()
+            return prefix + struct.pack(f">{len(self.values)}{fmt}", *self.values)
+
+        bulk = _BULK_TYPES.get(self.element_type)
+        if bulk is not None:
+            values = self.values if isinstance(self.values, bulk) else bulk.from_positions(self.values)
+            return prefix + bytes(values)
+
+        return prefix + b"".join(bytes(value) for value in self.values)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple["PrefixedArray", int]:
+        """Decode an array starting at `offset`.
+
+        Args:
+            data (bytes): Buffer containing the array.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[PrefixedArray, int]: Decoded array and bytes consumed.
+
+        Raises:
+            TypeError: If the array type has no element type.
+            ValueError: If the data is truncated.
+        """
+        if cls.element_type is None:
+            raise TypeError("Use PrefixedArray[ElementType] to decode an array")
+        length, size = VarInt.from_bytes(data, offset)
+        count = length.value
+        start = offset + size
+
+        fmt = _FIXED_FORMATS.get(cls.element_type)
+        if fmt is not None:
+            width = struct.calcsize(fmt)
+            if len(data) - start < count * width:
+                raise ValueError(f"Not enough bytes to unpack {count} {cls.element_type.__name__}")
+            if np is not None:
+                values = np.frombuffer(data, dtype=">" + fmt, count=count, offset=start)
+            else:
+                values = struct.unpack_from(f">{count}{fmt}", data, start)
+            return cls(values), size + count * width
+
+        bulk = _BULK_TYPES.get(cls.element_type)
+        if bulk is not None:
+            values, consumed = bulk.from_bytes(data, start, count)
+            return cls(values), size + consumed
+
+        values = []
+        position = start
+        for _ in range(count):
+            value, consumed = cls.element_type.from_bytes(data, position)
+            values.append(value)
+            position += consumed
+        return cls(values), position - offset
@@ -0,0 +1,287 @@
+# src/codec/data_types/complex/text_component.py
+
+from collections.abc import Mapping, Sequence
+import json
+import re
+from typing import Any, Optional, Union
+
+from ..constants import _MAX_JSON_TEXT_LENGTH
+from ..primitives.varint import VarInt
+from .nbt import Nbt, _to_python
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Keys rendered as the component's own content, in vanilla precedence order
+_CONTENT_KEYS = ("text", "", "keybind", "selector")
+# %s or %<n>$s in translation keys, plus the %% escape
+_FORMAT = re.compile(r"%(?:(\d+)\$)?([s%])")
+
+
+def _render(value: Any, parts: list) -> None:
+    """Append the plain-text pieces of a component value to `parts`.
+
+    Lenient like the vanilla client: malformed parts (a non-object score,
+    a scalar `extra`, nulls) render as their string form or not at all
+    instead of raising.
+    """
+    if isinstance(value, str):
+        parts.append(value)
+        return
+    if value is None:
+        return
+    if isinstance(value, Mapping):
+        for key in _CONTENT_KEYS:
+            if key in value:
+                parts.append(str(value[key]))
+                break
+        else:
+            if "translate" in value:
+                _render_translation(value, parts)
+            elif "score" in value:
+                score = value["score"]
+                parts.append(str(score.get("value", "")) if isinstance(score, Mapping) else str(score))
+            elif "nbt" in value:
+                parts.append(str(value["nbt"]))
+        _render(value.get("extra"), parts)
+        return
+    if isinstance(value, Sequence):
+        for child in value:
+            _render(child, parts)
+        return
+    parts.append(str(value))  # numbers and booleans in a list of components
+
+
+def _render_translation(value: Mapping, parts: list) -> None:
+    """Render a translatable component without a language file."""
+    template = value.get("fallback", value["translate"])
+    args = value.get("with", ())
+    if isinstance(args, (str, Mapping)) or not isinstance(args, Sequence):
+        args = (args,)  # a lone argument instead of a list
+    position = 0
+
+    def substitute(match: re.Match) -> str:
+        nonlocal position
+        if match.group(2) == "%":
+            return "%"
+        if match.group(1):
+            index = int(match.group(1)) - 1
+        else:
+            index, position = position, position + 1
+        if 0 <= index < len(args):
+            rendered: list = []
+            _render(args[index], rendered)
+            return "".join(rendered)
+        return ""
+
+    parts.append(_FORMAT.sub(substitute, str(template)))
+
+
+def _json_string(text: str) -> bytes:
+    """Encode JSON text as a String, enforcing the JSON Text Component limit."""
+    encoded = text.encode("utf-8")
+    # UTF-8 is never shorter than UTF-16 in code units, so only long texts need counting
+    if len(encoded) > _MAX_JSON_TEXT_LENGTH:
+        code_units = len(text.encode("utf-16-le")) >> 1
+        if code_units > _MAX_JSON_TEXT_LENGTH:
+            raise ValueError(
+                f"JSON text component too long: {code_units} UTF-16 code units "
+                f"(max {_MAX_JSON_TEXT_LENGTH})"
+            )
+    return bytes(VarInt._trusted(len(encoded))) + encoded
+
+
+def _nbt_value(value: Any) -> Any:
+    """Prepare a component value for NBT, whose lists must be homogeneous."""
+    if isinstance(value, Mapping):
+        return {key: _nbt_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_nbt_value(item) for item in value]
+        if len({type(item) for item in items}) > 1:
+            items = [item if isinstance(item, dict) else {"text": str(item)} for item in items]
+        return items
+    return value
+
+
+class TextComponent:
+    """Represents a text component in its network NBT or JSON form.
+
+    Encoding:
+        NBT form (Text Component): network NBT; a TAG_String for plain text,
+            a TAG_Compound for a component, a TAG_List for a list.
+        JSON form (JSON Text Component): a String holding JSON, at most
+            262144 characters.
+
+    Decoding only finds where the component ends and keeps its bytes.
+    `value` is parsed on first use (NBT containers stay lazy, so rendering
+    touches just the content keys and `extra`), and `plain_text` is
+    rendered once and cached. Equality and hashing compare the encoded
+    bytes, so identical components dedupe without being parsed. A decoded
+    component re-encodes to its original bytes; `replace` builds a modified
+    copy that is encoded from its value.
+
+    Treat `value` as read-only: it is shared with the cached encoding.
+
+    Attributes:
+        form (str): "nbt" or "json".
+    """
+
+    __slots__ = ("form", "_raw", "_value", "_parsed", "_plain", "_hash")
+
+    def __init__(self, value: Any, form: str = "nbt"):
+        """
+        Build a component from a Python value.
+
+        Args:
+            value: A string, a component dict, or a list of components.
+            form: "nbt" (Text Component) or "json" (JSON Text Component).
+
+        Raises:
+            ValueError: If `form` is unknown.
+        """
+        if form not in ("nbt", "json"):
+            raise ValueError(f"Unknown text component form {form!r}")
+        self.form = form
+        self._raw: Optional[bytes] = None
+        self._value = value
+        self._parsed = True
+        self._plain: Optional[str] = None
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _wrap(cls, raw: bytes, form: str) -> "TextComponent":
+        """Wrap encoded bytes without parsing them."""
+        self = object.__new__(cls)
+        self.form = form
+        self._raw = raw
+        self._value = None
+        self._parsed = False
+        self._plain = None
+        self._hash = None
+        return self
+
+    @classmethod
+    def from_bytes(cls, data: Buffer, offset: int = 0) -> tuple["TextComponent", int]:
+        """Decode an NBT-form Text Component starting at `offset`.
+
+        Args:
+            data (bytes | bytearray | memoryview): Buffer containing the component.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[TextComponent, int]: Component and number of bytes consumed.
+
+        Raises:
+            ValueError: If the data is truncated.
+        """
+        try:
+            size = Nbt.skip(data, offset)
+        except (IndexError, ValueError) as exc:
+            raise ValueError("Truncated text component") from exc
+        if offset + size > len(data):
+            raise ValueError("Truncated text component")
+        return cls._wrap(bytes(data[offset : offset + size]), "nbt"), size
+
+    @classmethod
+    def from_json_bytes(cls, data: Buffer, offset: int = 0) -> tuple["TextComponent", int]:
+        """Decode a JSON Text Component (a String) starting at `offset`.
+
+        Args:
+            data (bytes | bytearray | memoryview): Buffer containing the component.
+            offset (int, optional): Starting index in the buffer. Defaults to 0.
+
+        Returns:
+            tuple[TextComponent, int]: Component and number of bytes consumed.
+
+        Raises:
+            ValueError: If the data is truncated or exceeds the length limit.
+        """
+        length, size = VarInt.from_bytes(data, offset)
+        if length.value > _MAX_JSON_TEXT_LENGTH * 3:
+            raise ValueError(
+                f"JSON text component length {length.value} exceeds "
+                f"maximum {_MAX_JSON_TEXT_LENGTH * 3}"
+            )
+        end = offset + size + length.value
+        if end > len(data):
+            raise ValueError("Truncated JSON text component")
+        return cls._wrap(bytes(data[offset:end]), "json"), end - offset
+
+    @classmethod
+    def from_json(cls, text: str) -> "TextComponent":
+        """Build a JSON-form component from its JSON text, parsed on first use."""
+        return cls._wrap(_json_string(text), "json")
+
+    @property
+    def value(self) -> Any:
+        """Return the component value, parsing it on first access."""
+        if not self._parsed:
+            if self.form == "nbt":
+                self._value = Nbt.from_bytes(self._raw)[0].value
+            else:
+                size = VarInt.from_bytes(self._raw, 0)[1]
+                self._value = json.loads(self._raw[size:].decode("utf-8"))
+            self._parsed = True
+        return self._value
+
+    @property
+    def plain_text(self) -> str:
+        """Return the text without formatting, rendering it on first access.
+
+        Translatable components use their `fallback` or translation key
+        (no language file is loaded), with `%s`/`%n$s` replaced by their
+        arguments; scores render their value, selectors and NBT paths
+        their source.
+        """
+        if self._plain is None:
+            parts: list = []
+            _render(self.value, parts)
+            self._plain = "".join(parts)
+        return self._plain
+
+    def to_python(self) -> Any:
+        """Return the value as plain strings, dicts and lists."""
+        return _to_python(self.value)
+
+    def to_json(self) -> str:
+        """Return the component as JSON text."""
+        if self.form == "json" and self._raw is not None:
+            size = VarInt.from_bytes(self._raw, 0)[1]
+            return self._raw[size:].decode("utf-8")
+        return json.dumps(self.to_python(), ensure_ascii=False, separators=(",", ":"))
+
+    def replace(self, value: Any) -> "TextComponent":
+        """Return a component of the same form holding `value`."""
+        return type(self)(value, self.form)
+
+    def __bytes__(self) -> bytes:
+        """Serialize the component; decoded components return their original bytes.
+
+        Returns:
+            bytes: Network NBT, or a String holding JSON.
+
+        Raises:
+            ValueError: If a JSON component exceeds the length limit.
+        """
+        if self._raw is None:
+            if self.form == "nbt":
+                self._raw = bytes(Nbt(_nbt_value(self._value)))
+            else:
+                self._raw = _json_string(self.to_json())
+        return self._raw
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextComponent):
+            return NotImplemented
+        return self.form == other.form and bytes(self) == bytes(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.form, bytes(self)))
+        return self._hash
+
+    def __str__(self) -> str:
+        return self.plain_text
+
+    def __repr__(self) -> str:
+        return f"<TextComponent form={self.form} bytes={len(bytes(self))}>"
+
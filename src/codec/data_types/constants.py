@@ -12,4 +12,20 @@ _DEFAULT_MAX_CODE_UNITS = 32767
 
 # long.py constants
 _MIN_LONG = -9223372036854775808
-_MAX_LONG = 9223372036854775807
\ No newline at end of file
+_MAX_LONG = 9223372036854775807
+
+# int (32-bit) constants, used by NBT encoding
+_MIN_INT = -2147483648
+_MAX_INT = 2147483647
+
+# nbt.py constants (nested compounds and lists, as vanilla's NbtAccounter)
+_MAX_NBT_DEPTH = 512
+
+# position.py constants (x and z: 26 bits, y: 12 bits)
+_MIN_POSITION_XZ = -(1 << 25)
+_MAX_POSITION_XZ = (1 << 25) - 1
+_MIN_POSITION_Y = -(1 << 11)
+_MAX_POSITION_Y = (1 << 11) - 1
+
+# text_component.py constants (JSON Text Component length, in UTF-16 code units)
+_MAX_JSON_TEXT_LENGTH = 262144
@@ -19,6 +19,13 @@ class Long:
         if not _MIN_LONG <= self.value <= _MAX_LONG:
             raise ValueError(f"Long must be between {_MIN_LONG} and {_MAX_LONG}, got {self.value}")
 
+    @classmethod
+    def _trusted(cls, value: int) -> "Long":
+        """Build a Long without validation, for values already known to be in range."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", value)
+        return self
+
     def __bytes__(self) -> bytes:
         """
         Serialize the Long as 8 bytes, big-endian, two's complement.
@@ -39,5 +46,5 @@ class Long:
         """Construct a Long from 8 raw bytes."""
         if len(data) < 8:
             raise ValueError(f"Not enough bytes to unpack Long, got {len(data)}")
-        value = struct.unpack(">q", data[:8])[0]
-        return cls(value)
+        value = struct.unpack_from(">q", data)[0]
+        return cls._trusted(value)
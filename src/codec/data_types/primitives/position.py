@@ -0,0 +1,103 @@
+# src/codec/data_types/primitives/position.py
+
+from dataclasses import dataclass
+import struct
+from ..constants import _MIN_POSITION_XZ, _MAX_POSITION_XZ, _MIN_POSITION_Y, _MAX_POSITION_Y
+
+_POSITION = struct.Struct(">q")
+
+
+@dataclass(slots=True, frozen=True)
+class Position:
+    """Represents a block position packed into a 64-bit integer.
+
+    Layout, most significant bits first: x (26 bits), z (26 bits), y (12 bits),
+    each a signed two's complement value.
+
+    Attributes:
+        x (int): X coordinate (-33554432 to 33554431).
+        y (int): Y coordinate (-2048 to 2047).
+        z (int): Z coordinate (-33554432 to 33554431).
+    """
+
+    x: int
+    y: int
+    z: int
+
+    def __post_init__(self) -> None:
+        """Validate the coordinates after initialization.
+
+        Raises:
+            ValueError: If a coordinate does not fit its bit width.
+        """
+        if not (
+            _MIN_POSITION_XZ <= self.x <= _MAX_POSITION_XZ
+            and _MIN_POSITION_XZ <= self.z <= _MAX_POSITION_XZ
+        ):
+            raise ValueError(
+                f"Position x and z must be between {_MIN_POSITION_XZ} and {_MAX_POSITION_XZ}, "
+                f"got x={self.x}, z={self.z}"
+            )
+        if not _MIN_POSITION_Y <= self.y <= _MAX_POSITION_Y:
+            raise ValueError(
+                f"Position y must be between {_MIN_POSITION_Y} and {_MAX_POSITION_Y}, got {self.y}"
+            )
+
+    @classmethod
+    def _trusted(cls, x: int, y: int, z: int) -> "Position":
+        """Build a Position without validation, for coordinates already known to fit."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+        return self
+
+    def pack(self) -> int:
+        """Return the packed signed 64-bit value."""
+        packed = ((self.x & 0x3FFFFFF) << 38) | ((self.z & 0x3FFFFFF) << 12) | (self.y & 0xFFF)
+        return packed - (1 << 64) if packed >> 63 else packed
+
+    @classmethod
+    def unpack(cls, value: int) -> "Position":
+        """Build a Position from its packed signed 64-bit value.
+
+        Args:
+            value (int): Packed value, signed or unsigned.
+
+        Returns:
+            Position: Decoded position.
+        """
+        x = (value >> 38) & 0x3FFFFFF
+        z = (value >> 12) & 0x3FFFFFF
+        y = value & 0xFFF
+        return cls._trusted(
+            x - (1 << 26) if x >> 25 else x,
+            y - (1 << 12) if y >> 11 else y,
+            z - (1 << 26) if z >> 25 else z,
+        )
+
+    def __bytes__(self) -> bytes:
+        """Serialize the Position as 8 bytes, big-endian.
+
+        Returns:
+            bytes: The packed 8-byte representation.
+        """
+        return _POSITION.pack(self.pack())
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple["Position", int]:
+        """Decode a Position from bytes starting at `offset`.
+
+        Args:
+            data (bytes): Byte sequence containing the value.
+            offset (int): Start position to read from.
+
+        Returns:
+            tuple[Position, int]: Decoded position and number of bytes consumed (8).
+
+        Raises:
+            ValueError: If fewer than 8 bytes are available.
+        """
+        if len(data) - offset < 8:
+            raise ValueError(f"Not enough bytes to unpack Position at offset {offset}")
+        return cls.unpack(_POSITION.unpack_from(data, offset)[0]), 8
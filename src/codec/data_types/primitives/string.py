@@ -80,6 +80,13 @@ class String:
                 f"maximum {_DEFAULT_MAX_CODE_UNITS * 3}"
             )
 
+    @classmethod
+    def _trusted(cls, value: str) -> "String":
+        """Build a String without validation, for values already known to fit the limits."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", value)
+        return self
+
     def __bytes__(self) -> bytes:
         """Serialize the string with VarInt length prefix for network transmission.
 
@@ -90,7 +97,7 @@ class String:
             ValueError: If the length VarInt exceeds 3 bytes.
         """
         utf8_bytes = self.value.encode("utf-8")
-        length_prefix = bytes(VarInt(len(utf8_bytes)))
+        length_prefix = bytes(VarInt._trusted(len(utf8_bytes)))
         if len(length_prefix) > 3:
             raise ValueError(
                 f"Encoded length VarInt exceeds 3 bytes: {len(length_prefix)}"
@@ -111,10 +118,16 @@ class String:
                 - Number of bytes consumed (length VarInt + UTF-8 string)
 
         Raises:
-            ValueError: If data is too short for the expected string length.
+            ValueError: If data is too short for the expected string length
+                        or the string exceeds the protocol limits.
         """
         length_varint, varint_size = VarInt.from_bytes(data, offset)
         str_len = length_varint.value
+        if str_len > _DEFAULT_MAX_CODE_UNITS * 3:
+            raise ValueError(
+                f"UTF-8 encoded length {str_len} exceeds "
+                f"maximum {_DEFAULT_MAX_CODE_UNITS * 3}"
+            )
         start = offset + varint_size
         end = start + str_len
 
@@ -123,5 +136,16 @@ class String:
 
         utf8_bytes = data[start:end]
         value = utf8_bytes.decode("utf-8")
+
+        # A UTF-16 code unit takes at least one UTF-8 byte, so only strings
+        # longer than the code unit limit in bytes need counting
+        if str_len > _DEFAULT_MAX_CODE_UNITS:
+            code_units = len(value.encode("utf-16-le")) >> 1
+            if code_units > _DEFAULT_MAX_CODE_UNITS:
+                raise ValueError(
+                    f"String too long: {code_units} UTF-16 code units "
+                    f"(max {_DEFAULT_MAX_CODE_UNITS})"
+                )
+
         total_consumed = varint_size + str_len
-        return cls(value), total_consumed
+        return cls._trusted(value), total_consumed
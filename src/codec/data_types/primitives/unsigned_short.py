@@ -24,6 +24,13 @@ class UnsignedShort:
         if not 0 <= self.value <= 0xFFFF:
             raise ValueError("UnsignedShort must be between 0 and 65535")
 
+    @classmethod
+    def _trusted(cls, value: int) -> "UnsignedShort":
+        """Build an UnsignedShort without validation, for values already known to be in range."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", value)
+        return self
+
     def __bytes__(self) -> bytes:
         """Convert the integer to its big-endian byte representation.
 
@@ -31,3 +38,21 @@ class UnsignedShort:
             bytes: The 2-byte big-endian encoded value.
         """
         return struct.pack(">H", self.value)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple["UnsignedShort", int]:
+        """Decode an UnsignedShort from bytes starting at `offset`.
+
+        Args:
+            data (bytes): Byte sequence containing the value.
+            offset (int): Start position to read from.
+
+        Returns:
+            tuple[UnsignedShort, int]: Decoded value and number of bytes consumed (2).
+
+        Raises:
+            ValueError: If fewer than 2 bytes are available.
+        """
+        if len(data) - offset < 2:
+            raise ValueError(f"Not enough bytes to unpack UnsignedShort at offset {offset}")
+        return cls._trusted(struct.unpack_from(">H", data, offset)[0]), 2
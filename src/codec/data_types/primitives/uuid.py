@@ -31,6 +31,13 @@ class UUID:
             self.value if isinstance(self.value, PyUUID) else PyUUID(str(self.value)),
         )
 
+    @classmethod
+    def _trusted(cls, value: PyUUID) -> "UUID":
+        """Build a UUID without conversion, for values that already are PyUUIDs."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", value)
+        return self
+
     @property
     def msb(self) -> int:
         """Return the most significant 64 bits of the UUID as an unsigned integer."""
@@ -70,4 +77,4 @@ class UUID:
                 f"Buffer too small to decode UUID: need 16 bytes from offset {offset}"
             )
         raw = bytes(buf[offset : offset + 16])
-        return cls(PyUUID(bytes=raw)), 16
+        return cls._trusted(PyUUID(bytes=raw)), 16
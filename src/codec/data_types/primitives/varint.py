@@ -26,6 +26,13 @@ class VarInt:
         if not 0 <= self.value <= _MAX_VARINT:
             raise ValueError("VarInt must be between 0 and 4294967295")
 
+    @classmethod
+    def _trusted(cls, value: int) -> "VarInt":
+        """Build a VarInt without validation, for values already known to be in range."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", value)
+        return self
+
     def __bytes__(self) -> bytes:
         """Convert the integer to its variable-length byte representation.
 
@@ -59,12 +66,15 @@ class VarInt:
         """
         num_read = 0
         result = 0
-        for b in data[offset:]:
+        # At most 6 bytes are needed to tell "too long" from "incomplete"
+        for b in data[offset : offset + 6]:
             value = b & _SEGMENT_BITS
             result |= value << (7 * num_read)
             num_read += 1
             if num_read > 5:
                 raise ValueError("VarInt too long (max 5 bytes)")
             if (b & _CONTINUE_BIT) == 0:
-                return cls(result), num_read
+                if result > _MAX_VARINT:
+                    raise ValueError("VarInt must be between 0 and 4294967295")
+                return cls._trusted(result), num_read
         raise ValueError("Incomplete VarInt bytes")
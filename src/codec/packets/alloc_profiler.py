@@ -0,0 +1,219 @@
+# src/codec/packets/alloc_profiler.py
+
+import gc
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, Optional
+
+from codec.packets.packet import Packet
+from codec.packets.registry import PacketRegistry, PacketTable
+
+_FIELDS = ("calls", "sampled", "bytes", "retained_bytes", "blocks")
+
+
+class AllocationProfiler:
+    """Opt-in allocation profiler for packet decoding and encoding.
+
+    While installed, `PacketTable.instantiate` (decode and construction
+    through the registry) and `Packet.serialize` (encode) are wrapped. Every
+    `sample_interval`-th call per packet type is measured with `tracemalloc`:
+
+    - `bytes`: peak traced memory during the call above its starting level,
+      i.e. the transient allocation high-water mark;
+    - `retained_bytes`: traced memory still held when the call returns
+      (the packet itself, or the serialized bytes);
+    - `blocks`: change in `sys.getallocatedblocks()`, the objects retained.
+
+    Packet types are keyed `"State/direction/Class"`. Encode keys are
+    resolved through the registry's default version; classes it does not
+    list are keyed `"?/?/Class"`. Packets whose class replaces `serialize`
+    (frozen packets) and encodes done in worker threads are not measured.
+
+    Calls from any thread are counted, but only one call is measured at a
+    time: `tracemalloc` is process-wide, so a sampled call that starts
+    while another is being measured (or nested inside it) runs unmeasured.
+    Allocations other threads make during a measurement are still
+    attributed to it.
+
+    Example:
+        >>> with AllocationProfiler(sample_interval=10) as profiler:
+        ...     run_traffic()
+        >>> report("allocations", profiler.metrics())
+    """
+
+    def __init__(
+        self,
+        sample_interval: int = 1,
+        registry: Optional[PacketRegistry] = None,
+        frames: int = 1,
+    ):
+        """
+        Initialize an uninstalled profiler.
+
+        Args:
+            sample_interval: Measure one call in this many per packet type.
+            registry: Registry used to name encoded packets; a new one by default.
+            frames: Traceback depth stored by `tracemalloc` if the profiler starts it.
+
+        Raises:
+            ValueError: If `sample_interval` is less than 1.
+        """
+        if sample_interval < 1:
+            raise ValueError("sample_interval must be >= 1")
+        self.sample_interval = sample_interval
+        self.registry = registry if registry is not None else PacketRegistry()
+        self.frames = frames
+        # (operation, key) -> counters
+        self._stats: Dict[tuple, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(_FIELDS, 0))
+        self._names: Dict[type, str] = {}
+        self._counter_lock = threading.Lock()
+        self._measuring = threading.Lock()
+        self._started_tracing = False
+        self._originals: Optional[tuple] = None
+
+    def __enter__(self) -> "AllocationProfiler":
+        self.install()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        """Start `tracemalloc` if needed and wrap instantiate/serialize."""
+        if self._originals is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+        instantiate = PacketTable.instantiate
+        serialize = Packet.serialize
+        profiler = self
+
+        def profiled_instantiate(table, state, direction, packet_id, *args, **kwargs):
+            call = lambda: instantiate(table, state, direction, packet_id, *args, **kwargs)
+            operation = "decode" if kwargs.get("data") is not None else "construct"
+            cls = table.get_class(state, direction, packet_id)
+            return profiler._measure(operation, f"{state}/{direction}/{cls.__name__}", call)
+
+        def profiled_serialize(packet, *args, **kwargs):
+            call = lambda: serialize(packet, *args, **kwargs)
+            return profiler._measure("encode", profiler._name(type(packet)), call)
+
+        profiled_instantiate.__doc__ = instantiate.__doc__
+        profiled_serialize.__doc__ = serialize.__doc__
+        self._originals = (instantiate, serialize)
+        PacketTable.instantiate = profiled_instantiate
+        Packet.serialize = profiled_serialize
+
+    def uninstall(self) -> None:
+        """Restore the wrapped methods and stop `tracemalloc` if the profiler started it."""
+        if self._originals is None:
+            return
+        PacketTable.instantiate, Packet.serialize = self._originals
+        self._originals = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        """Clear collected statistics."""
+        self._stats.clear()
+
+    def _name(self, cls: type) -> str:
+        """Return the `"State/direction/Class"` key of an encoded packet class."""
+        name = self._names.get(cls)
+        if name is None:
+            path = f"{cls.__module__}.{cls.__qualname__}"
+            name = f"?/?/{cls.__name__}"
+            table = self.registry.for_version()
+            for state, directions in table._paths.items():
+                for direction, ids in directions.items():
+                    if path in ids.values():
+                        name = f"{state}/{direction}/{cls.__name__}"
+            self._names[cls] = name
+        return name
+
+    def _measure(self, operation: str, key: str, call):
+        """Run `call`, measuring it if this is a sampled call."""
+        with self._counter_lock:
+            stats = self._stats[(operation, key)]
+            stats["calls"] += 1
+            sampled = (stats["calls"] - 1) % self.sample_interval == 0
+        if not sampled or not self._measuring.acquire(blocking=False):
+            return call()
+
+        try:
+            blocks = sys.getallocatedblocks()
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            result = call()
+            current, peak = tracemalloc.get_traced_memory()
+            stats["sampled"] += 1
+            stats["bytes"] += peak - start
+            stats["retained_bytes"] += current - start
+            stats["blocks"] += sys.getallocatedblocks() - blocks
+            return result
+        finally:
+            self._measuring.release()
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Return per-call averages for every measured packet type.
+
+        Returns:
+            dict: `{key: {operation: {"calls", "bytes_per_call",
+            "retained_bytes_per_call", "blocks_per_call"}}}`.
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+        for (operation, key), stats in sorted(self._stats.items()):
+            sampled = stats["sampled"] or 1
+            result[key][operation] = {
+                "calls": stats["calls"],
+                "bytes_per_call": stats["bytes"] / sampled,
+                "retained_bytes_per_call": stats["retained_bytes"] / sampled,
+                "blocks_per_call": stats["blocks"] / sampled,
+            }
+        return dict(result)
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return `stats()` flattened for `benchmarks._harness.report`.
+
+        Returns:
+            dict: `"<key>.<operation>.<metric>" -> value`.
+        """
+        return {
+            f"{key}.{operation}.{metric}": value
+            for key, operations in self.stats().items()
+            for operation, values in operations.items()
+            for metric, value in values.items()
+        }
+
+    @staticmethod
+    def live_packets() -> Dict[str, Dict[str, int]]:
+        """
+        Count live packet instances and their shallow retained size per class.
+
+        The size is the instance plus the objects its slots reference
+        directly (strings, bytes, ints, ...), not deeper structures.
+
+        Returns:
+            dict: `{class name: {"count", "retained_bytes"}}`.
+        """
+        live: Dict[str, Dict[str, int]] = defaultdict(lambda: {"count": 0, "retained_bytes": 0})
+        for obj in gc.get_objects():
+            if not isinstance(obj, Packet):
+                continue
+            size = sys.getsizeof(obj)
+            for klass in type(obj).__mro__:
+                for slot in getattr(klass, "__slots__", ()):
+                    value = getattr(obj, slot, None)
+                    if value is not None and slot != "__weakref__":
+                        size += sys.getsizeof(value)
+            entry = live[type(obj).__name__]
+            entry["count"] += 1
+            entry["retained_bytes"] += size
+        return dict(live)
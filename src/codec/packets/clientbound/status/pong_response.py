@@ -27,7 +27,7 @@ class PongResponse(Packet):
         super().__init__(0x01)
 
         # Se data è bytes, deserializza
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             self.timestamp = Long.from_bytes(data).value
         else:
             self.timestamp = int(data)
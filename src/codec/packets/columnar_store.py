@@ -0,0 +1,440 @@
+# src/codec/packets/columnar_store.py
+
+from array import array
+import operator
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Type
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; columns stay `array`s and queries run in Python
+    np = None
+
+from codec.packets.packet import Packet
+
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_AGGREGATES = ("count", "sum", "min", "max", "mean")
+# Column kind -> other kinds its array also holds
+_WIDENS = {"int": ("bool",), "float": ("int", "bool")}
+
+
+def _fields(packet_cls: Type[Packet]) -> List[str]:
+    """Public slot names of a packet class, base classes first."""
+    names: List[str] = []
+    for klass in reversed(packet_cls.__mro__):
+        for name in getattr(klass, "__slots__", ()):
+            if not name.startswith("_") and name != "packet_id" and name not in names:
+                names.append(name)
+    return names
+
+
+def _unwrap(value: Any) -> Any:
+    """Return the Python value of a wrapper primitive (`VarInt`, `String`, ...)."""
+    if type(value).__module__.startswith("codec.data_types.primitives."):
+        return getattr(value, "value", value)
+    return value
+
+
+def _kind(value: Any) -> str:
+    """Column kind able to hold `value` ("null" when it says nothing)."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if _INT64_MIN <= value <= _INT64_MAX else "object"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "bytes"
+    return "object"
+
+
+class Column:
+    """One field of one packet class, stored by type.
+
+    Kinds:
+        bool, int, float: `array('b')`, `array('q')`, `array('d')`.
+        str, bytes: `array('Q')` of end offsets into one `bytearray` blob.
+        object: a list of references (lists, dicts, text components, ...).
+
+    The kind is fixed by the first non-None value; int columns also take
+    bools and float columns ints. A later value that does not fit (a str
+    or float in an int column, an int beyond 64 bits) converts the column
+    to `object`. None is stored as a zero or empty value plus a bit
+    in `nulls`, which is only allocated once a None shows up.
+
+    Attributes:
+        name (str): Field name.
+        kind (str): Storage kind.
+        nulls (Optional[bytearray]): 1 for rows holding None.
+    """
+
+    __slots__ = ("name", "kind", "data", "offsets", "nulls", "_length")
+
+    _TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+
+    def __init__(self, name: str):
+        self.name = name
+        self.kind = "null"
+        self.data: Any = None
+        self.offsets: Optional[array] = None
+        self.nulls: Optional[bytearray] = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, value: Any) -> None:
+        """Append one value, converting the column if it does not fit."""
+        kind = _kind(value)
+        if kind == "null":
+            if self.nulls is None:
+                self.nulls = bytearray(self._length)
+            self.nulls.append(1)
+            self._append_empty()
+            self._length += 1
+            return
+        if self.kind == "null":
+            self._start(kind)
+        elif kind != self.kind and kind not in _WIDENS.get(self.kind, ()):
+            self._to_object()
+        if self.nulls is not None:
+            self.nulls.append(0)
+        self._append(value)
+        self._length += 1
+
+    def _start(self, kind: str) -> None:
+        """Fix the kind of a column that only held None so far."""
+        nones = self._length
+        self.kind = kind
+        if kind in self._TYPECODES:
+            self.data = array(self._TYPECODES[kind], bytes(array(self._TYPECODES[kind]).itemsize * nones))
+        elif kind in ("str", "bytes"):
+            self.data = bytearray()
+            self.offsets = array("Q", bytes(8 * nones))
+        else:
+            self.data = [None] * nones
+
+    def _append(self, value: Any) -> None:
+        kind = self.kind
+        if kind in self._TYPECODES:
+            self.data.append(value)
+        elif kind == "str":
+            self.data += value.encode("utf-8")
+            self.offsets.append(len(self.data))
+        elif kind == "bytes":
+            self.data += value
+            self.offsets.append(len(self.data))
+        else:
+            self.data.append(value)
+
+    def _append_empty(self) -> None:
+        kind = self.kind
+        if kind == "null":
+            return
+        if kind in self._TYPECODES:
+            self.data.append(0)
+        elif kind in ("str", "bytes"):
+            self.offsets.append(len(self.data))
+        else:
+            self.data.append(None)
+
+    def _truncate(self, length: int) -> None:
+        """Drop rows past `length`, undoing a partial append.
+
+        Buffers already at their old size are left untouched, so a buffer
+        that failed to grow (exported by a view) is not resized either.
+        """
+        if self.nulls is not None and len(self.nulls) > length:
+            del self.nulls[length:]
+        kind = self.kind
+        if kind in ("str", "bytes"):
+            if len(self.offsets) > length:
+                del self.offsets[length:]
+            end = self.offsets[length - 1] if length else 0
+            if len(self.data) > end:
+                del self.data[end:]
+        elif kind != "null" and len(self.data) > length:
+            del self.data[length:]
+        self._length = length
+
+    def _to_object(self) -> None:
+        values = list(self)
+        self.kind = "object"
+        self.data = values
+        self.offsets = None
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("column index out of range")
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        kind = self.kind
+        if kind in ("str", "bytes"):
+            start = self.offsets[index - 1] if index else 0
+            raw = bytes(self.data[start : self.offsets[index]])
+            return raw.decode("utf-8") if kind == "str" else raw
+        if kind == "bool":
+            return bool(self.data[index])
+        if kind == "null":
+            return None
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(self._length))
+
+    def values(self):
+        """
+        Return the column as one sequence without building row objects.
+
+        Returns:
+            A NumPy view over the typed array for numeric kinds (the
+            `array` itself without NumPy), else a list. The column cannot
+            grow while a view is alive.
+        """
+        if self.kind in self._TYPECODES:
+            if np is not None:
+                return np.frombuffer(self.data, dtype=self.data.typecode)
+            return self.data
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column's buffers (object columns count references only)."""
+        size = len(self.nulls) if self.nulls is not None else 0
+        if self.kind in self._TYPECODES:
+            return size + len(self.data) * self.data.itemsize
+        if self.kind in ("str", "bytes"):
+            return size + len(self.data) + len(self.offsets) * 8
+        if self.kind == "object":
+            return size + len(self.data) * 8
+        return size
+
+
+class PacketColumns:
+    """Columns of every stored packet of one class.
+
+    Attributes:
+        packet_cls (type): Packet class.
+        columns (dict[str, Column]): Field name -> column, in slot order.
+    """
+
+    def __init__(self, packet_cls: Type[Packet]):
+        self.packet_cls = packet_cls
+        self.columns: Dict[str, Column] = {name: Column(name) for name in _fields(packet_cls)}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, packet: Packet) -> None:
+        """
+        Append one packet's public fields.
+
+        All fields are read before any column changes. If a column then
+        cannot grow (e.g. `BufferError` while one of its `values()` views
+        is alive), the columns already extended are cut back so every
+        column keeps the same rows, and the error propagates.
+        """
+        values = [_unwrap(getattr(packet, name, None)) for name in self.columns]
+        try:
+            for column, value in zip(self.columns.values(), values):
+                column.append(value)
+        except BaseException:
+            for column in self.columns.values():
+                column._truncate(self._length)
+            raise
+        self._length += 1
+
+    def column(self, name: str) -> Column:
+        """Return a column by field name (`KeyError` if unknown)."""
+        return self.columns[name]
+
+    def row(self, index: int) -> dict:
+        """Return one stored packet's fields as a dict."""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def where(self, name: str, op: str, value: Any = None, predicate: Optional[Callable[[Any], bool]] = None):
+        """
+        Return the indices of rows whose field matches.
+
+        Numeric columns are compared in one vectorized pass with NumPy.
+
+        Args:
+            name: Field name.
+            op: "==", "!=", "<", "<=", ">", ">=", or "call" with `predicate`.
+            value: Value compared against.
+            predicate: Row test for "call".
+
+        Returns:
+            Row indices: an integer NumPy array with NumPy, else a list.
+
+        Raises:
+            ValueError: If `op` is unknown.
+        """
+        column = self.columns[name]
+        if op == "call":
+            matches = [index for index, item in enumerate(column) if predicate(item)]
+            return np.asarray(matches, dtype=np.int64) if np is not None else matches
+        compare = _COMPARISONS.get(op)
+        if compare is None:
+            raise ValueError(f"Unknown comparison {op!r}")
+
+        if np is not None and column.kind in Column._TYPECODES and value is not None:
+            mask = compare(column.values(), value)
+            if column.nulls is not None:
+                mask &= np.frombuffer(column.nulls, dtype=np.uint8) == 0
+            return np.flatnonzero(mask)
+        matches = [
+            index for index, item in enumerate(column)
+            if item is not None and compare(item, value)
+        ]
+        return np.asarray(matches, dtype=np.int64) if np is not None else matches
+
+    def aggregate(self, name: str, how: str, rows: Optional[Sequence[int]] = None):
+        """
+        Aggregate a column, optionally over selected rows.
+
+        None values are ignored.
+
+        Args:
+            name: Field name.
+            how: "count", "sum", "min", "max" or "mean".
+            rows: Row indices (e.g. from `where`); all rows if None.
+
+        Returns:
+            The aggregate; None for min/max/mean of no values.
+
+        Raises:
+            ValueError: If `how` is unknown.
+        """
+        if how not in _AGGREGATES:
+            raise ValueError(f"Unknown aggregate {how!r}, expected one of {_AGGREGATES}")
+        column = self.columns[name]
+        if np is not None and column.kind in Column._TYPECODES:
+            values = column.values()
+            present = None if column.nulls is None else np.frombuffer(column.nulls, dtype=np.uint8) == 0
+            if rows is not None:
+                rows = np.asarray(rows, dtype=np.int64)
+                values = values[rows]
+                present = None if present is None else present[rows]
+            if present is not None:
+                values = values[present]
+            if how == "count":
+                return int(values.size)
+            if values.size == 0:
+                return 0 if how == "sum" else None
+            if how == "sum" and column.kind == "int":
+                bound = max(abs(int(values.min())), abs(int(values.max())))
+                if bound * values.size > _INT64_MAX:
+                    return sum(values.tolist())  # int64 would wrap around
+            return getattr(values, how)().item()
+
+        items = column if rows is None else (column[index] for index in rows)
+        present = [item for item in items if item is not None]
+        if how == "count":
+            return len(present)
+        if how == "sum":
+            return sum(present)
+        if not present:
+            return None
+        if how == "mean":
+            return sum(present) / len(present)
+        return min(present) if how == "min" else max(present)
+
+    def to_numpy(self):
+        """
+        Export the columns as a NumPy structured array.
+
+        Numeric columns keep their type (`bool`, `int64`, `float64`);
+        strings, bytes, object and all-None columns become object fields.
+        None in a numeric column exports as 0 (see `Column.nulls`).
+
+        Returns:
+            numpy.ndarray: One record per stored packet.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("to_numpy requires NumPy")
+        dtypes = {"bool": np.bool_, "int": np.int64, "float": np.float64}
+        dtype = [(name, dtypes.get(column.kind, object)) for name, column in self.columns.items()]
+        records = np.empty(self._length, dtype=dtype)
+        for name, column in self.columns.items():
+            if column.kind in dtypes:
+                records[name] = column.values()
+            else:
+                records[name] = list(column)
+        return records
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all columns."""
+        return sum(column.nbytes for column in self.columns.values())
+
+
+class ColumnarStore:
+    """Decoded packets stored column-wise, one `PacketColumns` per class.
+
+    A stored packet costs its field values packed in typed arrays (8 bytes
+    for an int, the UTF-8 bytes plus an 8-byte offset for a string) instead
+    of an instance with its slot references and boxed values, so captured
+    sessions can be kept in memory and queried one column at a time.
+
+    Public slots of each class are its fields; wrapper primitives are
+    stored by value. Packets are not rebuilt: read rows with
+    `PacketColumns.row` or whole columns with `Column.values`.
+
+    Example:
+        >>> store = ColumnarStore()
+        >>> store.extend(packets)
+        >>> pongs = store.table(PongResponse)
+        >>> late = pongs.where("timestamp", ">", cutoff)
+        >>> pongs.aggregate("timestamp", "max", late)
+    """
+
+    def __init__(self):
+        self.tables: Dict[Type[Packet], PacketColumns] = {}
+
+    def append(self, packet: Packet) -> None:
+        """Store one packet."""
+        table = self.tables.get(type(packet))
+        if table is None:
+            table = self.tables[type(packet)] = PacketColumns(type(packet))
+        table.append(packet)
+
+    def extend(self, packets: Iterable[Packet]) -> None:
+        """Store many packets."""
+        for packet in packets:
+            self.append(packet)
+
+    def table(self, packet_cls: Type[Packet]) -> PacketColumns:
+        """
+        Return the columns of a packet class.
+
+        Raises:
+            KeyError: If no packet of the class was stored.
+        """
+        return self.tables[packet_cls]
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all columns of all classes."""
+        return sum(table.nbytes for table in self.tables.values())
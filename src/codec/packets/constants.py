@@ -2,4 +2,7 @@
 
 # packet.py constants
 _MAX_VARINT_3_BYTES = 0x1FFFFF          # 2097151 (2^21 - 1)
-_MAX_UNCOMPRESSED_SERVERBOUND = 0x7FFFFF  # 8388607 (2^23 - 1)
\ No newline at end of file
+_MAX_UNCOMPRESSED_SERVERBOUND = 0x7FFFFF  # 8388607 (2^23 - 1)
+
+# registry.py constants
+_DEFAULT_PROTOCOL_VERSION = 773  # 1.21.9, the version packets_registry.json describes
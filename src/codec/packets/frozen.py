@@ -0,0 +1,237 @@
+# src/codec/packets/frozen.py
+
+from collections import OrderedDict
+import itertools
+import threading
+from typing import Dict, Hashable, Optional, Set, Type
+import weakref
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB across all frozen packets
+
+_instance_keys = itertools.count()
+
+
+class PacketCache:
+    """LRU cache of serialized packet bytes shared by all frozen packets.
+
+    Entries are keyed by `(key, framing)`, where framing is the
+    `(compression_threshold, wire packet ID)` pair: the same packet frames
+    differently with and without compression, and under the IDs of
+    different protocol versions. The total size of the
+    cached bytes never exceeds `max_bytes`; least recently used entries are
+    evicted first and simply re-serialized on their next use.
+
+    Attributes:
+        max_bytes (int): Memory cap for cached bytes.
+        size (int): Bytes currently cached.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that required serialization.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory cap for cached bytes.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._framings: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, framing: Hashable) -> Optional[bytes]:
+        """
+        Return cached bytes, or None on a miss.
+
+        Args:
+            key: Packet class or frozen instance key.
+            framing: `(compression threshold, packet ID)` the bytes were framed with.
+
+        Returns:
+            Cached wire bytes, if any.
+        """
+        with self._lock:
+            data = self._entries.get((key, framing))
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((key, framing))
+            self.hits += 1
+            return data
+
+    def put(self, key: Hashable, framing: Hashable, data: bytes) -> None:
+        """
+        Store serialized bytes, evicting old entries to respect the cap.
+
+        Entries larger than the whole cap are not stored.
+
+        Args:
+            key: Packet class or frozen instance key.
+            framing: `(compression threshold, packet ID)` the bytes were framed with.
+            data: Wire bytes.
+        """
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop((key, framing), None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[(key, framing)] = data
+            self._framings.setdefault(key, set()).add(framing)
+            self.size += len(data)
+            self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop every cached framing of `key`.
+
+        Args:
+            key: Packet class or frozen instance key.
+        """
+        with self._lock:
+            for framing in self._framings.pop(key, ()):
+                data = self._entries.pop((key, framing), None)
+                if data is not None:
+                    self.size -= len(data)
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Change the memory cap, evicting entries if needed.
+
+        Args:
+            max_bytes: New memory cap.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all cached bytes."""
+        with self._lock:
+            self._entries.clear()
+            self._framings.clear()
+            self.size = 0
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until under the cap (lock held)."""
+        while self.size > self.max_bytes:
+            (key, framing), data = self._entries.popitem(last=False)
+            self.size -= len(data)
+            framings = self._framings[key]
+            framings.discard(framing)
+            if not framings:
+                del self._framings[key]
+
+
+PACKET_CACHE = PacketCache()
+
+
+def frozen_packet(cls: Type[Packet]) -> Type[Packet]:
+    """Class decorator for packets whose instances always serialize identically.
+
+    Use it only for packets without fields or with class-level constant
+    fields (e.g. `StatusRequest`). The bytes are cached per concrete class.
+
+    Args:
+        cls: Packet class to freeze.
+
+    Returns:
+        The same class with a caching `serialize`.
+    """
+    serialize = cls.serialize
+
+    def cached_serialize(
+        self, compression_threshold: Optional[int] = None, packet_id: Optional[VarInt] = None
+    ) -> bytes:
+        key = type(self)
+        framing = (compression_threshold, (self.packet_id if packet_id is None else packet_id).value)
+        data = PACKET_CACHE.get(key, framing)
+        if data is None:
+            data = serialize(self, compression_threshold, packet_id)
+            PACKET_CACHE.put(key, framing, data)
+        return data
+
+    cached_serialize.__doc__ = serialize.__doc__
+    cls.serialize = cached_serialize
+    cls.frozen = True
+    return cls
+
+
+class FrozenPacket(Packet):
+    """An immutable packet whose wire bytes are serialized once and reused.
+
+    The wrapped packet must not be modified afterwards; call `invalidate()`
+    if it is. Cached bytes are released when the frozen packet is garbage
+    collected.
+
+    Attributes:
+        packet (Packet): The wrapped packet.
+    """
+
+    __slots__ = ("packet", "_key", "__weakref__")
+
+    frozen = True
+
+    def __init__(self, packet: Packet) -> None:
+        """
+        Freeze a packet instance.
+
+        Args:
+            packet (Packet): Packet to freeze.
+        """
+        super().__init__(packet.packet_id)
+        self.packet = packet
+        self._key = ("instance", next(_instance_keys))
+        weakref.finalize(self, PACKET_CACHE.invalidate, self._key)
+
+    def _iter_fields(self):
+        """Yield the wrapped packet's fields."""
+        return self.packet._iter_fields()
+
+    def serialize(
+        self, compression_threshold: Optional[int] = None, packet_id: Optional[VarInt] = None
+    ) -> bytes:
+        """Return the cached wire bytes, serializing on first use.
+
+        Args:
+            compression_threshold: Threshold for compression.
+            packet_id: Wire ID overriding the packet's own.
+
+        Returns:
+            bytes: The serialized packet.
+        """
+        framing = (compression_threshold, (self.packet_id if packet_id is None else packet_id).value)
+        data = PACKET_CACHE.get(self._key, framing)
+        if data is None:
+            data = self.packet.serialize(compression_threshold, packet_id)
+            PACKET_CACHE.put(self._key, framing, data)
+        return data
+
+    def invalidate(self) -> None:
+        """Drop the cached bytes, e.g. after the wrapped packet was modified."""
+        PACKET_CACHE.invalidate(self._key)
+
+    def __str__(self) -> str:
+        return f"<FrozenPacket {self.packet}>"
+
+
+def freeze(packet: Packet) -> FrozenPacket:
+    """
+    Mark a packet instance as immutable so its wire bytes are cached.
+
+    Args:
+        packet: Packet to freeze.
+
+    Returns:
+        FrozenPacket: Wrapper to send instead of `packet`.
+    """
+    if isinstance(packet, FrozenPacket):
+        return packet
+    return FrozenPacket(packet)
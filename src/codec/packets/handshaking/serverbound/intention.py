@@ -29,7 +29,8 @@ class Intention(Packet):
 
     def __post_init__(self) -> None:
         """Validate handshake-specific constraints."""
-        super().__init__(VarInt(0x00))
+        # dataclass(slots=True) rebuilds the class, so zero-argument super() can't be used
+        Packet.__init__(self, VarInt._trusted(0x00))
 
         if self.intent not in (1, 2, 3):
             raise ValueError(
@@ -37,6 +38,29 @@ class Intention(Packet):
                 "must be 1 (Status), 2 (Login), or 3 (Transfer)"
             )
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Intention":
+        """Decode a received handshake payload.
+
+        Args:
+            data (bytes): Raw packet data (without Packet ID).
+
+        Returns:
+            Intention: Decoded handshake.
+        """
+        protocol_version, offset = VarInt.from_bytes(data, 0)
+        server_address, size = String.from_bytes(data, offset)
+        offset += size
+        server_port, size = UnsignedShort.from_bytes(data, offset)
+        offset += size
+        intent, _ = VarInt.from_bytes(data, offset)
+        return cls(
+            protocol_version.value,
+            server_address.value,
+            server_port.value,
+            intent.value,
+        )
+
     def _iter_fields(self):
         """Yield serialized handshake fields in protocol order."""
         yield bytes(VarInt(self.protocol_version))
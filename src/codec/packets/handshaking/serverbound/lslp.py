@@ -34,7 +34,7 @@ class LegacyServerListPing(Packet):
     protocol_version: int = 74
 
     def __post_init__(self):
-        super().__init__(VarInt(0xFE))
+        Packet.__init__(self, VarInt(0xFE))
 
         """Validate fields after initialization."""
         if not (0 < self.port <= 65535):
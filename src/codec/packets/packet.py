@@ -17,10 +17,14 @@ class Packet(ABC):
 
     Attributes:
         packet_id (VarInt): The protocol packet ID.
+        frozen (bool): Class attribute; True when `serialize()` returns cached
+            bytes (see `codec.packets.frozen`).
     """
 
     __slots__ = ("packet_id",)
 
+    frozen = False
+
     def __init__(self, packet_id):
         if not isinstance(packet_id, VarInt):
             raise TypeError(
@@ -39,26 +43,36 @@ class Packet(ABC):
         """
         raise NotImplementedError
 
-    def serialize(self, compression_threshold: Optional[int] = None) -> bytes:
-        """Serialize the packet according to the Minecraft protocol.
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Packet":
+        """Construct a packet from its raw payload (Data, without Packet ID).
 
-        Depending on the compression threshold, this method produces either
-        a compressed or uncompressed packet compliant with the protocol specification.
+        The default passes the payload to the constructor, which is how
+        clientbound packets are built. Packets whose constructor takes
+        fields instead override this.
 
         Args:
-            compression_threshold: Threshold for compression.
-                - None: compression disabled.
-                - >= 0: packets with body length >= threshold are compressed.
+            data: Raw packet payload.
 
         Returns:
-            bytes: The serialized packet ready to be sent over TCP.
+            Packet: Decoded packet instance.
+        """
+        return cls(data)
+
+    def encode_body(self, packet_id: Optional[VarInt] = None) -> bytearray:
+        """Build the uncompressed packet body (Packet ID + Data).
+
+        Args:
+            packet_id: Wire ID to write instead of the class's `packet_id`,
+                e.g. the ID of the protocol version a connection is bound to.
+
+        Returns:
+            bytearray: The uncompressed body.
 
         Raises:
-            ValueError: If packet exceeds protocol size limits or
-                compression threshold is invalid.
+            ValueError: If the body exceeds the uncompressed size limit.
         """
-        # --- Build uncompressed body (Packet ID + Data) ---
-        body = bytearray(bytes(self.packet_id))
+        body = bytearray(bytes(self.packet_id if packet_id is None else packet_id))
         for field in self._iter_fields():
             body.extend(bytes(field))
 
@@ -68,10 +82,35 @@ class Packet(ABC):
                 f"Uncompressed packet too large: {body_len} bytes "
                 f"(max {_MAX_UNCOMPRESSED_SERVERBOUND})"
             )
+        return body
+
+    @staticmethod
+    def frame(
+        body: bytes,
+        compression_threshold: Optional[int] = None,
+        compressed: Optional[bytes] = None,
+    ) -> bytes:
+        """Wrap an uncompressed body into a wire frame.
+
+        Args:
+            body: Uncompressed body as returned by `encode_body()`.
+            compression_threshold: Threshold for compression (see `serialize`).
+            compressed: Precomputed `zlib.compress(body)`, for callers that
+                compress elsewhere (e.g. off the event loop). Computed here
+                when needed and omitted.
+
+        Returns:
+            bytes: The framed packet ready to be sent over TCP.
+
+        Raises:
+            ValueError: If packet exceeds protocol size limits or
+                compression threshold is invalid.
+        """
+        body_len = len(body)
 
         # --- Compression disabled ---
         if compression_threshold is None:
-            length_prefix = bytes(VarInt(body_len))
+            length_prefix = bytes(VarInt._trusted(body_len))
             if len(length_prefix) > 3:
                 raise ValueError(
                     f"Packet length VarInt exceeds 3 bytes: {len(length_prefix)}"
@@ -89,8 +128,8 @@ class Packet(ABC):
         # --- Compression enabled ---
         if body_len < compression_threshold:
             # Too small → uncompressed with Data Length = 0
-            data_length = bytes(VarInt(0))
-            packet_length = bytes(VarInt(len(data_length) + body_len))
+            data_length = bytes(VarInt._trusted(0))
+            packet_length = bytes(VarInt._trusted(len(data_length) + body_len))
             if len(packet_length) > 3:
                 raise ValueError(
                     f"Packet Length VarInt exceeds 3 bytes: {len(packet_length)}"
@@ -98,9 +137,10 @@ class Packet(ABC):
             return packet_length + data_length + body
 
         # Compress body
-        compressed = zlib.compress(body)
-        data_length = bytes(VarInt(body_len))
-        packet_length = bytes(VarInt(len(data_length) + len(compressed)))
+        if compressed is None:
+            compressed = zlib.compress(body)
+        data_length = bytes(VarInt._trusted(body_len))
+        packet_length = bytes(VarInt._trusted(len(data_length) + len(compressed)))
 
         if len(packet_length) > 3:
             raise ValueError(
@@ -109,6 +149,29 @@ class Packet(ABC):
 
         return packet_length + data_length + compressed
 
+    def serialize(
+        self, compression_threshold: Optional[int] = None, packet_id: Optional[VarInt] = None
+    ) -> bytes:
+        """Serialize the packet according to the Minecraft protocol.
+
+        Depending on the compression threshold, this method produces either
+        a compressed or uncompressed packet compliant with the protocol specification.
+
+        Args:
+            compression_threshold: Threshold for compression.
+                - None: compression disabled.
+                - >= 0: packets with body length >= threshold are compressed.
+            packet_id: Wire ID overriding the class's `packet_id`.
+
+        Returns:
+            bytes: The serialized packet ready to be sent over TCP.
+
+        Raises:
+            ValueError: If packet exceeds protocol size limits or
+                compression threshold is invalid.
+        """
+        return self.frame(self.encode_body(packet_id), compression_threshold)
+
     def __str__(self) -> str:
         """Return a concise representation showing only public fields."""
         fields = (
@@ -0,0 +1,37 @@
+# src/codec/packets/play/serverbound/ping_request.py
+
+from codec.packets.packet import Packet
+from codec.data_types.primitives.long import Long
+from codec.data_types.primitives.varint import VarInt
+
+
+class PingRequest(Packet):
+    """
+    Ping Request packet (serverbound).
+
+    Packet ID: 0x25
+    State: Play
+    Bound to: Server
+
+    Contains an arbitrary timestamp payload the server echoes back in Pong Response.
+    """
+
+    __slots__ = ("timestamp",)
+
+    def __init__(self, data: bytes | int) -> None:
+        """
+        Initialize PingRequest.
+
+        Args:
+            data (bytes | int): Raw packet data from a client or a direct timestamp.
+        """
+        super().__init__(VarInt._trusted(0x25))
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self.timestamp = Long.from_bytes(data).value
+        else:
+            self.timestamp = int(data)
+
+    def _iter_fields(self):
+        """Yield the timestamp as a Long field for serialization."""
+        yield Long(self.timestamp)
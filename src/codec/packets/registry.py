@@ -4,24 +4,88 @@ import sys
 import os
 import json
 import importlib
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional
 
+from .constants import _DEFAULT_PROTOCOL_VERSION
 
-class PacketRegistry:
-    """Resolves and instantiates packet classes."""
+_VERSIONS_DIR = os.path.join(os.path.dirname(__file__), "versions")
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Guards `sys.path` and table construction; lookups of built tables and
+# resolved classes never take it
+_LOCK = threading.Lock()
+
+
+class PacketTable:
+    """Packet classes of one protocol version.
 
-    def __init__(self):
+    Tables are built once per version by `PacketRegistry.for_version` and
+    shared read-only by every connection on that version: the ID maps are
+    `MappingProxyType` views and resolved classes are cached on first use.
+
+    Tables are safe to use from many threads, including on free-threaded
+    builds: a cache miss imports under a lock and publishes the class with
+    a single dict store, so readers see either nothing or the final class.
+    """
+
+    __slots__ = ("protocol_version", "_paths", "_ids", "_classes", "_lock")
+
+    def __init__(self, protocol_version: int, paths: dict):
         """
-        Load packet registry from JSON configuration.
+        Freeze the packet maps of a version.
+
+        Args:
+            protocol_version: Protocol version the maps describe.
+            paths: `{state: {direction: {packet_id: "module.Class"}}}`.
         """
-        sys.path.insert(
-            0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+        self.protocol_version = protocol_version
+        self._paths = MappingProxyType(
+            {
+                state: MappingProxyType(
+                    {direction: MappingProxyType(dict(ids)) for direction, ids in directions.items()}
+                )
+                for state, directions in paths.items()
+            }
         )
+        # (state, direction, "module.Class") -> first packet identifier listing it
+        ids_by_path: dict = {}
+        for state, directions in paths.items():
+            for direction, ids in directions.items():
+                for packet_id, path in ids.items():
+                    ids_by_path.setdefault((state, direction, path), packet_id)
+        self._ids = MappingProxyType(ids_by_path)
+        self._classes: Dict[tuple, type] = {}
+        self._lock = threading.Lock()
 
-        with open(
-            os.path.join(os.path.dirname(__file__), "packets_registry.json"),
-            "r",
-        ) as f:
-            self._registry = json.load(f)
+    def path(self, state: str, direction: str, packet_id: str) -> Optional[str]:
+        """
+        Return the class path of a packet without importing it.
+
+        Args:
+            state: Protocol state.
+            direction: Packet direction.
+            packet_id: Packet identifier.
+
+        Returns:
+            `"module.Class"`, or None if the version has no such packet.
+        """
+        return self._paths.get(state, {}).get(direction, {}).get(packet_id)
+
+    def packet_id(self, state: str, direction: str, path: str) -> Optional[str]:
+        """
+        Return the packet identifier of a class path.
+
+        Args:
+            state: Protocol state.
+            direction: Packet direction.
+            path: `"module.Class"`.
+
+        Returns:
+            Packet identifier such as `"0x2B"`, or None if the version has no such packet.
+        """
+        return self._ids.get((state, direction, path))
 
     def get_class(self, state: str, direction: str, packet_id: str):
         """
@@ -38,14 +102,26 @@ class PacketRegistry:
         Raises:
             ValueError: If no packet matches the parameters.
         """
-        try:
-            full_path = self._registry[state][direction][packet_id]
-        except KeyError:
-            raise ValueError(f"No packet found for {state}.{direction}.{packet_id}")
+        key = (state, direction, packet_id)
+        cls = self._classes.get(key)
+        if cls is not None:
+            return cls
 
-        module_path, class_name = full_path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        return getattr(module, class_name)
+        full_path = self.path(state, direction, packet_id)
+        if full_path is None:
+            raise ValueError(
+                f"No packet found for {state}.{direction}.{packet_id} "
+                f"in protocol {self.protocol_version}"
+            )
+
+        with self._lock:
+            cls = self._classes.get(key)
+            if cls is None:
+                module_path, class_name = full_path.rsplit(".", 1)
+                module = importlib.import_module(module_path)
+                cls = getattr(module, class_name)
+                self._classes[key] = cls
+        return cls
 
     def instantiate(
         self,
@@ -64,7 +140,7 @@ class PacketRegistry:
             direction: Packet direction.
             packet_id: Packet identifier.
             *args: Positional constructor arguments.
-            data: Raw payload for clientbound packets.
+            data: Raw payload of a received packet.
             **kwargs: Keyword constructor arguments.
 
         Returns:
@@ -73,6 +149,172 @@ class PacketRegistry:
         cls = self.get_class(state, direction, packet_id)
 
         if data is not None:
-            return cls(data)
+            return cls.from_bytes(data)
 
         return cls(*args, **kwargs)
+
+
+class PacketRegistry:
+    """Resolves and instantiates packet classes.
+
+    `packets_registry.json` describes `protocol_version`. Other versions are
+    described by `<versions_dir>/<protocol>.json` files, loaded the first
+    time the version is requested:
+
+        {
+            "extends": 773,
+            "packets": {"Play": {"clientbound": {"0x3C": "module.Class", "0x3D": null}}}
+        }
+
+    `extends` names the version the file patches (the default version when
+    omitted); `null` removes a packet ID. Overriding an ID with another
+    class is how field layouts that changed between versions are handled.
+
+    A registry may be shared between threads: each version's table is
+    built once, under a lock.
+    """
+
+    def __init__(
+        self,
+        versions_dir: str = _VERSIONS_DIR,
+        protocol_version: int = _DEFAULT_PROTOCOL_VERSION,
+    ):
+        """
+        Load packet registry from JSON configuration.
+
+        Args:
+            versions_dir: Directory holding per-version JSON files.
+            protocol_version: Version described by `packets_registry.json`.
+        """
+        with _LOCK:
+            if _SRC_DIR not in sys.path:
+                sys.path.insert(0, _SRC_DIR)
+
+        with open(
+            os.path.join(os.path.dirname(__file__), "packets_registry.json"),
+            "r",
+        ) as f:
+            self._registry = json.load(f)
+
+        self.protocol_version = protocol_version
+        self.versions_dir = versions_dir
+        self._tables: Dict[int, PacketTable] = {}
+
+    def _version_file(self, protocol_version: int) -> str:
+        return os.path.join(self.versions_dir, f"{protocol_version}.json")
+
+    def supports(self, protocol_version: int) -> bool:
+        """
+        Return whether packet maps exist for a protocol version.
+
+        Args:
+            protocol_version: Protocol version announced by a client.
+
+        Returns:
+            True if `for_version` can build a table for it.
+        """
+        return (
+            protocol_version == self.protocol_version
+            or protocol_version in self._tables
+            or os.path.isfile(self._version_file(protocol_version))
+        )
+
+    def loaded_versions(self) -> Iterable[int]:
+        """Return the versions whose tables have been built."""
+        with _LOCK:
+            return tuple(self._tables)
+
+    def for_version(self, protocol_version: Optional[int] = None) -> PacketTable:
+        """
+        Return the shared packet table of a protocol version, building it on first use.
+
+        Args:
+            protocol_version: Protocol version; the default version when None.
+
+        Returns:
+            PacketTable: Table shared by every caller asking for this version.
+
+        Raises:
+            ValueError: If the version is not supported or its files form a cycle.
+        """
+        if protocol_version is None:
+            protocol_version = self.protocol_version
+        table = self._tables.get(protocol_version)
+        if table is None:
+            with _LOCK:
+                table = self._tables.get(protocol_version)
+                if table is None:
+                    table = PacketTable(protocol_version, self._load_paths(protocol_version, ()))
+                    self._tables[protocol_version] = table
+        return table
+
+    def _load_paths(self, protocol_version: int, seen: tuple) -> dict:
+        """Return the merged packet maps of a version (mutable copy)."""
+        if protocol_version in seen:
+            raise ValueError(f"Version files form a cycle: {seen + (protocol_version,)}")
+        if protocol_version == self.protocol_version:
+            return {
+                state: {direction: dict(ids) for direction, ids in directions.items()}
+                for state, directions in self._registry.items()
+            }
+
+        try:
+            with open(self._version_file(protocol_version), "r") as f:
+                spec = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"Unsupported protocol version {protocol_version}")
+
+        paths = self._load_paths(spec.get("extends", self.protocol_version), seen + (protocol_version,))
+        for state, directions in spec.get("packets", {}).items():
+            for direction, ids in directions.items():
+                merged = paths.setdefault(state, {}).setdefault(direction, {})
+                for packet_id, full_path in ids.items():
+                    if full_path is None:
+                        merged.pop(packet_id, None)
+                    else:
+                        merged[packet_id] = full_path
+        return paths
+
+    def get_class(self, state: str, direction: str, packet_id: str):
+        """
+        Resolve a packet class of the default protocol version.
+
+        Args:
+            state: Protocol state.
+            direction: Packet direction.
+            packet_id: Packet identifier.
+
+        Returns:
+            Packet class.
+
+        Raises:
+            ValueError: If no packet matches the parameters.
+        """
+        return self.for_version().get_class(state, direction, packet_id)
+
+    def instantiate(
+        self,
+        state: str,
+        direction: str,
+        packet_id: str,
+        *args,
+        data: bytes = None,
+        **kwargs,
+    ):
+        """
+        Instantiate a packet of the default protocol version.
+
+        Args:
+            state: Protocol state.
+            direction: Packet direction.
+            packet_id: Packet identifier.
+            *args: Positional constructor arguments.
+            data: Raw payload of a received packet.
+            **kwargs: Keyword constructor arguments.
+
+        Returns:
+            Packet instance.
+        """
+        return self.for_version().instantiate(
+            state, direction, packet_id, *args, data=data, **kwargs
+        )
@@ -25,9 +25,9 @@ class PongResponse(Packet):
         Args:
             data (bytes | int): Raw packet data from server or a direct timestamp.
         """
-        super().__init__(VarInt(0x01))
+        super().__init__(VarInt._trusted(0x01))
 
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             self.timestamp = Long.from_bytes(data).value
         else:
             self.timestamp = int(data)
@@ -5,6 +5,7 @@ from typing import List, Optional
 from codec.packets.packet import Packet
 from codec.data_types.primitives.varint import VarInt
 from codec.data_types.primitives.string import String
+from codec.data_types.complex.text_component import TextComponent
 
 
 class StatusResponse(Packet):
@@ -26,7 +27,7 @@ class StatusResponse(Packet):
         "max_players",
         "online_players",
         "sample_players",
-        "description",
+        "description_component",
         "favicon",
         "enforces_secure_chat",
     )
@@ -38,7 +39,7 @@ class StatusResponse(Packet):
         Args:
             data (bytes): Raw packet data containing a single String field.
         """
-        super().__init__(VarInt(0x00))
+        super().__init__(VarInt._trusted(0x00))
 
         # Deserialize the JSON string
         string_field, _ = String.from_bytes(data)
@@ -58,20 +59,37 @@ class StatusResponse(Packet):
         self.online_players: int = players.get("online", 0)
         self.sample_players: Optional[List[dict]] = players.get("sample", [])
 
-        # Description (can be complex JSON)
+        # Description: a text component (string, object or list), rendered by `description`
         description_field = obj.get("description")
-        if isinstance(description_field, dict) and "text" in description_field:
-            self.description: str = description_field["text"]
-        else:
-            # fallback: serialize object as string
-            self.description: str = (
-                json.dumps(description_field) if description_field else ""
-            )
+        self.description_component: Optional[TextComponent] = (
+            TextComponent(description_field, form="json")
+            if description_field is not None
+            else None
+        )
 
         # Optional fields
         self.favicon: Optional[str] = obj.get("favicon")
         self.enforces_secure_chat: bool = obj.get("enforcesSecureChat", False)
 
+    @property
+    def description(self) -> str:
+        """Return the description as plain text, rendered on first access."""
+        component = self.description_component
+        return component.plain_text if component is not None else ""
+
+    @classmethod
+    def from_status(cls, status: dict) -> "StatusResponse":
+        """
+        Build a response from a status object, as a server would send it.
+
+        Args:
+            status (dict): Status object (version, players, description, ...).
+
+        Returns:
+            StatusResponse: Packet carrying the JSON-encoded status.
+        """
+        return cls(bytes(String(json.dumps(status, separators=(",", ":")))))
+
     def _iter_fields(self):
         """Yield the JSON string as a single String field for serialization."""
         yield String(self._json_string)
@@ -1,9 +1,11 @@
 # src\codec\packets\status\serverbound\status_request.py
 
 from codec.packets.packet import Packet
+from codec.packets.frozen import frozen_packet
 from codec.data_types.primitives.varint import VarInt
 
 
+@frozen_packet
 class StatusRequest(Packet):
     """
     Status Request packet (serverbound).
@@ -13,13 +15,18 @@ class StatusRequest(Packet):
     Bound to: Server
 
     This packet has no fields. It is sent immediately after the handshake
-    to request the server status.
+    to request the server status. Its bytes are serialized once and cached.
     """
 
     __slots__ = ()
 
     def __init__(self) -> None:
-        super().__init__(packet_id=VarInt(0x00))
+        super().__init__(packet_id=VarInt._trusted(0x00))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatusRequest":
+        """Build the packet from its (empty) payload."""
+        return cls()
 
     def _iter_fields(self):
         """No fields to serialize. Return empty generator for compatibility."""
@@ -0,0 +1,289 @@
+# src/network/buffer_pool.py
+
+import asyncio
+from typing import List
+
+from codec.packets.constants import _MAX_UNCOMPRESSED_SERVERBOUND, _MAX_VARINT_3_BYTES
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_MAX_FREE_CHUNKS = 64
+_DEFAULT_WAIT_TIMEOUT = 5.0
+# One maximum-size frame plus its decompressed body
+_DEFAULT_CONNECTION_LIMIT = _MAX_VARINT_3_BYTES + _MAX_UNCOMPRESSED_SERVERBOUND
+
+
+class BudgetExceeded(ConnectionError):
+    """A memory budget cannot be met; the connection should be dropped."""
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class BufferPool:
+    """Global memory budget and pool of fixed-size receive chunks.
+
+    Every byte a connection buffers is reserved here first. When the global
+    budget is exhausted, `reserve` waits for other connections to release
+    memory; the waiting connection stops reading, so TCP flow control slows
+    its peer down. If nothing is released within `wait_timeout` the
+    reservation fails with `BudgetExceeded`.
+
+    Attributes:
+        chunk_size (int): Size of each pooled chunk.
+        max_bytes (int): Global budget.
+        reserved (int): Bytes currently reserved.
+        high_water (int): Largest `reserved` seen.
+        waits (int): Reservations that had to wait.
+        rejections (int): Reservations that failed.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        max_free_chunks: int = _DEFAULT_MAX_FREE_CHUNKS,
+        wait_timeout: float = _DEFAULT_WAIT_TIMEOUT,
+    ):
+        """
+        Initialize an empty pool.
+
+        Args:
+            chunk_size: Size of each receive chunk.
+            max_bytes: Global budget shared by all connections.
+            max_free_chunks: Released chunks kept for reuse.
+            wait_timeout: Seconds a reservation may wait for memory.
+        """
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.max_free_chunks = max_free_chunks
+        self.wait_timeout = wait_timeout
+        self.reserved = 0
+        self.high_water = 0
+        self.waits = 0
+        self.rejections = 0
+        self._free: List[bytearray] = []
+        self._waiters: List[asyncio.Future] = []
+        self._waiting = 0  # reservations inside their wait loop
+
+    async def reserve(self, size: int) -> None:
+        """
+        Reserve `size` bytes of the global budget, waiting if needed.
+
+        Args:
+            size: Number of bytes.
+
+        Raises:
+            BudgetExceeded: If the budget is not available within `wait_timeout`.
+        """
+        if self.reserved + size > self.max_bytes:
+            if size > self.max_bytes:
+                self.rejections += 1
+                raise BudgetExceeded(f"Reservation of {size} bytes exceeds the global budget")
+            self.waits += 1
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.wait_timeout
+            self._waiting += 1
+            try:
+                while self.reserved + size > self.max_bytes:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        self.rejections += 1
+                        raise BudgetExceeded("Global memory budget exhausted")
+                    waiter = loop.create_future()
+                    self._waiters.append(waiter)
+                    # Awaiting the future itself (not `wait_for`) never turns a
+                    # cancellation that races with `release` into a result
+                    timer = loop.call_later(remaining, _wake, waiter)
+                    try:
+                        await waiter
+                    finally:
+                        timer.cancel()
+                        if waiter in self._waiters:
+                            self._waiters.remove(waiter)
+            finally:
+                self._waiting -= 1
+
+        self.reserved += size
+        if self.reserved > self.high_water:
+            self.high_water = self.reserved
+
+    def try_reserve(self, size: int) -> bool:
+        """
+        Reserve `size` bytes if that fits the budget now, without waiting.
+
+        For synchronous callers that can fall back to memory outside the
+        pool. Never overtakes reservations that are already waiting.
+
+        Args:
+            size: Number of bytes.
+
+        Returns:
+            bool: Whether the bytes were reserved.
+        """
+        if self._waiting or self.reserved + size > self.max_bytes:
+            return False
+        self.reserved += size
+        if self.reserved > self.high_water:
+            self.high_water = self.reserved
+        return True
+
+    def release(self, size: int) -> None:
+        """
+        Return `size` reserved bytes and wake waiting reservations.
+
+        Args:
+            size: Number of bytes.
+        """
+        self.reserved -= size
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            _wake(waiter)
+
+    def take_chunk(self) -> bytearray:
+        """Return a chunk of `chunk_size` bytes (`reserve` or `try_reserve` it first)."""
+        return self._free.pop() if self._free else bytearray(self.chunk_size)
+
+    def give_chunk(self, chunk: bytearray) -> None:
+        """Return a chunk for reuse (release its reservation separately)."""
+        if len(self._free) < self.max_free_chunks:
+            self._free.append(chunk)
+
+    def stats(self) -> dict:
+        """
+        Return pool occupancy counters.
+
+        Returns:
+            dict: Reserved/free bytes, high-water mark, waits and rejections.
+        """
+        return {
+            "chunk_size": self.chunk_size,
+            "max_bytes": self.max_bytes,
+            "reserved_bytes": self.reserved,
+            "high_water_bytes": self.high_water,
+            "free_chunks": len(self._free),
+            "waiting": len(self._waiters),
+            "waits": self.waits,
+            "rejections": self.rejections,
+        }
+
+
+class ConnectionBudget:
+    """Per-connection memory budget drawing on a shared `BufferPool`.
+
+    Attributes:
+        pool (BufferPool): Global pool.
+        limit (int): Bytes this connection may hold at once.
+        in_use (int): Bytes currently reserved.
+        high_water (int): Largest `in_use` seen.
+    """
+
+    __slots__ = ("pool", "limit", "in_use", "high_water")
+
+    def __init__(self, pool: BufferPool, limit: int = _DEFAULT_CONNECTION_LIMIT):
+        """
+        Initialize the budget.
+
+        Args:
+            pool: Global pool.
+            limit: Per-connection budget; the default fits one maximum-size
+                frame together with its decompressed serverbound body.
+        """
+        self.pool = pool
+        self.limit = limit
+        self.in_use = 0
+        self.high_water = 0
+
+    async def reserve(self, size: int) -> None:
+        """
+        Reserve `size` bytes against this connection and the pool.
+
+        Args:
+            size: Number of bytes.
+
+        Raises:
+            BudgetExceeded: If either budget cannot be met.
+        """
+        if self.in_use + size > self.limit:
+            raise BudgetExceeded(
+                f"Connection budget of {self.limit} bytes exceeded ({self.in_use} + {size})"
+            )
+        await self.pool.reserve(size)
+        self.in_use += size
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+
+    def release(self, size: int) -> None:
+        """
+        Release `size` bytes reserved with `reserve`.
+
+        Args:
+            size: Number of bytes.
+        """
+        self.in_use -= size
+        self.pool.release(size)
+
+    async def read_chunked(self, reader: asyncio.StreamReader, length: int) -> bytes:
+        """
+        Read a `length`-byte frame, keeping `length` bytes reserved for it.
+
+        Everything the read will hold at its peak is reserved before
+        anything is buffered, so every admitted frame can complete without
+        waiting for more memory and connections cannot deadlock on
+        half-read frames. Frames larger than one chunk are read into pooled
+        chunks, taken as data arrives, so the stream reader's own buffer
+        stays within its limit instead of growing to the frame size. The
+        decoders and zlib need the frame contiguous, so the chunks are
+        joined once it is complete and then returned to the pool: the peak
+        (the rounded-up chunks plus the joined copy) is what is reserved.
+
+        The returned frame stays reserved: the caller releases `length`
+        bytes once it has consumed the frame. If the read fails or is
+        cancelled, everything is released before the error propagates.
+
+        Args:
+            reader: Stream to read from.
+            length: Frame length.
+
+        Returns:
+            bytes: The frame.
+
+        Raises:
+            BudgetExceeded: If a budget cannot be met.
+            asyncio.IncompleteReadError: If the stream ends first.
+        """
+        pool = self.pool
+        if length <= pool.chunk_size:
+            await self.reserve(length)
+            try:
+                return await reader.readexactly(length)
+            except BaseException:
+                self.release(length)
+                raise
+
+        chunked = -(-length // pool.chunk_size) * pool.chunk_size
+        await self.reserve(chunked + length)
+        chunks: List[memoryview] = []
+        try:
+            remaining = length
+            while remaining:
+                size = min(remaining, pool.chunk_size)
+                chunk = memoryview(pool.take_chunk())
+                chunks.append(chunk)
+                chunk[:size] = await reader.readexactly(size)
+                remaining -= size
+            tail = length - (len(chunks) - 1) * pool.chunk_size
+            frame = b"".join(chunks[:-1] + [chunks[-1][:tail]])
+        except BaseException:
+            self.release(chunked + length)
+            raise
+        finally:
+            for chunk in chunks:
+                buffer = chunk.obj
+                chunk.release()
+                pool.give_chunk(buffer)
+        # The chunks are back in the pool; only the joined frame stays reserved
+        self.release(chunked)
+        return frame
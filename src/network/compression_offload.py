@@ -0,0 +1,134 @@
+# src/network/compression_offload.py
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from network.packet_codec import decompress_body
+
+# Bodies at least this large (uncompressed bytes) leave the event loop
+_DEFAULT_OFFLOAD_SIZE = 128 * 1024
+
+
+class CompressionOffload:
+    """Size-based policy that moves large zlib work off the event loop.
+
+    zlib releases the GIL, so compressing or inflating a multi-megabyte body
+    in a worker thread keeps the loop responsive. Bodies smaller than
+    `min_size` stay inline, where a thread hop would cost more than it saves.
+
+    Ordering is the caller's concern: `serialize` may return a future, and
+    `Connection` queues such futures so frames are written in send order.
+
+    Attributes:
+        min_size (int): Smallest uncompressed body that is offloaded.
+        offloaded (int): Number of compress/decompress jobs run in the pool.
+        inline (int): Number of compress/decompress jobs run inline.
+    """
+
+    def __init__(
+        self,
+        min_size: int = _DEFAULT_OFFLOAD_SIZE,
+        max_workers: int = 2,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            min_size: Smallest uncompressed body size that is offloaded.
+            max_workers: Pool size when no executor is given.
+            executor: Existing executor to share between policies.
+        """
+        if min_size < 0:
+            raise ValueError("min_size must be >= 0")
+        self.min_size = min_size
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcprotocol-zlib"
+        )
+        self.offloaded = 0
+        self.inline = 0
+
+    def should_offload(self, size: int) -> bool:
+        """
+        Return whether a body of `size` uncompressed bytes is offloaded.
+
+        Args:
+            size: Uncompressed body size.
+
+        Returns:
+            True if the work runs in the thread pool.
+        """
+        return size >= self.min_size
+
+    def serialize(
+        self,
+        packet: Packet,
+        compression_threshold: Optional[int],
+        packet_id: Optional[VarInt] = None,
+    ) -> Union[bytes, asyncio.Future]:
+        """
+        Serialize a packet, compressing large bodies in the pool.
+
+        Frozen packets are returned from their cache. Must be called from a
+        running event loop.
+
+        Args:
+            packet: Packet to serialize.
+            compression_threshold: Connection compression threshold.
+            packet_id: Wire ID to write instead of the packet's own.
+
+        Returns:
+            The framed bytes, or a future resolving to them when compression
+            was offloaded.
+        """
+        if packet.frozen:
+            return packet.serialize(compression_threshold, packet_id)
+
+        body = packet.encode_body(packet_id)
+        if (
+            compression_threshold is None
+            or len(body) < compression_threshold
+            or not self.should_offload(len(body))
+        ):
+            if compression_threshold is not None and len(body) >= compression_threshold:
+                self.inline += 1
+            return Packet.frame(body, compression_threshold)
+
+        self.offloaded += 1
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, Packet.frame, body, compression_threshold
+        )
+
+    async def decompress(self, payload: bytes, data_length: int) -> bytes:
+        """
+        Inflate a compressed body, in the pool when it is large.
+
+        Args:
+            payload: zlib-compressed body.
+            data_length: Uncompressed length announced by the frame.
+
+        Returns:
+            Uncompressed body.
+        """
+        if not self.should_offload(data_length):
+            self.inline += 1
+            return decompress_body(payload, data_length)
+
+        self.offloaded += 1
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, decompress_body, payload, data_length
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the pool if this policy created it.
+
+        Args:
+            wait: Wait for running jobs to finish.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
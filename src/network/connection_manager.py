@@ -0,0 +1,715 @@
+# src/network/connection_manager.py
+
+import asyncio
+from collections import deque
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Type, Union
+
+from codec.packets.registry import PacketRegistry
+from codec.packets.packet import Packet
+from codec.data_types.primitives.long import Long
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.constants import _MAX_VARINT_3_BYTES
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.status.serverbound.status_request import StatusRequest
+from codec.packets.status.serverbound.ping_request import PingRequest
+from codec.packets.status.clientbound.status_response import StatusResponse
+from codec.packets.status.clientbound.pong_response import PongResponse
+from network.packet_codec import PacketCodec, decompress_body
+from network.compression_offload import CompressionOffload
+from network.legacy_ping import (
+    LEGACY_PING_BYTE,
+    LEGACY_PING_PREFIX,
+    LEGACY_SNIFF_TIMEOUT,
+    LegacyPingResponder,
+    looks_like_legacy_ping,
+)
+from network.status_responder import StatusResponder
+from network.buffer_pool import _DEFAULT_CONNECTION_LIMIT, BufferPool, BudgetExceeded, ConnectionBudget
+from network.stream_serializer import serialize_streaming
+from network.timer_wheel import Timer, TimerWheel
+
+_LOGGER = logging.getLogger(__name__)
+
+# Handshake intent -> next state (Transfer continues with Login)
+_INTENT_STATES = {1: "Status", 2: "Login", 3: "Login"}
+
+# (state, serverbound packet class path) -> state entered once the packet is
+# handled; keyed by class so packet IDs can differ between protocol versions
+_TRANSITIONS = {
+    ("Login", "codec.packets.login.serverbound.login_acknowledged.LoginAcknowledged"): "Configuration",
+    (
+        "Configuration",
+        "codec.packets.configuration.serverbound.finish_configuration.FinishConfiguration",
+    ): "Play",
+    (
+        "Play",
+        "codec.packets.play.serverbound.configuration_acknowledged.ConfigurationAcknowledged",
+    ): "Configuration",
+}
+
+# State -> clientbound keep-alive class path; the packet ID comes from the
+# connection's protocol table
+_KEEPALIVE_PATHS = {
+    "Configuration": "codec.packets.configuration.clientbound.keep_alive.KeepAlive",
+    "Play": "codec.packets.play.clientbound.keep_alive.KeepAlive",
+}
+
+Handler = Callable[["Connection", Packet], Union[None, Awaitable[None]]]
+
+
+class Connection(PacketCodec):
+    """A protocol connection over asyncio streams."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        compression_threshold: Optional[int] = None,
+        initial_state: str = "Handshaking",
+        role: str = "server",
+        registry: Optional[PacketRegistry] = None,
+        offload: Optional[CompressionOffload] = None,
+        budget: Optional[ConnectionBudget] = None,
+    ):
+        """
+        Initialize the connection.
+
+        Args:
+            reader: Stream to read packets from.
+            writer: Stream to write packets to.
+            compression_threshold: Compression threshold if enabled.
+            initial_state: Initial protocol state.
+            role: "server" for accepted connections, "client" for outgoing ones.
+            registry: Packet registry used for packet resolution.
+            offload: Policy moving large compress/decompress work to threads.
+            budget: Memory budget; frames and decompressed bodies are
+                reserved against it before being buffered and stay reserved
+                until the next `read_frame` (or `close`).
+        """
+        super().__init__(compression_threshold, initial_state, role, registry)
+        self.reader = reader
+        self.writer = writer
+        self.offload = offload
+        self.budget = budget
+        self.peername = writer.get_extra_info("peername")
+        # `TimerWheel.ticks` of the last frame read, and the connection's timers
+        self.last_read = 0
+        self.timers: Dict[str, Timer] = {}
+        # Frames waiting behind an offloaded compression, in send order
+        self._pending: Deque[Union[bytes, asyncio.Future]] = deque()
+        # Bytes consumed by `peek` and not yet returned by `read_frame`
+        self._peeked = b""
+        # Budget bytes held by the last frame and its body until the next read
+        self._held = 0
+
+    async def peek(self, size: int, timeout: Optional[float] = None) -> bytes:
+        """
+        Return up to `size` next bytes without consuming them for `read_frame`.
+
+        Waits for the first byte, then up to `timeout` seconds for the rest.
+
+        Args:
+            size: Bytes wanted.
+            timeout: Longest wait after the first byte; no wait if None.
+
+        Returns:
+            Between 1 and `size` bytes (fewer if they did not arrive in time
+            or the stream ended).
+
+        Raises:
+            ConnectionError: If the stream closes before the first byte.
+        """
+        if not self._peeked:
+            try:
+                self._peeked = await self.reader.readexactly(1)
+            except asyncio.IncompleteReadError as exc:
+                raise ConnectionError("Stream closed before first byte") from exc
+        if timeout is not None and len(self._peeked) < size:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while len(self._peeked) < size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    more = await asyncio.wait_for(self.reader.read(size - len(self._peeked)), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if not more:
+                    break
+                self._peeked += more
+        return self._peeked[:size]
+
+    async def peek_byte(self) -> int:
+        """
+        Return the next byte without consuming it for `read_frame`.
+
+        Returns:
+            The next byte of the stream.
+
+        Raises:
+            ConnectionError: If the stream closes first.
+        """
+        return (await self.peek(1))[0]
+
+    async def read_frame(self) -> bytes:
+        """
+        Read one packet frame.
+
+        Reading the next frame releases the budget held by the previous one
+        and its inflated body, which must have been consumed by then.
+
+        Returns:
+            Packet body (Packet ID + Data) without the length prefix.
+
+        Raises:
+            ConnectionError: If the stream closes unexpectedly.
+            BudgetExceeded: If buffering the frame exceeds the memory budget.
+            ValueError: If the packet length is invalid.
+        """
+        self._release_held()
+        try:
+            length = 0
+            for shift in (0, 7, 14):
+                if self._peeked:
+                    byte, self._peeked = self._peeked[0], self._peeked[1:]
+                else:
+                    byte = (await self.reader.readexactly(1))[0]
+                length |= (byte & 0x7F) << shift
+                if byte & 0x80 == 0:
+                    break
+            else:
+                raise ValueError("VarInt length exceeds 3 bytes")
+
+            if length > _MAX_VARINT_3_BYTES:
+                raise ValueError(f"Packet length too large: {length}")
+
+            # Peeked bytes past the length prefix start the frame
+            head, self._peeked = self._peeked[:length], self._peeked[length:]
+            if self.budget is None:
+                return head + await self.reader.readexactly(length - len(head))
+            frame = head + await self.budget.read_chunked(self.reader, length - len(head))
+            self._held = length - len(head)
+            return frame
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("Stream closed while reading packet") from exc
+
+    async def inflate(self, frame: bytes) -> bytes:
+        """
+        Return the uncompressed body of a frame returned by `read_frame`.
+
+        With a budget the body stays reserved, like the frame, until the
+        next `read_frame`.
+
+        Args:
+            frame: Frame bytes without the Packet Length prefix.
+
+        Returns:
+            Packet body (Packet ID + Data).
+
+        Raises:
+            BudgetExceeded: If the decompressed size exceeds the memory budget.
+        """
+        data_length, payload = self._split_frame(frame)
+        if data_length == 0:
+            return payload
+        budget = self.budget
+        if budget is None:
+            return await self._decompress(payload, data_length)
+        await budget.reserve(data_length)
+        try:
+            body = await self._decompress(payload, data_length)
+        except BaseException:
+            budget.release(data_length)
+            raise
+        self._held += data_length
+        return body
+
+    def _release_held(self) -> None:
+        """Release the budget held by the last frame and its body."""
+        if self._held:
+            self.budget.release(self._held)
+            self._held = 0
+
+    async def _decompress(self, payload: bytes, data_length: int) -> bytes:
+        """Inflate a compressed body, in a worker thread if offloaded."""
+        if self.offload is not None:
+            return await self.offload.decompress(payload, data_length)
+        return decompress_body(payload, data_length)
+
+    def decode(self, body: bytes) -> Packet:
+        """
+        Decode an uncompressed packet body.
+
+        Args:
+            body: Packet body (Packet ID + Data).
+
+        Returns:
+            Decoded packet instance.
+        """
+        return self._decode_body(body)
+
+    async def read(self) -> Packet:
+        """
+        Read and decode an inbound packet.
+
+        Returns:
+            Decoded packet instance.
+        """
+        return self._decode_body(await self.inflate(await self.read_frame()))
+
+    def send(self, packet_id: str, **kwargs) -> None:
+        """
+        Queue an outbound packet for writing.
+
+        Args:
+            packet_id: Packet identifier.
+            **kwargs: Packet fields.
+        """
+        self.send_packet(self._build_packet(packet_id, **kwargs))
+
+    def send_packet(self, packet: Packet) -> None:
+        """
+        Queue an already constructed packet for writing.
+
+        Args:
+            packet: Packet instance.
+        """
+        packet_id = self._outbound_id(packet)
+        if self.offload is None:
+            self.write(packet.serialize(self.compression_threshold, packet_id))
+        else:
+            self.write(self.offload.serialize(packet, self.compression_threshold, packet_id))
+
+    def send_streaming(self, packet: Packet) -> None:
+        """
+        Queue a large packet, serializing it with `serialize_streaming`.
+
+        The body is compressed field by field into chunks of the budget's
+        pool, reserved in its global budget until the frame is written
+        (fresh chunks without a budget or once it is exhausted), instead
+        of being built whole; worth it for multi-megabyte packets such as
+        chunk batches or registry data.
+
+        Args:
+            packet: Packet instance.
+        """
+        pool = self.budget.pool if self.budget is not None else None
+        frame = serialize_streaming(packet, self.compression_threshold, pool, packet_id=self._outbound_id(packet))
+        if self._pending:
+            self.write(bytes(frame))
+            frame.release()
+        else:
+            frame.write_to(self.writer)
+
+    def write(self, data: Union[bytes, asyncio.Future]) -> None:
+        """
+        Queue framed bytes, or a future resolving to them, for writing.
+
+        Frames are written in call order even when an earlier one is still
+        being compressed in a worker thread.
+
+        Args:
+            data: Serialized frame or a future producing it.
+        """
+        if isinstance(data, asyncio.Future):
+            self._pending.append(data)
+            data.add_done_callback(self._flush_pending)
+        elif self._pending:
+            self._pending.append(data)
+        else:
+            self.writer.write(data)
+
+    def _flush_pending(self, _: Optional[asyncio.Future] = None) -> None:
+        """Write queued frames up to the first unfinished compression."""
+        while self._pending:
+            head = self._pending[0]
+            if isinstance(head, asyncio.Future):
+                if not head.done():
+                    return
+                if head.cancelled() or head.exception() is not None:
+                    _LOGGER.debug(
+                        "Dropping %s: frame serialization failed", self.peername
+                    )
+                    self._pending.clear()
+                    self.close()
+                    return
+                head = head.result()
+            self._pending.popleft()
+            if not self.writer.is_closing():
+                self.writer.write(head)
+
+    async def drain(self) -> None:
+        """Wait for queued compressions, then for the write buffer to drain."""
+        while self._pending:
+            futures = [
+                item for item in self._pending if isinstance(item, asyncio.Future)
+            ]
+            if futures:
+                await asyncio.wait(futures)
+            self._flush_pending()
+        await self.writer.drain()
+
+    def close(self) -> None:
+        """Close the underlying transport."""
+        self._release_held()
+        self.writer.close()
+
+    def is_closing(self) -> bool:
+        """
+        Return whether the connection is closed or closing.
+
+        Returns:
+            True once `close` was called or the peer went away.
+        """
+        return self.writer.is_closing()
+
+
+class ConnectionManager:
+    """Accepts inbound connections and drives their protocol state machine.
+
+    Each accepted connection starts in Handshaking. The `Intention` packet
+    moves it to Status or Login; Login, Configuration and Play transitions
+    follow the serverbound acknowledgement packets. Decoded packets are
+    dispatched to handlers registered per packet class. Packets listed in
+    the registry but not implemented yet are dropped, while their packet
+    ID still drives state transitions.
+
+    The handshake binds each connection to the registry table of the
+    protocol version it announces; tables are built on first use and shared
+    by all connections on that version. Status is answered for any version,
+    while Login with an unsupported version drops the connection.
+
+    With a `BufferPool`, frames larger than one pool chunk are read into
+    pooled chunks reserved against a per-connection and a global budget;
+    exhausting the global budget pauses reading (backpressure) and a budget
+    that cannot be met drops the connection.
+
+    Handshake deadlines, read-idle timeouts and keepalive emission in
+    Configuration and Play run on one shared `TimerWheel` rather than an
+    asyncio timer per connection. Reads only stamp `Connection.last_read`
+    with the wheel's tick; the idle timer checks the stamp when it fires and
+    re-arms itself for the remaining time, so traffic never touches the wheel.
+
+    When a `LegacyPingResponder` is configured, the first bytes of every
+    connection are sniffed (`FE`, `FE 01` or `FE 01 FA`, as vanilla does;
+    a modern 254-byte frame also starts with `FE 01`) and Legacy Server
+    List Pings are answered from its prebuilt buffer instead of entering
+    the modern read loop.
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 25565,
+        status_provider: Optional[Callable[[], dict]] = None,
+        registry: Optional[PacketRegistry] = None,
+        backlog: int = 1024,
+        offload: Optional[CompressionOffload] = None,
+        legacy_responder: Optional[LegacyPingResponder] = None,
+        buffer_pool: Optional[BufferPool] = None,
+        connection_budget: int = _DEFAULT_CONNECTION_LIMIT,
+        timers: Optional[TimerWheel] = None,
+        handshake_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        keepalive_interval: Optional[float] = None,
+        reuse_port: bool = False,
+        status_responder: Optional[StatusResponder] = None,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on (0 picks a free port).
+            status_provider: If given, Status requests and pings are answered
+                automatically with the status object it returns.
+            registry: Packet registry shared by all connections.
+            backlog: Listen backlog.
+            offload: Compression offload policy shared by all connections.
+            legacy_responder: Answers Legacy Server List Pings; without it they
+                are treated as malformed modern packets.
+            buffer_pool: Global memory budget and receive-chunk pool. Without
+                it large frames are buffered contiguously and unbounded.
+            connection_budget: Bytes each connection may buffer at once
+                (used with `buffer_pool`).
+            timers: Timer wheel shared by all connections; created when a
+                timeout or keepalive is configured.
+            handshake_timeout: Seconds a connection may stay in Handshaking.
+            read_timeout: Seconds without a received frame before a
+                connection is dropped.
+            keepalive_interval: Seconds between clientbound keep-alives in
+                Configuration and Play.
+            reuse_port: Bind with `SO_REUSEPORT` so several processes can
+                listen on the same port (see `network.prefork`).
+            status_responder: Builds the Status Response frames for
+                `status_provider`'s objects from a prebuilt template instead
+                of constructing a `StatusResponse` per request.
+        """
+        self.host = host
+        self.port = port
+        self.status_provider = status_provider
+        self.registry = registry if registry is not None else PacketRegistry()
+        self.backlog = backlog
+        self.offload = offload
+        self.legacy_responder = legacy_responder
+        self.buffer_pool = buffer_pool
+        self.connection_budget = connection_budget
+        if timers is None and (handshake_timeout or read_timeout or keepalive_interval):
+            timers = TimerWheel()
+        self.timers = timers
+        self.handshake_timeout = handshake_timeout
+        self.read_timeout = read_timeout
+        self.keepalive_interval = keepalive_interval
+        self.reuse_port = reuse_port
+        self.status_responder = status_responder
+        self.accepted = 0
+        self.frames = 0
+        # (protocol version, state) -> keep-alive packet ID, None if unlisted
+        self._keepalive_ids: Dict[tuple, Optional[int]] = {}
+        self.connections: Set[Connection] = set()
+        self._handlers: Dict[Type[Packet], Handler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Read-loop tasks, cancelled by `close` (they may be waiting for memory)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def add_handler(self, packet_cls: Type[Packet], handler: Handler) -> None:
+        """
+        Register a handler for a packet class.
+
+        Args:
+            packet_cls: Packet class to handle.
+            handler: Callable receiving `(connection, packet)`; may be a coroutine function.
+        """
+        self._handlers[packet_cls] = handler
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            self.host,
+            self.port,
+            backlog=self.backlog,
+            reuse_port=self.reuse_port or None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start listening if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and close every open connection."""
+        if self._server is not None:
+            self._server.close()
+        for connection in list(self.connections):
+            connection.close()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def shutdown(self, drain_timeout: float) -> None:
+        """
+        Stop accepting, let open connections finish, then close.
+
+        Args:
+            drain_timeout: Seconds to wait for connections to end on their own
+                before the remaining ones are closed.
+        """
+        if self._server is not None:
+            self._server.close()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + drain_timeout
+        while self.connections and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+        await self.close()
+
+    def stats(self) -> dict:
+        """
+        Return connection counters.
+
+        Returns:
+            dict: Accepted connections, open connections and frames read.
+        """
+        return {
+            "accepted": self.accepted,
+            "open_connections": len(self.connections),
+            "frames": self.frames,
+        }
+
+    def memory_stats(self) -> dict:
+        """
+        Return buffer-pool occupancy and per-connection high-water marks.
+
+        Returns:
+            dict: `BufferPool.stats()` plus the largest current and
+            high-water per-connection usage; empty without a buffer pool.
+        """
+        if self.buffer_pool is None:
+            return {}
+        budgets = [c.budget for c in self.connections if c.budget is not None]
+        stats = self.buffer_pool.stats()
+        stats["connection_max_in_use"] = max((b.in_use for b in budgets), default=0)
+        stats["connection_max_high_water"] = max((b.high_water for b in budgets), default=0)
+        return stats
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run the read loop of one accepted connection."""
+        budget = None
+        if self.buffer_pool is not None:
+            budget = ConnectionBudget(self.buffer_pool, self.connection_budget)
+        connection = Connection(
+            reader, writer, registry=self.registry, offload=self.offload, budget=budget
+        )
+        self.connections.add(connection)
+        self.accepted += 1
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        timers = self.timers
+        try:
+            if timers is not None:
+                self._arm_timers(connection)
+            if self.legacy_responder is not None:
+                head = await connection.peek(1)
+                if head[0] == LEGACY_PING_BYTE:
+                    head = await connection.peek(len(LEGACY_PING_PREFIX), LEGACY_SNIFF_TIMEOUT)
+                if looks_like_legacy_ping(head):
+                    await self.legacy_responder.respond(reader, writer)
+                    return
+            while not connection.is_closing():
+                frame = await connection.read_frame()
+                self.frames += 1
+                if timers is not None:
+                    connection.last_read = timers.ticks
+                await self._process(connection, frame)
+                await connection.drain()
+        except asyncio.CancelledError:
+            pass  # `close`; finishing normally keeps asyncio's stream callback quiet
+        except BudgetExceeded as exc:
+            _LOGGER.debug("Dropping %s: %s", connection.peername, exc)
+        except ConnectionError:
+            pass
+        except ValueError as exc:
+            _LOGGER.debug("Dropping %s: %s", connection.peername, exc)
+        finally:
+            self.connections.discard(connection)
+            self._tasks.discard(task)
+            for timer in connection.timers.values():
+                timer.cancel()
+            connection.close()
+
+    async def _process(self, connection: Connection, frame: bytes) -> None:
+        """Decode, dispatch and apply the state transition for one frame."""
+        state = connection.state
+        body = await connection.inflate(frame)
+        packet_id = VarInt.from_bytes(body, 0)[0].value
+        try:
+            packet = connection.decode(body)
+        except ImportError:
+            packet = None  # listed in the registry, not implemented yet
+
+        if packet is not None:
+            handler = self._handlers.get(type(packet))
+            if handler is not None:
+                result = handler(connection, packet)
+                if inspect.isawaitable(result):
+                    await result
+            elif state == "Status" and self.status_provider is not None:
+                self._answer_status(connection, packet)
+
+        if state == "Handshaking":
+            if not isinstance(packet, Intention):
+                raise ValueError(f"Expected handshake, got packet ID {packet_id:#04x}")
+            next_state = _INTENT_STATES[packet.intent]
+            if next_state == "Status" and not self.registry.supports(packet.protocol_version):
+                # Status packets are the same in every version; answer any client
+                connection.protocol_version = packet.protocol_version
+            else:
+                connection.bind_version(packet.protocol_version)
+            connection.set_state(next_state)
+            timer = connection.timers.pop("handshake", None)
+            if timer is not None:
+                timer.cancel()
+            return
+
+        path = connection.packets.path(state, "serverbound", f"0x{packet_id:02X}")
+        next_state = _TRANSITIONS.get((state, path))
+        if next_state is not None:
+            connection.set_state(next_state)
+            if self.keepalive_interval and "keepalive" not in connection.timers:
+                connection.timers["keepalive"] = self.timers.schedule(
+                    self.keepalive_interval, self._send_keepalive, connection
+                )
+
+    def _arm_timers(self, connection: Connection) -> None:
+        """Start the handshake deadline and read-idle timer of a new connection."""
+        connection.last_read = self.timers.ticks
+        if self.handshake_timeout:
+            connection.timers["handshake"] = self.timers.schedule(
+                self.handshake_timeout, self._handshake_expired, connection
+            )
+        if self.read_timeout:
+            connection.timers["read"] = self.timers.schedule(
+                self.read_timeout, self._check_idle, connection
+            )
+
+    def _handshake_expired(self, connection: Connection) -> None:
+        """Drop a connection that did not complete the handshake in time."""
+        connection.timers.pop("handshake", None)
+        if connection.state == "Handshaking":
+            _LOGGER.debug("Dropping %s: handshake timed out", connection.peername)
+            connection.close()
+
+    def _check_idle(self, connection: Connection) -> None:
+        """Drop an idle connection, or re-arm for the rest of the timeout."""
+        idle = (self.timers.ticks - connection.last_read) * self.timers.tick
+        if idle >= self.read_timeout:
+            _LOGGER.debug("Dropping %s: read timed out", connection.peername)
+            connection.timers.pop("read", None)
+            connection.close()
+        else:
+            connection.timers["read"] = self.timers.schedule(
+                self.read_timeout - idle, self._check_idle, connection
+            )
+
+    def _send_keepalive(self, connection: Connection) -> None:
+        """Send a keep-alive in Configuration or Play and schedule the next one."""
+        if connection.is_closing():
+            connection.timers.pop("keepalive", None)
+            return
+        state = connection.state
+        key = (connection.packets.protocol_version, state)
+        if key not in self._keepalive_ids:
+            path = _KEEPALIVE_PATHS.get(state)
+            packet_id = path and connection.packets.packet_id(state, "clientbound", path)
+            self._keepalive_ids[key] = int(packet_id, 16) if packet_id else None
+        packet_id = self._keepalive_ids[key]
+        if packet_id is not None:
+            # Keep-alive classes are listed in the registry but not implemented yet
+            body = bytes(VarInt._trusted(packet_id)) + bytes(Long._trusted(int(time.time() * 1000)))
+            connection.write(Packet.frame(body, connection.compression_threshold))
+        connection.timers["keepalive"] = self.timers.schedule(
+            self.keepalive_interval, self._send_keepalive, connection
+        )
+
+    def _answer_status(self, connection: Connection, packet: Packet) -> None:
+        """Reply to Status requests and pings using `status_provider`."""
+        if isinstance(packet, StatusRequest):
+            if self.status_responder is not None:
+                connection.write(self.status_responder.response_for(self.status_provider()))
+            else:
+                connection.send_packet(StatusResponse.from_status(self.status_provider()))
+        elif isinstance(packet, PingRequest):
+            connection.send_packet(PongResponse(packet.timestamp))
+            connection.close()
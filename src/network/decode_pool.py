@@ -0,0 +1,314 @@
+# src/network/decode_pool.py
+
+import os
+import queue
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
+
+from codec.packets.packet import Packet
+from network.packet_codec import PacketCodec
+
+# Worker shutdown marker
+_STOP = object()
+
+# Frames one stream may have submitted and not yet returned by `get`
+_DEFAULT_MAX_PENDING = 256
+
+
+class _DecodeContext:
+    """Snapshot of the codec state a frame is decoded with.
+
+    Borrows `PacketCodec`'s decode methods, so workers never read the live
+    codec: a later state change or `bind_version` only affects frames
+    submitted after it. `DecodeStream.get` re-decodes a frame whose snapshot
+    no longer `matches` the codec when its turn comes.
+    """
+
+    __slots__ = ("compression_threshold", "packets", "_state", "_inbound")
+
+    _split_frame = PacketCodec._split_frame
+    _inflate = PacketCodec._inflate
+    _decode_body = PacketCodec._decode_body
+
+    def __init__(self, codec: PacketCodec):
+        self.compression_threshold = codec.compression_threshold
+        self.packets = codec.packets
+        self._state = codec.state
+        self._inbound = codec._inbound
+
+    def matches(self, codec: PacketCodec) -> bool:
+        """Whether the codec still has this snapshot's state, IDs and threshold."""
+        return (
+            self._state == codec.state
+            and self.packets is codec.packets
+            and self.compression_threshold == codec.compression_threshold
+        )
+
+    def decode(self, frame: bytes) -> Packet:
+        return self._decode_body(self._inflate(frame))
+
+
+class DecodeStream:
+    """Frames of one connection, decoded by the pool and returned in order.
+
+    `submit` records the connection's current state and compression
+    threshold with the frame; `get` returns packets in submission order
+    whatever order the workers finish in. A frame that failed to decode
+    raises its error from `get`, in its turn.
+
+    Workers decode with the state a frame was submitted under, so frames
+    submitted behind a packet that switches state or enables compression
+    (Login Success, Set Compression, Finish Configuration, ...) are decoded
+    with the old one. `get` checks each frame's snapshot against the codec
+    as the consumer left it after the previous packet and decodes the frame
+    again, on the calling thread, if they differ; the reader can submit
+    ahead freely and only the frames in flight across a switch pay twice.
+
+    At most `max_pending` frames are submitted and not yet returned; `submit`
+    blocks the reader beyond that until the consumer catches up.
+
+    Attributes:
+        max_pending (int): Bound on frames in flight.
+        redecoded (int): Frames decoded again after a state change.
+    """
+
+    def __init__(self, pool: "DecodePool", codec: PacketCodec, max_pending: int = _DEFAULT_MAX_PENDING):
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.pool = pool
+        self.codec = codec
+        self.max_pending = max_pending
+        self.redecoded = 0
+        self._next_submit = 0
+        self._next_get = 0
+        self._done: Dict[int, tuple] = {}
+        self._ready = threading.Condition()
+        self._closed = False
+        self._context: Optional[_DecodeContext] = None
+
+    def submit(self, frame: bytes) -> None:
+        """
+        Queue a frame (without its Packet Length prefix) for decoding.
+
+        Must be called from one thread per stream: the reader. Blocks while
+        `max_pending` frames are in flight.
+
+        Args:
+            frame: Frame bytes.
+
+        Raises:
+            ConnectionError: If the stream was closed.
+        """
+        context = self._context
+        codec = self.codec
+        if context is None or not context.matches(codec):
+            context = self._context = _DecodeContext(codec)
+        with self._ready:
+            while self._next_submit - self._next_get >= self.max_pending and not self._closed:
+                self._ready.wait()
+            if self._closed:
+                raise ConnectionError("Decode stream closed")
+            sequence = self._next_submit
+            self._next_submit += 1
+        self.pool._jobs.put((self, sequence, context, frame))
+
+    def close(self) -> None:
+        """Mark the end of input; `get` raises `ConnectionError` once drained.
+
+        Also releases a reader blocked in `submit`.
+        """
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Packet:
+        """
+        Return the next packet in submission order, waiting for it.
+
+        The packet is decoded again with the codec's current state if that
+        differs from the state it was submitted under.
+
+        Args:
+            timeout: Longest wait in seconds; unbounded if None.
+
+        Returns:
+            Decoded packet.
+
+        Raises:
+            ConnectionError: If the stream is closed and fully consumed.
+            TimeoutError: If the packet is not ready within `timeout`.
+            Exception: The frame's own decode error.
+        """
+        with self._ready:
+            sequence = self._next_get
+            while sequence not in self._done:
+                if self._closed and sequence >= self._next_submit:
+                    raise ConnectionError("Decode stream closed")
+                if not self._ready.wait(timeout):
+                    raise TimeoutError("Decoded packet not ready")
+            packet, error, context, frame = self._done.pop(sequence)
+            self._next_get += 1
+            # Wake the reader waiting for room, and the next getter
+            self._ready.notify_all()
+        if not context.matches(self.codec):
+            self.redecoded += 1
+            try:
+                packet, error = _DecodeContext(self.codec).decode(frame), None
+            except Exception as exc:
+                packet, error = None, exc
+        if error is not None:
+            raise error
+        return packet
+
+    def __iter__(self) -> Iterator[Packet]:
+        """Yield packets in order until the stream is closed and drained."""
+        while True:
+            try:
+                yield self.get()
+            except ConnectionError:
+                return
+
+    def pump(self, read_frame: Callable[[], bytes]) -> None:
+        """
+        Submit frames from `read_frame` until it raises, then close.
+
+        Typically run in the connection's reader thread with
+        `PacketIO.read_frame`. Frames behind a state switch need no special
+        care: `get` re-decodes them.
+
+        Args:
+            read_frame: Returns the next frame; raises at end of input.
+        """
+        try:
+            while True:
+                self.submit(read_frame())
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            self.close()
+
+    @property
+    def pending(self) -> int:
+        """Frames submitted and not yet returned by `get`."""
+        return self._next_submit - self._next_get
+
+    def _complete(
+        self,
+        sequence: int,
+        packet: Optional[Packet],
+        error: Optional[BaseException],
+        context: _DecodeContext,
+        frame: bytes,
+    ) -> None:
+        with self._ready:
+            self._done[sequence] = (packet, error, context, frame)
+            if sequence == self._next_get:
+                self._ready.notify_all()
+
+
+class DecodePool:
+    """Worker threads decoding frames of many connections in parallel.
+
+    Each connection gets a `DecodeStream`; all streams share one job queue,
+    so workers balance across connections while every stream still returns
+    its packets in order.
+
+    Decoding is CPU-bound Python, so with the GIL only zlib inflation
+    (which releases it) runs in parallel. On free-threaded builds
+    (3.13t/3.14t) whole decodes do. What workers share is safe there:
+    `PacketRegistry` and `PacketTable` build tables and resolve classes
+    under locks, `PACKET_CACHE` is locked, primitives keep no mutable
+    module state, and each decoded packet (with its lazy NBT and text
+    component caches) belongs to one thread until `get` hands it over.
+
+    Example:
+        >>> pool = DecodePool(workers=8)
+        >>> stream = pool.stream(io)
+        >>> threading.Thread(target=stream.pump, args=(io.read_frame,)).start()
+        >>> for packet in stream:
+        ...     handle(packet)
+    """
+
+    def __init__(self, workers: int = os.cpu_count() or 1):
+        """
+        Start the worker threads.
+
+        Args:
+            workers: Number of decode threads.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.decoded = 0
+        self.failed = 0
+        self._jobs: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._counter_lock = threading.Lock()
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._run, name=f"mcprotocol-decode-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stream(self, codec: PacketCodec, max_pending: int = _DEFAULT_MAX_PENDING) -> DecodeStream:
+        """
+        Return an ordered decode stream for a connection.
+
+        Args:
+            codec: The connection (any `PacketCodec`); its state is read at
+                each `submit` and `get`.
+            max_pending: Frames the stream may have in flight before
+                `submit` blocks.
+
+        Returns:
+            DecodeStream: The connection's stream.
+        """
+        return DecodeStream(self, codec, max_pending)
+
+    def close(self) -> None:
+        """Stop the workers after the queued frames."""
+        for _ in self._threads:
+            self._jobs.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> dict:
+        """
+        Return pool counters.
+
+        Returns:
+            dict: Workers, frames decoded and failed, queued frames.
+        """
+        return {
+            "workers": self.workers,
+            "decoded": self.decoded,
+            "failed": self.failed,
+            "queued": self._jobs.qsize(),
+        }
+
+    def _run(self) -> None:
+        jobs = self._jobs
+        decoded = failed = 0
+        while True:
+            job = jobs.get()
+            if job is _STOP:
+                break
+            stream, sequence, context, frame = job
+            try:
+                packet = context.decode(frame)
+            except Exception as exc:
+                failed += 1
+                stream._complete(sequence, None, exc, context, frame)
+            else:
+                decoded += 1
+                stream._complete(sequence, packet, None, context, frame)
+            if decoded + failed >= 64 or jobs.empty():
+                decoded, failed = self._publish(decoded, failed)
+        self._publish(decoded, failed)
+
+    def _publish(self, decoded: int, failed: int) -> tuple:
+        """Add a worker's local counts to the totals; return zeroed counts."""
+        with self._counter_lock:
+            self.decoded += decoded
+            self.failed += failed
+        return 0, 0
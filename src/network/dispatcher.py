@@ -0,0 +1,175 @@
+# src/network/dispatcher.py
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Type
+import zlib
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from codec.packets.registry import PacketTable
+from network.packet_codec import PacketCodec
+
+Handler = Callable[[PacketCodec, Packet], object]
+TimingHook = Callable[[str, Type[Packet], Handler, int], None]
+
+# Bytes of a compressed body inflated to read its Packet ID (a VarInt)
+_ID_PREFIX = 5
+
+
+class PacketDispatcher:
+    """Routes inbound frames to handlers through per-state arrays.
+
+    Handlers register per (state, packet class). For each packet table and
+    state a flat list indexed by packet ID is built on first use, so
+    routing a frame is one VarInt read and one list index. Frames without
+    a handler are skipped before their packet is constructed: uncompressed
+    ones after reading the ID, compressed ones after inflating just the
+    first few bytes.
+
+    Packet IDs come from the connection's bound `PacketTable`, so one
+    dispatcher serves connections on different protocol versions. A class
+    the version does not have in that state is simply never routed.
+
+    Example:
+        >>> dispatcher = PacketDispatcher()
+        >>> @dispatcher.on("Status", PongResponse)
+        ... def pong(io, packet):
+        ...     print(packet.timestamp)
+        >>> dispatcher.run(io)
+
+    Attributes:
+        timing (Optional[TimingHook]): Called after each handler with
+            `(state, packet class, handler, elapsed ns)`.
+        dispatched (int): Frames passed to a handler.
+        skipped (int): Frames dropped without decoding.
+    """
+
+    def __init__(self, timing: Optional[TimingHook] = None):
+        """
+        Initialize an empty dispatcher.
+
+        Args:
+            timing: Optional per-handler timing hook.
+        """
+        self.timing = timing
+        self.dispatched = 0
+        self.skipped = 0
+        self._handlers: Dict[str, Dict[Type[Packet], Handler]] = {}
+        # (table, state, direction) -> [(packet class, handler) or None] by packet ID
+        self._routes: Dict[Tuple[PacketTable, str, str], List[Optional[tuple]]] = {}
+
+    def on(self, state: str, packet_cls: Type[Packet]) -> Callable[[Handler], Handler]:
+        """
+        Decorator registering a handler for a packet class in a state.
+
+        Args:
+            state: Protocol state the packet is received in.
+            packet_cls: Packet class to handle.
+
+        Returns:
+            Decorator returning the handler unchanged.
+        """
+
+        def register(handler: Handler) -> Handler:
+            self.add_handler(state, packet_cls, handler)
+            return handler
+
+        return register
+
+    def add_handler(self, state: str, packet_cls: Type[Packet], handler: Handler) -> None:
+        """
+        Register (or replace) the handler of a packet class in a state.
+
+        Args:
+            state: Protocol state.
+            packet_cls: Packet class to handle.
+            handler: Callable receiving `(codec, packet)`.
+        """
+        self._handlers.setdefault(state, {})[packet_cls] = handler
+        self._routes.clear()
+
+    def routes(self, table: PacketTable, state: str, direction: str) -> List[Optional[tuple]]:
+        """
+        Return the route array of a table and state, building it on first use.
+
+        Args:
+            table: Packet table of the connection's version.
+            state: Protocol state.
+            direction: Inbound direction of the connection.
+
+        Returns:
+            list: `(packet class, handler)` or None, indexed by packet ID.
+        """
+        key = (table, state, direction)
+        routes = self._routes.get(key)
+        if routes is not None:
+            return routes
+
+        by_id = {}
+        for packet_cls, handler in self._handlers.get(state, {}).items():
+            packet_id = table.packet_id(state, direction, f"{packet_cls.__module__}.{packet_cls.__qualname__}")
+            if packet_id is not None:
+                by_id[int(packet_id, 16)] = (packet_cls, handler)
+        routes = [None] * (max(by_id, default=-1) + 1)
+        for index, route in by_id.items():
+            routes[index] = route
+        self._routes[key] = routes
+        return routes
+
+    def dispatch(self, codec: PacketCodec, frame: bytes) -> bool:
+        """
+        Decode a frame and call its handler, or skip it if it has none.
+
+        Args:
+            codec: Connection the frame was read from.
+            frame: Frame bytes without the Packet Length prefix.
+
+        Returns:
+            True if a handler ran, False if the frame was skipped.
+
+        Raises:
+            ValueError: If the frame violates the protocol.
+        """
+        state = codec.state
+        routes = self.routes(codec.packets, state, codec._inbound)
+        data_length, payload = codec._split_frame(frame)
+        head = payload if data_length == 0 else zlib.decompressobj().decompress(payload, _ID_PREFIX)
+        packet_id, size = VarInt.from_bytes(head, 0)
+
+        index = packet_id.value
+        route = routes[index] if index < len(routes) else None
+        if route is None:
+            self.skipped += 1
+            return False
+
+        packet_cls, handler = route
+        body = payload if data_length == 0 else codec._inflate(frame)
+        packet = packet_cls.from_bytes(body[size:])
+        self.dispatched += 1
+        if self.timing is None:
+            handler(codec, packet)
+        else:
+            start = time.perf_counter_ns()
+            handler(codec, packet)
+            self.timing(state, packet_cls, handler, time.perf_counter_ns() - start)
+        return True
+
+    def run(self, io, stop: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Dispatch frames read from a blocking transport until it closes.
+
+        Handlers see the state as it is after the previous packet, so a
+        handler calling `set_state` changes the routing of the next frame.
+
+        Args:
+            io: Transport with `read_frame()`, e.g. `PacketIO`.
+            stop: Checked before each read; the loop ends when it returns True.
+
+        Raises:
+            ValueError: If a frame violates the protocol.
+        """
+        try:
+            while stop is None or not stop():
+                self.dispatch(io, io.read_frame())
+        except ConnectionError:
+            pass
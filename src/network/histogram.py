@@ -0,0 +1,184 @@
+# src/network/histogram.py
+
+from array import array
+from typing import Optional
+
+_DEFAULT_SUB_BUCKET_BITS = 8  # values below 256 exact, then ~0.4% relative error
+_DEFAULT_HIGHEST_VALUE = 60 * 10**9  # 60 s in nanoseconds
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of non-negative integer values.
+
+    Values below `2**sub_bucket_bits` are counted exactly. Above that, each
+    power of two is split into `2**(sub_bucket_bits - 1)` equal buckets, so
+    the relative error is bounded by `2**-(sub_bucket_bits - 1)` while memory
+    stays a few thousand counters regardless of the sample count. Exact
+    minimum and maximum are tracked separately; values above
+    `highest_value` are clamped into the last bucket.
+
+    Attributes:
+        count (int): Number of recorded values.
+        min (Optional[int]): Smallest recorded value.
+        max (Optional[int]): Largest recorded value.
+    """
+
+    def __init__(
+        self,
+        highest_value: int = _DEFAULT_HIGHEST_VALUE,
+        sub_bucket_bits: int = _DEFAULT_SUB_BUCKET_BITS,
+    ):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            highest_value: Largest value tracked with full precision.
+            sub_bucket_bits: Precision; higher is more precise and larger.
+        """
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be >= 2")
+        self.highest_value = highest_value
+        self.sub_bucket_bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts = array("Q", bytes(8 * (self._index(highest_value) + 1)))
+        self._total = 0
+        self.count = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        """Return the bucket index of `value`."""
+        exponent = value.bit_length() - self.sub_bucket_bits
+        if exponent <= 0:
+            return value
+        return (exponent + 1) * self._half + (value >> exponent) - self._half
+
+    def _value_at(self, index: int) -> int:
+        """Return the midpoint of the values mapped to bucket `index`."""
+        if index < 2 * self._half:
+            return index
+        exponent = index // self._half - 1
+        low = (index % self._half + self._half) << exponent
+        return low + ((1 << exponent) >> 1)
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Record `value` `count` times.
+
+        Args:
+            value: Non-negative value (e.g. nanoseconds).
+            count: Number of occurrences.
+
+        Raises:
+            ValueError: If `value` is negative.
+        """
+        if value < 0:
+            raise ValueError(f"Histogram values must be >= 0, got {value}")
+        self._counts[self._index(min(value, self.highest_value))] += count
+        self.count += count
+        self._total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add all values of a histogram with the same layout.
+
+        Args:
+            other: Histogram to merge in.
+
+        Raises:
+            ValueError: If the layouts differ.
+        """
+        if (other.highest_value, other.sub_bucket_bits) != (
+            self.highest_value,
+            self.sub_bucket_bits,
+        ):
+            raise ValueError("Cannot merge histograms with different layouts")
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+        self.count += other.count
+        self._total += other._total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    @property
+    def word_count(self) -> int:
+        """Number of unsigned 64-bit words written by `store`."""
+        return len(self._counts) + 4
+
+    def store(self, words: memoryview) -> None:
+        """
+        Copy the histogram into a `"Q"` memoryview, e.g. over shared memory.
+
+        Args:
+            words: At least `word_count` unsigned 64-bit words.
+        """
+        words[0] = self.count
+        words[1] = self._total
+        words[2] = self.min or 0
+        words[3] = self.max or 0
+        words[4 : self.word_count] = self._counts
+
+    def load(self, words: memoryview) -> None:
+        """
+        Replace the contents with a histogram written by `store`.
+
+        Args:
+            words: Words written by a histogram with the same layout.
+        """
+        self.count, self._total = words[0], words[1]
+        self.min = words[2] if self.count else None
+        self.max = words[3] if self.count else None
+        self._counts = array("Q", words[4 : self.word_count].tobytes())
+
+    def mean(self) -> float:
+        """Return the exact mean of recorded values (0.0 when empty)."""
+        return self._total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        Return the value at `percent` (0-100), within the bucket precision.
+
+        Args:
+            percent: Percentile to compute.
+
+        Returns:
+            Approximate value; 0 when empty.
+        """
+        if not self.count:
+            return 0
+        if percent >= 100:
+            return self.max
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(max(self._value_at(index), self.min), self.max)
+        return self.max
+
+    def summary(self, scale: float = 1e-6) -> dict:
+        """
+        Return min/p50/p90/p99/max/mean, multiplied by `scale`.
+
+        Args:
+            scale: Unit conversion; the default turns nanoseconds into milliseconds.
+
+        Returns:
+            dict: Summary statistics.
+        """
+        return {
+            "count": self.count,
+            "min": (self.min or 0) * scale,
+            "p50": self.percentile(50) * scale,
+            "p90": self.percentile(90) * scale,
+            "p99": self.percentile(99) * scale,
+            "max": (self.max or 0) * scale,
+            "mean": self.mean() * scale,
+        }
@@ -0,0 +1,155 @@
+# src/network/latency_probe.py
+
+"""Pipelined ping probe.
+
+Run from `src/` against a server's Status endpoint:
+    python -m network.latency_probe HOST [PORT] --samples 100
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.status.serverbound.ping_request import PingRequest as StatusPingRequest
+from codec.packets.play.serverbound.ping_request import PingRequest as PlayPingRequest
+from network.connection_manager import Connection
+from network.histogram import LatencyHistogram
+
+# state -> (ping request class, pong response class path)
+_PROBES = {
+    "Status": (StatusPingRequest, "codec.packets.status.clientbound.pong_response.PongResponse"),
+    "Play": (PlayPingRequest, "codec.packets.play.clientbound.pong_response.PongResponse"),
+}
+
+
+class LatencyProbe:
+    """Measures round-trip time with pipelined ping requests.
+
+    All pings are written back to back, each carrying its own
+    `time.perf_counter_ns()` send time, and pongs are matched by payload as
+    they arrive, so one slow pong does not delay the others. Frames that are
+    not pongs (chunks, keep-alives, ...) are skipped without being decoded.
+
+    In Status the server answers on its network thread, which gives the
+    network RTT; in Play the pong is sent from the game loop, so the
+    difference between the two approximates server tick lag. Vanilla servers
+    close Status connections after the first pong, so pipelining only pays
+    off in Play there.
+
+    Pongs are recognized by the wire ID the connection's bound version
+    (`Connection.packets`) gives the pong class.
+
+    Attributes:
+        histogram (LatencyHistogram): RTTs in nanoseconds.
+        lost (int): Pings of the last run that were never answered.
+    """
+
+    def __init__(
+        self, connection: Connection, histogram: Optional[LatencyHistogram] = None
+    ):
+        """
+        Attach the probe to a client connection.
+
+        Args:
+            connection: Client connection in the Status or Play state.
+            histogram: Histogram to record into; a new one by default.
+
+        Raises:
+            ValueError: If the connection is not a client in Status or Play.
+        """
+        if connection.role != "client" or connection.state not in _PROBES:
+            raise ValueError("LatencyProbe needs a client connection in Status or Play")
+        self.connection = connection
+        self.histogram = histogram if histogram is not None else LatencyHistogram()
+        self.lost = 0
+
+    async def run(self, count: int = 100, timeout: float = 5.0) -> LatencyHistogram:
+        """
+        Send `count` pipelined pings and record each matched pong.
+
+        Args:
+            count: Number of pings.
+            timeout: Seconds to wait for outstanding pongs.
+
+        Returns:
+            LatencyHistogram: The probe histogram.
+
+        Raises:
+            ValueError: If the bound version has no pong in the current state.
+        """
+        connection = self.connection
+        ping_cls, pong_path = _PROBES[connection.state]
+        pong_id = connection.packets.packet_id(connection.state, "clientbound", pong_path)
+        if pong_id is None:
+            raise ValueError(
+                f"Protocol {connection.packets.protocol_version} has no {connection.state} pong response"
+            )
+        pong_id = int(pong_id, 16)
+        outstanding = set()
+        payload = 0
+        for _ in range(count):
+            payload = max(time.perf_counter_ns(), payload + 1)
+            outstanding.add(payload)
+            connection.send_packet(ping_cls(payload))
+        await connection.drain()
+
+        try:
+            await asyncio.wait_for(self._collect(outstanding, pong_id), timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        self.lost = len(outstanding)
+        return self.histogram
+
+    async def _collect(self, outstanding: set, pong_id: int) -> None:
+        """Read frames until every outstanding ping is answered."""
+        connection = self.connection
+        while outstanding:
+            body = await connection.inflate(await connection.read_frame())
+            received = time.perf_counter_ns()
+            if VarInt.from_bytes(body, 0)[0].value != pong_id:
+                continue
+            timestamp = connection.decode(body).timestamp
+            if timestamp in outstanding:
+                outstanding.remove(timestamp)
+                self.histogram.record(received - timestamp)
+
+
+async def _probe_status(
+    host: str, port: int, samples: int, protocol_version: Optional[int] = None
+) -> LatencyHistogram:
+    """Probe a Status endpoint with one ping per connection.
+
+    The handshake announces `protocol_version` (the registry's default
+    version when None), and the connection is bound to it.
+    """
+    histogram = LatencyHistogram()
+    for _ in range(samples):
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = Connection(reader, writer, role="client")
+        if protocol_version is not None:
+            connection.bind_version(protocol_version)
+        connection.send_packet(Intention(connection.packets.protocol_version, host, port, 1))
+        connection.set_state("Status")
+        await LatencyProbe(connection, histogram).run(count=1)
+        connection.close()
+    return histogram
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure Status ping RTT.")
+    parser.add_argument("host")
+    parser.add_argument("port", type=int, nargs="?", default=25565)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--protocol", type=int, default=None, help="protocol version to announce")
+    args = parser.parse_args()
+
+    histogram = asyncio.run(_probe_status(args.host, args.port, args.samples, args.protocol))
+    for name, value in histogram.summary().items():
+        print(f"{name:>5}: {value:.3f}" if isinstance(value, float) else f"{name:>5}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# src/network/legacy_ping.py
+
+import asyncio
+import socket
+import time
+from typing import Optional
+
+from codec.data_types.primitives.unsigned_short import UnsignedShort
+
+# First byte of a Legacy Server List Ping. A modern Packet Length of 254
+# also starts with it (FE 01), so the bytes after it decide: see
+# `looks_like_legacy_ping`
+LEGACY_PING_BYTE = 0xFE
+# 1.6 ping prefix: ping, payload 1, plugin message
+LEGACY_PING_PREFIX = b"\xfe\x01\xfa"
+# Seconds to wait for the rest of the prefix after a first 0xFE (pre-1.6
+# clients send only FE or FE 01)
+LEGACY_SNIFF_TIMEOUT = 0.1
+
+_KICK_PACKET_ID = b"\xff"
+_DRAIN_TIMEOUT = 0.1  # seconds to absorb the rest of the request before closing
+_DRAIN_SIZE = 512
+_SNIFF_POLL = 0.005
+
+
+def looks_like_legacy_ping(head: bytes) -> bool:
+    """
+    Tell a legacy ping from a modern handshake by its first bytes.
+
+    As in vanilla: `FE` alone (Beta 1.8 - 1.3), `FE 01` alone (1.4 - 1.5)
+    or `FE 01 FA` (1.6) is a legacy ping. Anything else, e.g. a modern
+    254-byte handshake `FE 01 00 ...`, is not.
+
+    Args:
+        head: Up to the first three bytes of the connection, as many as
+            arrived within `LEGACY_SNIFF_TIMEOUT`.
+
+    Returns:
+        True if the client opened with a Legacy Server List Ping.
+    """
+    if not head or head[0] != LEGACY_PING_BYTE:
+        return False
+    if len(head) == 1:
+        return True
+    if head[1] != LEGACY_PING_PREFIX[1]:
+        return False
+    return len(head) == 2 or head[2] == LEGACY_PING_PREFIX[2]
+
+
+def is_legacy_ping(sock: socket.socket) -> bool:
+    """
+    Peek at the first bytes of an accepted socket without consuming them.
+
+    Blocks until the client sends something; after a first 0xFE, waits up
+    to `LEGACY_SNIFF_TIMEOUT` for the rest of the legacy prefix. Modern
+    handshakes stay in the socket buffer for the regular `PacketIO` path.
+
+    Args:
+        sock: Accepted TCP socket.
+
+    Returns:
+        True if the client opened with a Legacy Server List Ping.
+
+    Raises:
+        ConnectionError: If the socket closes before sending anything.
+    """
+    head = sock.recv(len(LEGACY_PING_PREFIX), socket.MSG_PEEK)
+    if not head:
+        raise ConnectionError("Socket closed before first byte")
+    if head[0] != LEGACY_PING_BYTE:
+        return False
+
+    deadline = time.monotonic() + LEGACY_SNIFF_TIMEOUT
+    timeout = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        while len(head) < len(LEGACY_PING_PREFIX) and time.monotonic() < deadline:
+            time.sleep(_SNIFF_POLL)
+            try:
+                head = sock.recv(len(LEGACY_PING_PREFIX), socket.MSG_PEEK) or head
+            except BlockingIOError:
+                continue
+    finally:
+        sock.settimeout(timeout)
+    return looks_like_legacy_ping(head)
+
+
+class LegacyPingResponder:
+    """Answers Legacy Server List Pings (Minecraft <= 1.6) from a prebuilt buffer.
+
+    The reply is a Kick packet (0xFF) carrying a UTF-16BE string:
+        §1\\0<protocol>\\0<version>\\0<motd>\\0<online>\\0<max>
+
+    The buffer is rebuilt only when `update` receives different values, so
+    each ping costs one small write.
+    """
+
+    def __init__(
+        self,
+        protocol_version: int = 127,
+        version_name: str = "",
+        motd: str = "",
+        online_players: int = 0,
+        max_players: int = 0,
+    ):
+        """
+        Build the initial response.
+
+        Args:
+            protocol_version: Protocol number shown to legacy clients.
+            version_name: Version name shown to legacy clients.
+            motd: Plain-text message of the day.
+            online_players: Online player count.
+            max_players: Maximum player count.
+        """
+        self._fields: Optional[tuple] = None
+        self._response = b""
+        self.update(protocol_version, version_name, motd, online_players, max_players)
+
+    @property
+    def response(self) -> bytes:
+        """Return the current serialized Kick packet."""
+        return self._response
+
+    def update(
+        self,
+        protocol_version: int,
+        version_name: str,
+        motd: str,
+        online_players: int,
+        max_players: int,
+    ) -> bool:
+        """
+        Set the advertised status, rebuilding the buffer only if it changed.
+
+        Args:
+            protocol_version: Protocol number shown to legacy clients.
+            version_name: Version name shown to legacy clients.
+            motd: Plain-text message of the day.
+            online_players: Online player count.
+            max_players: Maximum player count.
+
+        Returns:
+            True if the buffer was rebuilt.
+        """
+        fields = (protocol_version, version_name, motd, online_players, max_players)
+        if fields == self._fields:
+            return False
+
+        text = "§1\x00" + "\x00".join(str(field) for field in fields)
+        encoded = text.encode("utf-16-be")
+        self._response = (
+            _KICK_PACKET_ID + bytes(UnsignedShort(len(encoded) >> 1)) + encoded
+        )
+        self._fields = fields
+        return True
+
+    def update_from_status(self, status: dict) -> bool:
+        """
+        Set the advertised status from a modern status object.
+
+        Args:
+            status: Status object as sent in `StatusResponse`.
+
+        Returns:
+            True if the buffer was rebuilt.
+        """
+        version = status.get("version", {})
+        players = status.get("players", {})
+        description = status.get("description", "")
+        if isinstance(description, dict):
+            description = description.get("text", "")
+        return self.update(
+            version.get("protocol", 127),
+            version.get("name", ""),
+            description,
+            players.get("online", 0),
+            players.get("max", 0),
+        )
+
+    def respond_socket(self, sock: socket.socket) -> None:
+        """
+        Answer a legacy ping on a blocking socket and close it.
+
+        Args:
+            sock: Socket for which `is_legacy_ping` returned True.
+        """
+        try:
+            sock.sendall(self._response)
+            # Consume the request so closing sends FIN instead of RST
+            sock.settimeout(_DRAIN_TIMEOUT)
+            sock.recv(_DRAIN_SIZE)
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+    async def respond(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer a legacy ping on asyncio streams and close them.
+
+        Args:
+            reader: Stream the ping arrived on.
+            writer: Stream to answer on.
+        """
+        writer.write(self._response)
+        try:
+            # Consume the request so closing sends FIN instead of RST
+            await asyncio.wait_for(reader.read(_DRAIN_SIZE), _DRAIN_TIMEOUT)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
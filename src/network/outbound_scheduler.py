@@ -0,0 +1,324 @@
+# src/network/outbound_scheduler.py
+
+from collections import deque
+import threading
+import time
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from codec.packets.frozen import FrozenPacket
+from codec.packets.packet import Packet
+from network.histogram import LatencyHistogram
+
+CONTROL = "control"
+NORMAL = "normal"
+BULK = "bulk"
+
+_DEFAULT_WEIGHTS = {NORMAL: 4, BULK: 1}
+_DEFAULT_QUANTUM = 16 * 1024
+
+# Class path -> priority class; unlisted packets are NORMAL. Packets that
+# must stay ordered relative to each other share a class: chunk batches
+# with their chunks, forgets and light updates, and the block changes
+# (with their acknowledgement) that edit those chunks, which the client
+# would drop or see overwritten if they overtook the chunk.
+_DEFAULT_PRIORITIES = {
+    "codec.packets.configuration.clientbound.keep_alive.KeepAlive": CONTROL,
+    "codec.packets.configuration.clientbound.ping.Ping": CONTROL,
+    "codec.packets.configuration.clientbound.registry_data.RegistryData": BULK,
+    "codec.packets.configuration.serverbound.keep_alive.KeepAlive": CONTROL,
+    "codec.packets.play.clientbound.keep_alive.KeepAlive": CONTROL,
+    "codec.packets.play.clientbound.ping.Ping": CONTROL,
+    "codec.packets.play.clientbound.pong_response.PongResponse": CONTROL,
+    "codec.packets.play.clientbound.block_update.BlockUpdate": BULK,
+    "codec.packets.play.clientbound.section_blocks_update.SectionBlocksUpdate": BULK,
+    "codec.packets.play.clientbound.block_entity_data.BlockEntityData": BULK,
+    "codec.packets.play.clientbound.block_changed_ack.BlockChangedAck": BULK,
+    "codec.packets.play.clientbound.chunk_batch_start.ChunkBatchStart": BULK,
+    "codec.packets.play.clientbound.chunk_batch_finished.ChunkBatchFinished": BULK,
+    "codec.packets.play.clientbound.level_chunk_with_light.LevelChunkWithLight": BULK,
+    "codec.packets.play.clientbound.chunks_biomes.ChunksBiomes": BULK,
+    "codec.packets.play.clientbound.light_update.LightUpdate": BULK,
+    "codec.packets.play.clientbound.forget_level_chunk.ForgetLevelChunk": BULK,
+    "codec.packets.play.clientbound.set_chunk_cache_center.SetChunkCacheCenter": BULK,
+    "codec.packets.play.clientbound.set_chunk_cache_radius.SetChunkCacheRadius": BULK,
+    "codec.packets.play.serverbound.keep_alive.KeepAlive": CONTROL,
+    "codec.packets.play.serverbound.ping_request.PingRequest": CONTROL,
+}
+
+# Packets that switch state or compression, end the connection, or move
+# the player to another world or place (Respawn, a Game Event such as
+# "start waiting for level chunks", a teleport): nothing queued before them
+# may be sent after them, nor anything queued after them before them.
+# Chunks of the old dimension or position must not arrive after them, nor
+# those of the new one before them.
+_DEFAULT_BARRIERS = frozenset(
+    {
+        "codec.packets.login.clientbound.login_disconnect.LoginDisconnect",
+        "codec.packets.login.clientbound.login_finished.LoginFinished",
+        "codec.packets.login.clientbound.login_compression.LoginCompression",
+        "codec.packets.login.serverbound.login_acknowledged.LoginAcknowledged",
+        "codec.packets.configuration.clientbound.disconnect.Disconnect",
+        "codec.packets.configuration.clientbound.finish_configuration.FinishConfiguration",
+        "codec.packets.configuration.serverbound.finish_configuration.FinishConfiguration",
+        "codec.packets.play.clientbound.disconnect.Disconnect",
+        "codec.packets.play.clientbound.login.Login",
+        "codec.packets.play.clientbound.respawn.Respawn",
+        "codec.packets.play.clientbound.game_event.GameEvent",
+        "codec.packets.play.clientbound.player_position.PlayerPosition",
+        "codec.packets.play.clientbound.start_configuration.StartConfiguration",
+        "codec.packets.play.serverbound.configuration_acknowledged.ConfigurationAcknowledged",
+    }
+)
+
+_BUNDLE_DELIMITER = "codec.packets.play.clientbound.bundle_delimiter.BundleDelimiter"
+
+
+class _Epoch:
+    """Entries queued between two barriers, and the barrier closing them."""
+
+    __slots__ = ("queues", "barrier")
+
+    def __init__(self, classes: Tuple[str, ...]):
+        self.queues: Dict[str, deque] = {name: deque() for name in classes}
+        self.barrier: Optional[tuple] = None
+
+
+class OutboundScheduler:
+    """Priority classes and weighted fair interleaving for one connection.
+
+    Every queued packet falls in a priority class:
+
+    - `CONTROL` (keep-alives, pings) is served strictly first;
+    - the weighted classes (by default `NORMAL` 4 : `BULK` 1) share the
+      bandwidth by deficit round robin: each turn a class may send
+      `quantum * weight` bytes, and a frame larger than its credit puts
+      the class in debt, so one chunk burst yields to interactive traffic
+      after every frame instead of after the whole burst.
+
+    FIFO order holds within a class; packets of different classes may be
+    reordered. Protocol ordering is kept by two rules:
+
+    - barriers (state switches, compression changes, disconnects,
+      respawns, game events, teleports, flush markers) are sent after
+      everything queued before them and before everything queued after
+      them;
+    - packets between two Bundle Delimiters are queued as one unit, in
+      the most urgent class of their members, and sent back to back.
+
+    Producers call `append` from any thread; one consumer (the writer)
+    calls `popleft` and `charge`. Queueing delay (enqueue to dequeue) is
+    recorded per class.
+
+    Attributes:
+        priorities (dict): Class path -> priority class.
+        barriers (frozenset): Class paths treated as barriers.
+        weights (dict): Weighted class -> weight.
+        quantum (int): Bytes per weight unit and turn.
+        delay (dict[str, LatencyHistogram]): Queueing delay per class.
+    """
+
+    def __init__(
+        self,
+        priorities: Optional[Dict[str, str]] = None,
+        weights: Optional[Dict[str, int]] = None,
+        quantum: int = _DEFAULT_QUANTUM,
+        barriers: Optional[frozenset] = None,
+        bundle_delimiter: str = _BUNDLE_DELIMITER,
+    ):
+        """
+        Initialize empty queues.
+
+        Args:
+            priorities: Class path -> priority class; the defaults when None.
+            weights: Weighted class -> weight; `NORMAL` 4, `BULK` 1 when None.
+            quantum: Bytes granted per weight unit each round.
+            barriers: Class paths of barrier packets; the defaults when None.
+            bundle_delimiter: Class path of the Bundle Delimiter packet.
+        """
+        self.priorities = dict(_DEFAULT_PRIORITIES) if priorities is None else priorities
+        self.weights = dict(_DEFAULT_WEIGHTS) if weights is None else weights
+        if not self.weights or min(self.weights.values()) < 1 or CONTROL in self.weights:
+            raise ValueError("weights must map non-control classes to weights >= 1")
+        self.quantum = quantum
+        self.barriers = _DEFAULT_BARRIERS if barriers is None else barriers
+        self.bundle_delimiter = bundle_delimiter
+        self.classes = (CONTROL,) + tuple(self.weights)
+        self.delay = {name: LatencyHistogram() for name in self.classes}
+        self.sent = dict.fromkeys(self.classes, 0)
+        self.bytes = dict.fromkeys(self.classes, 0)
+
+        self._lock = threading.Lock()
+        self._epochs: Deque[_Epoch] = deque([_Epoch(self.classes)])
+        self._length = 0
+        # Open bundle: members queued so far (producer side)
+        self._bundle: Optional[List[tuple]] = None
+        # Consumer state: rest of the bundle being sent, DRR position and credit
+        self._group: Deque[tuple] = deque()
+        self._weighted = tuple(self.weights)
+        self._turn = 0
+        self._deficit = dict.fromkeys(self._weighted, 0)
+        self._last: Optional[str] = None
+        self._charge_last = False
+
+    def classify(self, item: object) -> Tuple[str, bool, bool]:
+        """
+        Return `(priority class, is barrier, is bundle delimiter)` of an item.
+
+        Packets are classified by class path (a `FrozenPacket` by the class
+        of the packet it wraps); flush markers (anything that is neither a
+        packet nor bytes) are barriers; raw frames are NORMAL.
+        """
+        if isinstance(item, Packet):
+            cls = type(item.packet) if isinstance(item, FrozenPacket) else type(item)
+            path = f"{cls.__module__}.{cls.__qualname__}"
+            return self.priorities.get(path, NORMAL), path in self.barriers, path == self.bundle_delimiter
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            return NORMAL, False, False
+        return CONTROL, True, False
+
+    def append(self, entry: tuple, priority: Optional[str] = None) -> None:
+        """
+        Queue an entry whose first element is the packet, frame or marker.
+
+        Args:
+            entry: Opaque tuple handed back by `popleft`.
+            priority: Priority class overriding the classification (e.g.
+                for raw frames).
+
+        Raises:
+            ValueError: If `priority` is not a known class.
+        """
+        item_priority, barrier, delimiter = self.classify(entry[0])
+        priority = priority or item_priority
+        if priority not in self.delay:
+            raise ValueError(f"Unknown priority class {priority!r}")
+        queued = (entry, priority, time.perf_counter_ns())
+        with self._lock:
+            self._length += 1
+            if self._bundle is not None:
+                self._bundle.append(queued)
+                if delimiter:
+                    group, self._bundle = self._bundle, None
+                    urgent = min((member[1] for member in group), key=self.classes.index)
+                    self._epochs[-1].queues[urgent].append(group)
+                return
+            if delimiter:
+                self._bundle = [queued]
+            elif barrier:
+                self._epochs[-1].barrier = queued
+                self._epochs.append(_Epoch(self.classes))
+            else:
+                self._epochs[-1].queues[priority].append(queued)
+
+    def popleft(self) -> tuple:
+        """
+        Return the next entry to send.
+
+        Raises:
+            IndexError: If nothing can be sent (empty, or only an open bundle).
+        """
+        with self._lock:
+            if self._group:
+                queued = self._group.popleft()
+            else:
+                epoch = self._epochs[0]
+                name = self._select(epoch)
+                if name is None:
+                    if epoch.barrier is None:
+                        raise IndexError("pop from an empty scheduler")
+                    queued, epoch.barrier = epoch.barrier, None
+                    self._epochs.popleft()
+                    self._charge_last = False
+                else:
+                    queued = epoch.queues[name].popleft()
+                    if isinstance(queued, list):
+                        self._group.extend(queued[1:])
+                        queued = queued[0]
+            self._length -= 1
+
+        entry, priority, enqueued = queued
+        self.delay[priority].record(time.perf_counter_ns() - enqueued)
+        self._last = priority
+        return entry
+
+    def charge(self, size: int) -> None:
+        """
+        Account the serialized size of the entry last returned by `popleft`.
+
+        Args:
+            size: Frame size in bytes.
+        """
+        priority = self._last
+        if priority is None:
+            return
+        self.sent[priority] += 1
+        self.bytes[priority] += size
+        if self._charge_last and priority in self._deficit:
+            self._deficit[priority] -= size
+
+    def _select(self, epoch: _Epoch) -> Optional[str]:
+        """Pick the class to serve next from an epoch (lock held)."""
+        queues = epoch.queues
+        if queues[CONTROL]:
+            self._charge_last = False
+            return CONTROL
+        active = [name for name in self._weighted if queues[name]]
+        if not active:
+            return None
+        if len(active) == 1:
+            # Alone: send freely and do not run up debt
+            self._deficit[active[0]] = max(self._deficit[active[0]], 0)
+            self._charge_last = False
+            return active[0]
+        self._charge_last = True
+        while True:
+            name = self._weighted[self._turn]
+            if queues[name]:
+                if self._deficit[name] > 0:
+                    return name
+            else:
+                self._deficit[name] = 0
+            self._turn = (self._turn + 1) % len(self._weighted)
+            upcoming = self._weighted[self._turn]
+            if queues[upcoming]:
+                self._deficit[upcoming] += self.quantum * self.weights[upcoming]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        """True if an entry can be popped (an open bundle cannot)."""
+        with self._lock:
+            if self._group:
+                return True
+            epoch = self._epochs[0]
+            return epoch.barrier is not None or any(epoch.queues.values())
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yield every queued entry (a snapshot, in no particular order)."""
+        with self._lock:
+            pending = list(self._group)
+            for epoch in self._epochs:
+                for queue in epoch.queues.values():
+                    for queued in queue:
+                        pending.extend(queued if isinstance(queued, list) else (queued,))
+                if epoch.barrier is not None:
+                    pending.append(epoch.barrier)
+            pending.extend(self._bundle or ())
+        return iter([queued[0] for queued in pending])
+
+    def stats(self) -> dict:
+        """
+        Return per-class counters and queueing delay.
+
+        Returns:
+            dict: `{class: {"sent", "bytes", "delay_*_ms"...}}` plus `"queued"`.
+        """
+        stats: dict = {"queued": self._length}
+        for name in self.classes:
+            stats[name] = {
+                "sent": self.sent[name],
+                "bytes": self.bytes[name],
+                **{f"delay_{key}_ms": value for key, value in self.delay[name].summary().items() if key != "count"},
+            }
+        return stats
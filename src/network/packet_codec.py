@@ -0,0 +1,276 @@
+# src/network/packet_codec.py
+
+from typing import Dict, Optional
+import zlib
+
+from codec.packets.registry import PacketRegistry
+from codec.packets.frozen import FrozenPacket
+from codec.packets.packet import Packet
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.constants import _MAX_VARINT_3_BYTES, _MAX_UNCOMPRESSED_SERVERBOUND
+
+_ROLES = ("client", "server")
+
+
+def decompress_body(payload: bytes, data_length: int) -> bytes:
+    """
+    Inflate a compressed packet body, refusing to expand past `data_length`.
+
+    Args:
+        payload: zlib-compressed body.
+        data_length: Uncompressed length announced by the frame.
+
+    Returns:
+        Uncompressed body (Packet ID + Data).
+
+    Raises:
+        ValueError: If the inflated size does not match `data_length`.
+    """
+    inflater = zlib.decompressobj()
+    body = inflater.decompress(payload, data_length)
+    if len(body) != data_length or inflater.unconsumed_tail:
+        raise ValueError(
+            f"Decompressed size mismatch: expected {data_length} bytes"
+        )
+    return body
+
+
+class PacketCodec:
+    """Role-aware packet encoding/decoding shared by all transports.
+
+    A client sends serverbound packets and receives clientbound ones; a
+    server does the opposite. Transports (blocking sockets, asyncio streams)
+    subclass this and only deal with moving bytes.
+
+    Outbound packets are written with the ID the bound version's table
+    gives their class (`_outbound_id`), not the ID hardcoded on the class,
+    so packets whose ID moved between versions are framed correctly.
+    """
+
+    def __init__(
+        self,
+        compression_threshold: Optional[int] = None,
+        initial_state: str = "Handshaking",
+        role: str = "client",
+        registry: Optional[PacketRegistry] = None,
+    ):
+        """
+        Initialize the codec state.
+
+        Args:
+            compression_threshold: Compression threshold if enabled.
+            initial_state: Initial protocol state.
+            role: "client" or "server".
+            registry: Packet registry used for packet resolution. A new one
+                is created if omitted; pass a shared instance when handling
+                many connections.
+
+        Raises:
+            ValueError: If the role is unknown.
+        """
+        if role not in _ROLES:
+            raise ValueError(f"role must be one of {_ROLES}, got {role!r}")
+
+        self.registry = registry if registry is not None else PacketRegistry()
+        # Packet table of the bound version, shared with other connections
+        self.packets = self.registry.for_version()
+        self.protocol_version: Optional[int] = None
+        self.compression_threshold = compression_threshold
+        self._state = initial_state
+        self._role = role
+        self._outbound = "serverbound" if role == "client" else "clientbound"
+        self._inbound = "clientbound" if role == "client" else "serverbound"
+        # (table, state, packet class) -> wire ID
+        self._outbound_ids: Dict[tuple, VarInt] = {}
+
+    @property
+    def state(self) -> str:
+        """
+        Return the current protocol state.
+
+        Returns:
+            Current state.
+        """
+        return self._state
+
+    @property
+    def role(self) -> str:
+        """
+        Return the connection role.
+
+        Returns:
+            "client" or "server".
+        """
+        return self._role
+
+    def set_state(self, new_state: str) -> None:
+        """
+        Set the current protocol state.
+
+        Args:
+            new_state: New protocol state.
+        """
+        self._state = new_state
+
+    def bind_version(self, protocol_version: int) -> None:
+        """
+        Resolve packets with the table of `protocol_version` from now on.
+
+        Args:
+            protocol_version: Protocol version announced in the handshake.
+
+        Raises:
+            ValueError: If the registry does not support the version.
+        """
+        self.packets = self.registry.for_version(protocol_version)
+        self.protocol_version = protocol_version
+
+    def _build_packet(self, packet_id: str, **kwargs) -> Packet:
+        """
+        Instantiate an outbound packet for the current state.
+
+        Args:
+            packet_id: Packet identifier.
+            **kwargs: Packet fields.
+
+        Returns:
+            Packet instance.
+        """
+        return self.packets.instantiate(
+            state=self._state,
+            direction=self._outbound,
+            packet_id=packet_id,
+            **kwargs,
+        )
+
+    def _outbound_id(self, packet: Packet) -> VarInt:
+        """
+        Return the wire ID of an outbound packet in the bound version and state.
+
+        Classes the default version does not list in this state (ad-hoc
+        packets) keep their own `packet_id`.
+
+        Args:
+            packet: Packet to send.
+
+        Returns:
+            VarInt: Packet ID to write.
+
+        Raises:
+            ValueError: If the default version lists the class in this state
+                but the bound version does not.
+        """
+        cls = type(packet.packet) if isinstance(packet, FrozenPacket) else type(packet)
+        key = (self.packets, self._state, cls)
+        packet_id = self._outbound_ids.get(key)
+        if packet_id is not None:
+            return packet_id
+
+        path = f"{cls.__module__}.{cls.__qualname__}"
+        wire_id = self.packets.packet_id(self._state, self._outbound, path)
+        if wire_id is not None:
+            packet_id = VarInt._trusted(int(wire_id, 16))
+        elif self.registry.for_version().packet_id(self._state, self._outbound, path) is not None:
+            raise ValueError(
+                f"{cls.__qualname__} is not a {self._state} {self._outbound} packet "
+                f"in protocol {self.packets.protocol_version}"
+            )
+        else:
+            packet_id = packet.packet_id
+        self._outbound_ids[key] = packet_id
+        return packet_id
+
+    def _encode_packet(self, packet_id: str, **kwargs) -> bytes:
+        """
+        Serialize an outbound packet.
+
+        Args:
+            packet_id: Packet identifier.
+            **kwargs: Packet fields.
+
+        Returns:
+            Serialized packet bytes.
+        """
+        packet = self._build_packet(packet_id, **kwargs)
+        return packet.serialize(self.compression_threshold, self._outbound_id(packet))
+
+    def _split_frame(self, frame: bytes) -> tuple[int, bytes]:
+        """
+        Split a received frame into its Data Length and payload.
+
+        Args:
+            frame: Frame bytes without the Packet Length prefix.
+
+        Returns:
+            `(data_length, payload)`. `data_length` is 0 when the payload is
+            the uncompressed body, which is always the case when compression
+            is disabled.
+
+        Raises:
+            ValueError: If Data Length violates the protocol limits.
+        """
+        if self.compression_threshold is None:
+            return 0, frame
+
+        data_length, size = VarInt.from_bytes(frame, 0)
+        value = data_length.value
+        if value and not (
+            self.compression_threshold <= value <= _MAX_UNCOMPRESSED_SERVERBOUND
+        ):
+            raise ValueError(f"Invalid compressed Data Length: {value}")
+        return value, frame[size:]
+
+    def _inflate(self, frame: bytes) -> bytes:
+        """
+        Return the uncompressed body of a received frame.
+
+        Args:
+            frame: Frame bytes without the Packet Length prefix.
+
+        Returns:
+            Packet body (Packet ID + Data).
+        """
+        data_length, payload = self._split_frame(frame)
+        if data_length == 0:
+            return payload
+        return decompress_body(payload, data_length)
+
+    def _decode_body(self, packet_bytes: bytes) -> Packet:
+        """
+        Decode an inbound packet body (Packet ID + Data, uncompressed).
+
+        Args:
+            packet_bytes: Packet body bytes.
+
+        Returns:
+            Decoded packet instance.
+        """
+        packet_id, pid_size = VarInt.from_bytes(packet_bytes, 0)
+        packet_data = packet_bytes[pid_size:]
+
+        return self.packets.instantiate(
+            state=self._state,
+            direction=self._inbound,
+            packet_id=f"0x{packet_id.value:02X}",
+            data=packet_data,
+        )
+
+    def _decode_packet(self, raw_bytes: bytes) -> Packet:
+        """
+        Decode an inbound packet.
+
+        Args:
+            raw_bytes: Full packet bytes including length prefix.
+
+        Returns:
+            Decoded packet instance.
+
+        Raises:
+            ValueError: If packet length exceeds limits.
+        """
+        packet_length, cursor = VarInt.from_bytes(raw_bytes, 0)
+        if packet_length.value > _MAX_VARINT_3_BYTES:
+            raise ValueError(f"Packet length too large: {packet_length.value}")
+
+        frame = raw_bytes[cursor : cursor + packet_length.value]
+        return self._decode_body(self._inflate(frame))
@@ -7,115 +7,133 @@ from codec.packets.registry import PacketRegistry
 from codec.packets.packet import Packet
 from codec.data_types.primitives.varint import VarInt
 from codec.packets.constants import _MAX_VARINT_3_BYTES
+from network.packet_codec import PacketCodec
+from network.packet_writer import PacketWriter
 
 
-class PacketIO:
-    """Handles packet input/output."""
+class PacketIO(PacketCodec):
+    """Handles packet input/output.
+
+    By default `send` serializes and writes on the calling thread, so
+    concurrent senders must serialize access themselves. After
+    `start_writer`, sends only queue the packet for a `PacketWriter`
+    thread, which is safe from any number of threads; `read` stays on the
+    caller.
+    """
 
     def __init__(
         self,
         sock: socket.socket,
         compression_threshold: Optional[int] = None,
         initial_state: str = "Handshaking",
+        role: str = "client",
+        registry: Optional[PacketRegistry] = None,
     ):
         """
         Initialize the packet I/O handler.
 
         Args:
             sock: Connected TCP socket.
-            registry: Packet registry used for packet resolution.
             compression_threshold: Compression threshold if enabled.
             initial_state: Initial protocol state.
+            role: "client" sends serverbound packets, "server" sends clientbound ones.
+            registry: Packet registry used for packet resolution.
         """
+        super().__init__(compression_threshold, initial_state, role, registry)
         self.sock = sock
-        self.registry = PacketRegistry()
-        self.compression_threshold = compression_threshold
-        self._state = initial_state
+        self.writer: Optional[PacketWriter] = None
 
-    @property
-    def state(self) -> str:
+    def start_writer(self, **kwargs) -> PacketWriter:
         """
-        Return the current protocol state.
+        Move sending to a dedicated writer thread.
+
+        Args:
+            **kwargs: `PacketWriter` options (`max_pending`, `on_full`,
+                `block_timeout`, `batch_bytes`, `scheduler`).
 
         Returns:
-            Current state.
+            PacketWriter: The running writer; see `PacketWriter.stats()`.
         """
-        return self._state
+        if self.writer is None:
+            self.writer = PacketWriter(self.sock, **kwargs)
+        return self.writer
 
-    def set_state(self, new_state: str) -> None:
+    def stop_writer(self, timeout: Optional[float] = None) -> None:
         """
-        Set the current protocol state.
+        Send what is queued, stop the writer thread and send inline again.
 
         Args:
-            new_state: New protocol state.
+            timeout: Longest wait for the queue to drain; unbounded if None.
         """
-        self._state = new_state
+        if self.writer is not None:
+            self.writer.close(timeout)
+            self.writer = None
 
-    def _encode_packet(self, packet_id: str, **kwargs) -> bytes:
+    def send(self, packet_id: str, **kwargs) -> bool:
         """
-        Serialize a serverbound packet.
+        Send an outbound packet, or queue it with a writer thread.
 
         Args:
             packet_id: Packet identifier.
             **kwargs: Packet fields.
 
         Returns:
-            Serialized packet bytes.
+            False if a writer with the "drop" policy discarded it, else True.
         """
-        packet: Packet = self.registry.instantiate(
-            state=self._state,
-            direction="serverbound",
-            packet_id=packet_id,
-            **kwargs,
-        )
-        return packet.serialize(self.compression_threshold)
+        return self.send_packet(self._build_packet(packet_id, **kwargs))
 
-    def _decode_packet(self, raw_bytes: bytes) -> Packet:
+    def send_packet(self, packet: Packet) -> bool:
         """
-        Decode a clientbound packet.
+        Send an already constructed packet, or queue it with a writer thread.
 
         Args:
-            raw_bytes: Full packet bytes including length prefix.
+            packet: Packet instance.
 
         Returns:
-            Decoded packet instance.
-
-        Raises:
-            ValueError: If packet length exceeds limits.
+            False if a writer with the "drop" policy discarded it, else True.
         """
-        packet_length, cursor = VarInt.from_bytes(raw_bytes, 0)
-        if packet_length.value > _MAX_VARINT_3_BYTES:
-            raise ValueError(f"Packet length too large: {packet_length.value}")
-
-        packet_bytes = raw_bytes[cursor : cursor + packet_length.value]
-
-        packet_id, pid_size = VarInt.from_bytes(packet_bytes, 0)
-        packet_data = packet_bytes[pid_size:]
-
-        return self.registry.instantiate(
-            state=self._state,
-            direction="clientbound",
-            packet_id=f"{packet_id.value:#04x}",
-            data=packet_data,
-        )
+        packet_id = self._outbound_id(packet)
+        if self.writer is not None:
+            return self.writer.put(packet, self.compression_threshold, packet_id=packet_id)
+        self.sock.sendall(packet.serialize(self.compression_threshold, packet_id))
+        return True
 
-    def send(self, packet_id: str, **kwargs) -> None:
+    def write(self, data: bytes, priority: Optional[str] = None) -> bool:
         """
-        Send a serverbound packet.
+        Send an already framed packet, or queue it with a writer thread.
 
         Args:
-            packet_id: Packet identifier.
-            **kwargs: Packet fields.
+            data: Serialized frame.
+            priority: Priority class for a writer with a scheduler.
+
+        Returns:
+            False if a writer with the "drop" policy discarded it, else True.
         """
-        self.sock.sendall(self._encode_packet(packet_id, **kwargs))
+        if self.writer is not None:
+            return self.writer.put(data, priority=priority)
+        self.sock.sendall(data)
+        return True
 
     def read(self) -> Packet:
         """
-        Read and decode a clientbound packet.
+        Read and decode an inbound packet.
 
         Returns:
             Decoded packet instance.
 
+        Raises:
+            ConnectionError: If the socket closes unexpectedly.
+            ValueError: If the packet length is invalid.
+        """
+        return self._decode_body(self._inflate(self.read_frame()))
+
+    def read_frame(self) -> bytes:
+        """
+        Read one frame without decoding it.
+
+        Returns:
+            Frame bytes without the Packet Length prefix.
+
         Raises:
             ConnectionError: If the socket closes unexpectedly.
             ValueError: If the packet length is invalid.
@@ -144,4 +162,4 @@ class PacketIO:
             raw_packet += chunk
             remaining -= len(chunk)
 
-        return self._decode_packet(bytes(raw_length) + bytes(raw_packet))
+        return bytes(raw_packet)
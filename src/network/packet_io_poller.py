@@ -0,0 +1,306 @@
+# src/network/packet_io_poller.py
+
+from collections import deque
+import selectors
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from codec.packets.constants import _MAX_VARINT_3_BYTES
+from codec.packets.packet import Packet
+from network.packet_io import PacketIO
+
+CloseHook = Callable[[PacketIO, Optional[BaseException]], None]
+
+_DEFAULT_RECV_SIZE = 64 * 1024
+_READ = selectors.EVENT_READ
+_READ_WRITE = selectors.EVENT_READ | selectors.EVENT_WRITE
+
+
+class _Channel:
+    """Per-connection buffers of a `PacketIOPoller`."""
+
+    __slots__ = ("io", "inbound", "outbound")
+
+    def __init__(self, io: PacketIO):
+        self.io = io
+        self.inbound = bytearray()
+        self.outbound = bytearray()
+
+
+class PacketIOPoller:
+    """Multiplexes many `PacketIO` connections on one thread with `selectors`.
+
+    Registered sockets are made non-blocking. Each poll cycle is one
+    `select` call (epoll on Linux); every readable socket gets one `recv`
+    into its connection's buffer, and complete frames are split off into a
+    ready queue. Iterating the poller yields `(connection, packet)` pairs.
+
+    Frames are decoded only when yielded, with the connection's state at
+    that moment, so a consumer that calls `set_state` (or enables
+    compression) after a packet changes how the next one is decoded.
+    `frames()` yields the undecoded frames instead, e.g. for
+    `PacketDispatcher.dispatch`. Packets listed in the registry but not
+    implemented yet are skipped by iteration; `frames()` still yields them.
+
+    Sends go through the poller: `send_packet` / `write` try to write at
+    once and buffer what the socket does not accept; the rest is written
+    when the socket reports writability, in call order.
+
+    A connection that closes, violates the protocol or fails is unregistered
+    and passed to `on_close` with the error (None for a clean EOF); frames
+    it completed before are still yielded.
+
+    Example:
+        >>> poller = PacketIOPoller()
+        >>> for sock in sockets:
+        ...     poller.register(PacketIO(sock, role="server"))
+        >>> for io, packet in poller:
+        ...     handle(io, packet)
+
+    Attributes:
+        on_close (Optional[CloseHook]): Called with each dropped connection.
+        timeout (Optional[float]): Longest wait of one select while iterating.
+        polls (int): Select calls made.
+        frames_read (int): Frames split off so far.
+    """
+
+    def __init__(
+        self,
+        on_close: Optional[CloseHook] = None,
+        timeout: Optional[float] = None,
+        recv_size: int = _DEFAULT_RECV_SIZE,
+        selector: Optional[selectors.BaseSelector] = None,
+    ):
+        """
+        Initialize an empty poller.
+
+        Args:
+            on_close: Called with `(connection, error or None)` when a
+                connection is dropped.
+            timeout: Longest wait of one select while iterating; unbounded
+                if None.
+            recv_size: Bytes requested per `recv`.
+            selector: Selector to use; `selectors.DefaultSelector()` if None.
+        """
+        self.on_close = on_close
+        self.timeout = timeout
+        self.recv_size = recv_size
+        self.selector = selector if selector is not None else selectors.DefaultSelector()
+        self.polls = 0
+        self.frames_read = 0
+        self._channels: Dict[PacketIO, _Channel] = {}
+        self._ready: Deque[Tuple[_Channel, bytes]] = deque()
+
+    def register(self, io: PacketIO) -> None:
+        """
+        Start polling a connection and make its socket non-blocking.
+
+        Args:
+            io: Connection; it must not use a writer thread.
+
+        Raises:
+            ValueError: If the connection has a writer thread.
+        """
+        if io.writer is not None:
+            raise ValueError("Connections with a writer thread cannot be polled")
+        io.sock.setblocking(False)
+        channel = _Channel(io)
+        self._channels[io] = channel
+        self.selector.register(io.sock, _READ, channel)
+
+    def unregister(self, io: PacketIO) -> None:
+        """
+        Stop polling a connection; its socket stays open and non-blocking.
+
+        Unsent buffered bytes and frames not yet yielded are discarded.
+
+        Args:
+            io: Registered connection.
+        """
+        channel = self._channels.get(io)
+        if channel is None:
+            return
+        self._detach(channel)
+        self._discard_ready(channel)
+
+    def close(self) -> None:
+        """Unregister every connection and close the selector (not the sockets)."""
+        for io in list(self._channels):
+            self.unregister(io)
+        self.selector.close()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def send_packet(self, io: PacketIO, packet: Packet) -> None:
+        """
+        Serialize a packet with the connection's threshold and packet IDs and send it.
+
+        Args:
+            io: Registered connection.
+            packet: Packet instance.
+
+        Raises:
+            ConnectionError: If the connection is not registered (or was dropped).
+        """
+        self.write(io, packet.serialize(io.compression_threshold, io._outbound_id(packet)))
+
+    def write(self, io: PacketIO, data: bytes) -> None:
+        """
+        Send a frame now as far as the socket allows and buffer the rest.
+
+        Args:
+            io: Registered connection.
+            data: Serialized frame.
+
+        Raises:
+            ConnectionError: If the connection is not registered (or was dropped).
+        """
+        channel = self._channels.get(io)
+        if channel is None:
+            raise ConnectionError("Connection is not registered with the poller")
+        if channel.outbound:
+            channel.outbound += data
+            return
+        try:
+            sent = io.sock.send(data)
+        except BlockingIOError:
+            sent = 0
+        except OSError as exc:
+            self._drop(channel, exc)
+            return
+        if sent < len(data):
+            channel.outbound += memoryview(data)[sent:]
+            self.selector.modify(io.sock, _READ_WRITE, channel)
+
+    def pending_bytes(self, io: PacketIO) -> int:
+        """Return the bytes of a connection still waiting to be sent."""
+        return len(self._channels[io].outbound)
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        """
+        Wait for socket events once, then read and write what is ready.
+
+        Args:
+            timeout: Longest wait in seconds; unbounded if None, 0 to not wait.
+
+        Returns:
+            int: Frames queued for `frames()` / iteration.
+        """
+        self.polls += 1
+        for key, events in self.selector.select(timeout):
+            channel = key.data
+            if events & selectors.EVENT_WRITE:
+                self._flush(channel)
+            if events & selectors.EVENT_READ and channel.io in self._channels:
+                self._receive(channel)
+        return len(self._ready)
+
+    def frames(self) -> Iterator[Tuple[PacketIO, bytes]]:
+        """
+        Yield `(connection, frame)` pairs until no connection is registered.
+
+        Frames exclude the Packet Length prefix, as from `PacketIO.read_frame`.
+        """
+        ready = self._ready
+        while ready or self._channels:
+            if not ready:
+                self.poll(self.timeout)
+                continue
+            channel, frame = ready.popleft()
+            yield channel.io, frame
+
+    def __iter__(self) -> Iterator[Tuple[PacketIO, Packet]]:
+        """Yield `(connection, packet)` pairs until no connection is registered."""
+        for io, frame in self.frames():
+            try:
+                packet = io._decode_body(io._inflate(frame))
+            except ImportError:
+                continue  # listed in the registry, not implemented yet
+            except ValueError as exc:
+                channel = self._channels.get(io)
+                if channel is not None:
+                    self._drop(channel, exc)
+                    self._discard_ready(channel)
+                continue
+            yield io, packet
+
+    def _receive(self, channel: _Channel) -> None:
+        """Read once from a readable socket and split off complete frames."""
+        try:
+            data = channel.io.sock.recv(self.recv_size)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            self._drop(channel, exc)
+            return
+        if not data:
+            self._drop(channel, None)
+            return
+
+        buffer = channel.inbound
+        buffer += data
+        size = len(buffer)
+        start = 0
+        while start < size:
+            # Packet Length: VarInt of at most 3 bytes
+            length = shift = 0
+            end = start
+            while True:
+                if end == size:
+                    break
+                byte = buffer[end]
+                end += 1
+                length |= (byte & 0x7F) << shift
+                if not byte & 0x80:
+                    break
+                shift += 7
+                if end - start == 3:
+                    self._drop(channel, ValueError("VarInt length exceeds 3 bytes"))
+                    return
+            if end == size and buffer[end - 1] & 0x80:
+                break
+            if length > _MAX_VARINT_3_BYTES:
+                self._drop(channel, ValueError(f"Packet length too large: {length}"))
+                return
+            if size - end < length:
+                break
+            self._ready.append((channel, bytes(buffer[end:end + length])))
+            self.frames_read += 1
+            start = end + length
+        del buffer[:start]
+
+    def _flush(self, channel: _Channel) -> None:
+        """Write buffered bytes to a writable socket."""
+        sock = channel.io.sock
+        try:
+            sent = sock.send(channel.outbound)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            self._drop(channel, exc)
+            return
+        del channel.outbound[:sent]
+        if not channel.outbound:
+            self.selector.modify(sock, _READ, channel)
+
+    def _discard_ready(self, channel: _Channel) -> None:
+        """Remove a connection's frames from the ready queue."""
+        if any(ready[0] is channel for ready in self._ready):
+            kept = [ready for ready in self._ready if ready[0] is not channel]
+            self._ready.clear()
+            self._ready.extend(kept)
+
+    def _detach(self, channel: _Channel) -> None:
+        del self._channels[channel.io]
+        self.selector.unregister(channel.io.sock)
+
+    def _drop(self, channel: _Channel, error: Optional[BaseException]) -> None:
+        """Unregister a connection and report it to `on_close`.
+
+        Frames it completed before are still yielded.
+        """
+        if channel.io not in self._channels:
+            return
+        self._detach(channel)
+        if self.on_close is not None:
+            self.on_close(channel.io, error)
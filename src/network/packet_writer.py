@@ -0,0 +1,310 @@
+# src/network/packet_writer.py
+
+from collections import deque
+import logging
+import queue
+import socket
+import threading
+import time
+from typing import Deque, Optional, Union
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from network.histogram import LatencyHistogram
+from network.outbound_scheduler import OutboundScheduler
+
+_DEFAULT_MAX_PENDING = 4096
+_DEFAULT_BATCH_BYTES = 256 * 1024
+_FULL_POLICIES = ("block", "drop", "raise")
+# Seconds between re-checks of a blocked producer or flush (guards against
+# a missed wakeup or a writer that died)
+_BLOCK_POLL = 0.05
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SendQueueFull(queue.Full):
+    """The send queue is full and the policy is "raise" (or "block" timed out)."""
+
+
+class PacketWriter:
+    """Background thread that serializes and sends queued packets.
+
+    Producers only append to a deque (atomic under the GIL, so the common
+    path takes no lock) and set an event. The writer thread drains the
+    queue in batches: it serializes packets, compresses them with the
+    threshold captured when they were queued, joins frames up to
+    `batch_bytes` and sends each batch with one `sendall`. Frames from
+    concurrent producers therefore never interleave on the socket.
+
+    When `max_pending` items are waiting, `on_full` decides what `put` does:
+    "block" waits for space (up to `block_timeout`, then raises), "drop"
+    discards the item and counts it, "raise" raises `SendQueueFull`. The
+    bound is checked without a lock, so concurrent producers may overshoot
+    it by a few items.
+
+    With a `scheduler` the queue is an `OutboundScheduler` instead of a
+    FIFO deque: items are sent by priority class and interleaved fairly,
+    and each batch ends after a frame of at least `batch_bytes`, so
+    urgent packets queued meanwhile go out right after it.
+
+    Packets are serialized later, on the writer thread: do not modify a
+    packet after queueing it. A packet whose serialization raises is
+    skipped, counted in `failed` and logged; the rest of the batch is
+    still sent. Only socket errors stop the thread.
+
+    Attributes:
+        max_pending (int): Queue bound.
+        on_full (str): Full-queue policy.
+        error (Optional[BaseException]): Error that stopped the thread.
+        failed (int): Packets skipped because serialization raised.
+        scheduler (Optional[OutboundScheduler]): Priority queue, if any.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        on_full: str = "block",
+        block_timeout: Optional[float] = None,
+        batch_bytes: int = _DEFAULT_BATCH_BYTES,
+        scheduler: Optional[OutboundScheduler] = None,
+    ):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            sock: Connected blocking socket; only this thread may send on it.
+            max_pending: Queued items before `on_full` applies.
+            on_full: "block", "drop" or "raise".
+            block_timeout: Longest "block" wait in seconds; unbounded if None.
+            batch_bytes: Frames are joined into writes of up to this size.
+            scheduler: Priority scheduler replacing the FIFO queue.
+        """
+        if on_full not in _FULL_POLICIES:
+            raise ValueError(f"on_full must be one of {_FULL_POLICIES}, got {on_full!r}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.sock = sock
+        self.max_pending = max_pending
+        self.on_full = on_full
+        self.block_timeout = block_timeout
+        self.batch_bytes = batch_bytes
+        self.error: Optional[BaseException] = None
+        self.latency = LatencyHistogram()
+        self.frames = 0
+        self.bytes = 0
+        self.batches = 0
+        self.high_water = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.failed = 0
+        self.scheduler = scheduler
+        # (packet or frame or flush marker, compression threshold, packet ID, enqueue ns)
+        self._queue: Union[Deque[tuple], OutboundScheduler] = deque() if scheduler is None else scheduler
+        self._wake = threading.Event()
+        self._space = threading.Condition()
+        self._counter_lock = threading.Lock()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="mcprotocol-writer", daemon=True)
+        self._thread.start()
+
+    def put(
+        self,
+        item: Union[Packet, bytes],
+        compression_threshold: Optional[int] = None,
+        priority: Optional[str] = None,
+        packet_id: Optional[VarInt] = None,
+    ) -> bool:
+        """
+        Queue a packet, or an already framed bytes object, for sending.
+
+        Args:
+            item: Packet to serialize, or a complete frame.
+            compression_threshold: Threshold the packet is serialized with;
+                ignored for frames.
+            priority: Priority class overriding the scheduler's
+                classification; ignored without a scheduler.
+            packet_id: Wire ID the packet is serialized with, if not its
+                own; ignored for frames.
+
+        Returns:
+            True if queued, False if dropped by the "drop" policy.
+
+        Raises:
+            SendQueueFull: Under "raise", or when a "block" wait times out.
+            ConnectionError: If the writer has stopped.
+        """
+        self._check_open()
+        if len(self._queue) >= self.max_pending and not self._wait_for_space():
+            return False
+        entry = (item, compression_threshold, packet_id, time.perf_counter_ns())
+        if self.scheduler is None:
+            self._queue.append(entry)
+        else:
+            self.scheduler.append(entry, priority)
+        depth = len(self._queue)
+        if depth > self.high_water:
+            self.high_water = depth
+        self._wake.set()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything queued before this call has been sent.
+
+        Args:
+            timeout: Longest wait in seconds; unbounded if None.
+
+        Returns:
+            True if flushed, False on timeout.
+
+        Raises:
+            ConnectionError: If the writer stopped before flushing.
+        """
+        self._check_open()
+        done = threading.Event()
+        self._queue.append((done, None, None, 0))
+        self._wake.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(_BLOCK_POLL):
+            if self.error is not None or not self._thread.is_alive():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        if self.error is not None:
+            raise ConnectionError("Packet writer stopped") from self.error
+        return done.is_set()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Send what is queued, then stop the thread.
+
+        Args:
+            timeout: Longest wait for the queue to drain; unbounded if None.
+        """
+        if self._closing:
+            return
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    @property
+    def depth(self) -> int:
+        """Number of queued items."""
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        """
+        Return queue and write metrics.
+
+        Returns:
+            dict: Current and peak queue depth, frames/bytes/batches sent,
+            dropped and blocked `put` calls, packets that failed to
+            serialize, and enqueue-to-sent latency
+            percentiles in milliseconds; with a scheduler, its per-class
+            stats under "classes".
+        """
+        return {
+            "depth": len(self._queue),
+            "high_water": self.high_water,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "failed": self.failed,
+            **{f"latency_{key}_ms": value for key, value in self.latency.summary().items() if key != "count"},
+            **({} if self.scheduler is None else {"classes": self.scheduler.stats()}),
+        }
+
+    def _check_open(self) -> None:
+        if self.error is not None:
+            raise ConnectionError("Packet writer stopped") from self.error
+        if self._closing:
+            raise ConnectionError("Packet writer is closed")
+
+    def _wait_for_space(self) -> bool:
+        """Apply the full-queue policy; return whether the item may be queued."""
+        if self.on_full == "drop":
+            with self._counter_lock:
+                self.dropped += 1
+            return False
+        if self.on_full == "raise":
+            raise SendQueueFull(f"Send queue full ({self.max_pending} items)")
+
+        with self._counter_lock:
+            self.blocked += 1
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        with self._space:
+            while len(self._queue) >= self.max_pending:
+                self._check_open()
+                wait = _BLOCK_POLL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise SendQueueFull(
+                            f"Send queue still full after {self.block_timeout} s"
+                        )
+                    wait = min(wait, remaining)
+                self._space.wait(wait)
+        return True
+
+    def _run(self) -> None:
+        pending = self._queue
+        try:
+            while True:
+                self._wake.wait()
+                self._wake.clear()
+                while pending:
+                    self._send_batch()
+                if self._closing and not pending:
+                    return
+        except BaseException as exc:
+            self.error = exc
+            with self._space:
+                self._space.notify_all()
+            # Unblock flushes waiting behind the failure
+            for item, _, _, _ in pending:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _send_batch(self) -> None:
+        """Pop, serialize and send items up to `batch_bytes`."""
+        pending = self._queue
+        frames = []
+        queued_at = []
+        markers = []
+        size = 0
+        while pending and size < self.batch_bytes:
+            item, threshold, packet_id, enqueued = pending.popleft()
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                continue
+            if isinstance(item, (bytes, bytearray, memoryview)):
+                frame = item
+            else:
+                try:
+                    frame = item.serialize(threshold, packet_id)
+                except Exception:
+                    self.failed += 1
+                    _LOGGER.warning("Dropping %s: serialization failed", type(item).__name__, exc_info=True)
+                    continue
+            if self.scheduler is not None:
+                self.scheduler.charge(len(frame))
+            frames.append(frame)
+            queued_at.append(enqueued)
+            size += len(frame)
+
+        with self._space:
+            self._space.notify_all()
+        if frames:
+            self.sock.sendall(frames[0] if len(frames) == 1 else b"".join(frames))
+            now = time.perf_counter_ns()
+            for enqueued in queued_at:
+                self.latency.record(now - enqueued)
+            self.frames += len(frames)
+            self.bytes += size
+            self.batches += 1
+        for marker in markers:
+            marker.set()
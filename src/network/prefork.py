@@ -0,0 +1,371 @@
+# src/network/prefork.py
+
+"""Pre-fork multi-process server.
+
+Run from `src/`:
+    python -m network.prefork --workers 16 --port 25565
+
+Send SIGHUP for a graceful reload and SIGTERM/SIGINT to stop.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional
+
+from codec.packets.constants import _DEFAULT_PROTOCOL_VERSION
+from network.connection_manager import ConnectionManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_DRAIN_TIMEOUT = 10.0
+_DEFAULT_HEALTH_INTERVAL = 0.5
+_DEFAULT_HEALTH_TIMEOUT = 5.0
+
+# Worker slot layout in shared memory (unsigned 64-bit words)
+_SLOT_FIELDS = ("pid", "heartbeat_ns", "accepted", "open_connections", "frames", "draining")
+
+
+def _status() -> dict:
+    """Status object served by the command-line launcher."""
+    return {
+        "version": {"name": "1.21.10", "protocol": _DEFAULT_PROTOCOL_VERSION},
+        "players": {"max": 100, "online": 0},
+        "description": {"text": "A Minecraft Server"},
+    }
+
+
+class _Worker:
+    """Parent-side record of a worker process."""
+
+    __slots__ = ("process", "slot", "generation", "started", "stopping")
+
+    def __init__(self, process: multiprocessing.Process, slot: int, generation: int):
+        self.process = process
+        self.slot = slot
+        self.generation = generation
+        self.started = time.monotonic_ns()
+        self.stopping = False
+
+
+class PreforkServer:
+    """Runs `ConnectionManager` in N forked processes sharing one port.
+
+    Every worker binds the port itself with `SO_REUSEPORT`, so the kernel
+    spreads incoming connections across workers, and each runs its own
+    event loop, `PacketRegistry` and codec caches: packet work scales with
+    cores instead of being capped by one interpreter's GIL.
+
+    Workers publish a heartbeat and their `ConnectionManager.stats()` into
+    a shared memory slot. The supervisor replaces workers that exit or stop
+    heartbeating. A reload starts a complete new generation before the old
+    one drains (stops accepting, lets open connections finish for up to
+    `drain_timeout`), so the port never stops accepting. Shared memory
+    holds two generations: a worker started while both are in use (a
+    second reload, or a respawn, during a drain) first waits for the
+    oldest draining worker to exit, killing it after `drain_timeout`.
+
+    The parent keeps a bound, non-listening socket on the port; it reserves
+    the port (and resolves port 0) without receiving connections.
+
+    Example:
+        >>> server = PreforkServer(port=25565, workers=16, status_provider=status)
+        >>> server.run()  # blocks; SIGHUP reloads, SIGTERM stops
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 25565,
+        workers: int = os.cpu_count() or 1,
+        factory: Callable[..., ConnectionManager] = ConnectionManager,
+        drain_timeout: float = _DEFAULT_DRAIN_TIMEOUT,
+        health_interval: float = _DEFAULT_HEALTH_INTERVAL,
+        health_timeout: float = _DEFAULT_HEALTH_TIMEOUT,
+        **manager_kwargs,
+    ):
+        """
+        Initialize the server without starting workers.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on (0 picks a free port at `start`).
+            workers: Number of worker processes.
+            factory: Builds the worker's manager; called in the worker with
+                `host`, `port`, `reuse_port=True` and `manager_kwargs`.
+            drain_timeout: Seconds a stopping worker waits for connections.
+            health_interval: Seconds between heartbeats and supervision passes.
+            health_timeout: Heartbeat age after which a worker is replaced.
+            **manager_kwargs: Extra `factory` arguments (status provider, ...).
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.factory = factory
+        self.drain_timeout = drain_timeout
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.manager_kwargs = manager_kwargs
+        self.generation = 0
+        self.restarts = 0
+        self._context = multiprocessing.get_context("fork")
+        self._workers: List[_Worker] = []
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._words: Optional[memoryview] = None
+        self._socket: Optional[socket.socket] = None
+        self._signal: Optional[int] = None
+
+    def start(self) -> None:
+        """Reserve the port, allocate shared memory and fork the workers."""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self._socket.bind((self.host, self.port))
+        self.port = self._socket.getsockname()[1]
+
+        # Two generations coexist during a reload
+        size = 8 * len(_SLOT_FIELDS) * 2 * self.workers
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._words = self._shm.buf.cast("Q")
+        self._spawn_generation()
+
+    def reload(self) -> None:
+        """
+        Start a new generation of workers, then drain the old one.
+
+        Raises:
+            RuntimeError: If no shared memory slot can be freed for a new worker.
+        """
+        old = [worker for worker in self._workers if not worker.stopping]
+        self._spawn_generation()
+        deadline = time.monotonic() + self.health_timeout
+        for worker in self._workers:
+            if worker.generation == self.generation:
+                while not self._field(worker.slot, "heartbeat_ns") and time.monotonic() < deadline:
+                    time.sleep(0.01)
+        for worker in old:
+            self._stop_worker(worker)
+
+    def stop(self) -> None:
+        """Drain every worker, kill stragglers and release resources."""
+        for worker in self._workers:
+            self._stop_worker(worker)
+        deadline = time.monotonic() + self.drain_timeout + self.health_timeout
+        for worker in self._workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+        self._workers.clear()
+        if self._words is not None:
+            self._words.release()
+            self._words = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def run(self) -> None:
+        """Start, supervise until SIGTERM/SIGINT (reloading on SIGHUP), then stop."""
+
+        def remember(signum, frame):
+            self._signal = signum
+
+        signals = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+        previous = {sig: signal.signal(sig, remember) for sig in signals}
+        self.start()
+        try:
+            while True:
+                time.sleep(self.health_interval)
+                signum, self._signal = self._signal, None
+                if signum == signal.SIGHUP:
+                    _LOGGER.info("Reloading: generation %d", self.generation + 1)
+                    self.reload()
+                elif signum is not None:
+                    break
+                self.supervise()
+        finally:
+            self.stop()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def supervise(self) -> None:
+        """Reap exited workers and replace dead or unresponsive ones."""
+        now = time.monotonic_ns()
+        timeout_ns = int(self.health_timeout * 1e9)
+        self._reap_stopped()
+        for worker in list(self._workers):
+            process = worker.process
+            if worker.stopping:
+                continue
+
+            heartbeat = self._field(worker.slot, "heartbeat_ns")
+            if process.is_alive() and now - (heartbeat or worker.started) < timeout_ns:
+                continue
+            if process.is_alive():
+                _LOGGER.warning("Worker %d unresponsive, killing it", process.pid)
+                process.kill()
+            else:
+                _LOGGER.warning("Worker %d exited with %s", process.pid, process.exitcode)
+            process.join()
+            self._release(worker)
+            self.restarts += 1
+            self._spawn(worker.generation)
+
+    def metrics(self) -> dict:
+        """
+        Return aggregated and per-worker metrics.
+
+        Returns:
+            dict: Totals of the worker counters, worker/restart counts and
+            `"workers"`, a list of per-worker dicts (pid, generation,
+            heartbeat age and counters).
+        """
+        now = time.monotonic_ns()
+        totals = {"accepted": 0, "open_connections": 0, "frames": 0}
+        per_worker = []
+        for worker in self._workers:
+            entry = {name: self._field(worker.slot, name) for name in _SLOT_FIELDS}
+            heartbeat = entry.pop("heartbeat_ns")
+            entry["generation"] = worker.generation
+            entry["heartbeat_age_s"] = (now - heartbeat) / 1e9 if heartbeat else None
+            per_worker.append(entry)
+            for name in totals:
+                totals[name] += entry[name]
+        totals.update(
+            live_workers=sum(worker.process.is_alive() for worker in self._workers),
+            generation=self.generation,
+            restarts=self.restarts,
+            workers=per_worker,
+        )
+        return totals
+
+    def _field(self, slot: int, name: str) -> int:
+        return self._words[slot * len(_SLOT_FIELDS) + _SLOT_FIELDS.index(name)]
+
+    def _free_slot(self) -> int:
+        """Return an unused slot, reclaiming those of draining workers if needed."""
+        self._reap_stopped()
+        while True:
+            used = {worker.slot for worker in self._workers}
+            slot = next((slot for slot in range(2 * self.workers) if slot not in used), None)
+            if slot is not None:
+                return slot
+            stopping = [worker for worker in self._workers if worker.stopping]
+            if not stopping:
+                raise RuntimeError(f"No free worker slot: {len(self._workers)} workers running")
+            oldest = min(stopping, key=lambda worker: worker.started)
+            oldest.process.join(self.drain_timeout + self.health_timeout)
+            if oldest.process.is_alive():
+                _LOGGER.warning("Worker %d still draining, killing it", oldest.process.pid)
+                oldest.process.kill()
+                oldest.process.join()
+            self._release(oldest)
+
+    def _reap_stopped(self) -> None:
+        """Release the slots of stopping workers that have exited."""
+        for worker in list(self._workers):
+            if worker.stopping and not worker.process.is_alive():
+                worker.process.join()
+                self._release(worker)
+
+    def _release(self, worker: _Worker) -> None:
+        self._workers.remove(worker)
+        start = worker.slot * len(_SLOT_FIELDS)
+        self._words[start : start + len(_SLOT_FIELDS)] = memoryview(bytes(8 * len(_SLOT_FIELDS))).cast("Q")
+
+    def _spawn_generation(self) -> None:
+        self.generation += 1
+        for _ in range(self.workers):
+            self._spawn(self.generation)
+
+    def _spawn(self, generation: int) -> None:
+        slot = self._free_slot()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self, slot),
+            name=f"prefork-worker-{slot}",
+            daemon=True,
+        )
+        process.start()
+        self._workers.append(_Worker(process, slot, generation))
+
+    def _stop_worker(self, worker: _Worker) -> None:
+        # A worker that already died is marked too, so it is reaped, not respawned
+        if not worker.stopping:
+            worker.stopping = True
+            if worker.process.is_alive():
+                os.kill(worker.process.pid, signal.SIGTERM)
+
+
+def _worker_main(server: PreforkServer, slot: int) -> None:
+    """Worker process entry point (runs after fork)."""
+    for sig in (signal.SIGHUP, signal.SIGINT):
+        signal.signal(sig, signal.SIG_IGN)
+    server._socket.close()
+    words = server._words[slot * len(_SLOT_FIELDS) : (slot + 1) * len(_SLOT_FIELDS)]
+    words[_SLOT_FIELDS.index("pid")] = os.getpid()
+    try:
+        asyncio.run(_serve(server, words))
+    finally:
+        words.release()
+
+
+async def _serve(server: PreforkServer, words: memoryview) -> None:
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    loop.add_signal_handler(signal.SIGTERM, stopping.set)
+    parent = os.getppid()
+
+    manager = server.factory(
+        host=server.host, port=server.port, reuse_port=True, **server.manager_kwargs
+    )
+    await manager.start()
+
+    index = {name: i for i, name in enumerate(_SLOT_FIELDS)}
+    while not stopping.is_set():
+        stats = manager.stats()
+        for name in ("accepted", "open_connections", "frames"):
+            words[index[name]] = stats[name]
+        words[index["heartbeat_ns"]] = time.monotonic_ns()
+        if os.getppid() != parent:
+            break  # supervisor died
+        try:
+            await asyncio.wait_for(stopping.wait(), server.health_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    words[index["draining"]] = 1
+    await manager.shutdown(server.drain_timeout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=25565)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--drain-timeout", type=float, default=_DEFAULT_DRAIN_TIMEOUT)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    PreforkServer(
+        args.host,
+        args.port,
+        args.workers,
+        drain_timeout=args.drain_timeout,
+        status_provider=_status,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# src/network/status_responder.py
+
+import json
+from typing import List, Optional, Tuple
+
+from codec.data_types.constants import _DEFAULT_MAX_CODE_UNITS
+from codec.data_types.primitives.varint import VarInt
+
+# Status Response is packet 0x00 in every version; Status is never compressed
+_STATUS_RESPONSE_ID = b"\x00"
+_SEPARATORS = (",", ":")
+# `players` fields spliced into the template when the status has them
+_DYNAMIC = ("max", "online", "sample")
+
+
+class StatusResponder:
+    """Serves Status Response frames from a prebuilt template.
+
+    The status object is encoded once into static JSON segments around
+    the `players.max`, `players.online` and `players.sample` fields it
+    carries. A response joins the segments with the current values and
+    prefixes the String and Packet Length VarInts, so the favicon and
+    description are never re-encoded and no `Packet` is constructed.
+
+    Only fields present in the status are spliced, in their original
+    order, so a response is byte-for-byte what
+    `StatusResponse.from_status(status).serialize()` produces; a status
+    without `players` gets no `players` key.
+
+    `update` rebuilds the template only when a static field (or which
+    player fields exist) changed; counts and the sample may change on
+    every call (the encoded sample is cached until it differs). The JSON
+    is ASCII-only (`json.dumps` escapes everything else), so its byte
+    length is also its UTF-16 code unit count and the String limit is
+    checked with one comparison.
+
+    Example:
+        >>> responder = StatusResponder({"version": {...}, "players": {"max": 100}})
+        >>> connection.write(responder.response(online=12))
+    """
+
+    def __init__(self, status: dict):
+        """
+        Build the template.
+
+        Args:
+            status: Status object (version, players, description, favicon...).
+        """
+        self._static: Optional[dict] = None
+        self._order: tuple = ()
+        self._fields: Tuple[str, ...] = ()
+        self._segments: Tuple[bytes, ...] = ()
+        self._static_size = 0
+        self._max = 0
+        self._online = 0
+        self._sample: List[dict] = []
+        self._sample_bytes = b"[]"
+        self.update(status)
+
+    def update(self, status: dict) -> bool:
+        """
+        Set the advertised status, rebuilding the template only if needed.
+
+        Args:
+            status: Status object; its `players` counts and sample become
+                the defaults of `response`.
+
+        Returns:
+            True if the template was rebuilt.
+
+        Raises:
+            ValueError: If the static JSON alone exceeds the String limit.
+        """
+        players = status.get("players")
+        static = dict(status)
+        if players is not None:
+            self._max = players.get("max", 0)
+            self._online = players.get("online", 0)
+            self._set_sample(players.get("sample", []))
+            static["players"] = {key: value for key, value in players.items() if key not in _DYNAMIC}
+        # Dicts compare equal in any order, but the JSON keeps the key order
+        order = (tuple(status), None if players is None else tuple(players))
+        if static == self._static and order == self._order:
+            return False
+
+        fields: Tuple[str, ...] = ()
+        template = status
+        if players is not None:
+            fields = tuple(key for key in players if key in _DYNAMIC)
+            marked = {key: f"\x00{key}\x00" if key in _DYNAMIC else value for key, value in players.items()}
+            template = {**status, "players": marked}
+        text = json.dumps(template, separators=_SEPARATORS)
+        segments = []
+        for key in fields:
+            head, text = text.split(json.dumps(f"\x00{key}\x00"), 1)
+            segments.append(head.encode("ascii"))
+        segments.append(text.encode("ascii"))
+        size = sum(map(len, segments))
+        if size > _DEFAULT_MAX_CODE_UNITS:
+            raise ValueError(f"Status JSON too long: {size} characters (max {_DEFAULT_MAX_CODE_UNITS})")
+
+        self._static = static
+        self._order = order
+        self._fields = fields
+        self._segments = tuple(segments)
+        self._static_size = size
+        return True
+
+    def response(
+        self,
+        online: Optional[int] = None,
+        max_players: Optional[int] = None,
+        sample: Optional[List[dict]] = None,
+    ) -> bytes:
+        """
+        Return a framed Status Response with the given player fields.
+
+        Values for fields the status does not carry are ignored.
+
+        Args:
+            online: Online player count; the last `update` value when None.
+            max_players: Maximum player count; the last `update` value when None.
+            sample: Player sample (`{"name", "id"}` objects); the last one
+                when None.
+
+        Returns:
+            bytes: Frame ready to be written (Status is never compressed).
+
+        Raises:
+            ValueError: If the JSON exceeds the String limit.
+        """
+        if sample is not None:
+            self._set_sample(sample)
+        values = {
+            "max": self._max if max_players is None else max_players,
+            "online": self._online if online is None else online,
+        }
+        segments = self._segments
+        parts = [segments[0]]
+        size = self._static_size
+        for key, segment in zip(self._fields, segments[1:]):
+            value = self._sample_bytes if key == "sample" else _encode_count(values[key])
+            parts.append(value)
+            parts.append(segment)
+            size += len(value)
+
+        if size > _DEFAULT_MAX_CODE_UNITS:
+            raise ValueError(f"Status JSON too long: {size} characters (max {_DEFAULT_MAX_CODE_UNITS})")
+        string_prefix = bytes(VarInt._trusted(size))
+        return b"".join(
+            (
+                bytes(VarInt._trusted(1 + len(string_prefix) + size)),
+                _STATUS_RESPONSE_ID,
+                string_prefix,
+                *parts,
+            )
+        )
+
+    def response_for(self, status: dict) -> bytes:
+        """
+        Return a framed Status Response for a full status object.
+
+        Equivalent to `update(status)` then `response()`, for providers that
+        build the whole object per request.
+
+        Args:
+            status: Status object.
+
+        Returns:
+            bytes: Frame ready to be written.
+        """
+        self.update(status)
+        return self.response()
+
+    def _set_sample(self, sample: List[dict]) -> None:
+        """Cache the encoded sample unless it is unchanged."""
+        if sample != self._sample:
+            self._sample_bytes = json.dumps(sample, separators=_SEPARATORS).encode("ascii")
+            self._sample = list(sample)
+
+
+def _encode_count(value) -> bytes:
+    """JSON of a player count; ints skip `json.dumps`."""
+    if type(value) is int:
+        return b"%d" % value
+    return json.dumps(value, separators=_SEPARATORS).encode("ascii")
@@ -0,0 +1,233 @@
+# src/network/stream_serializer.py
+
+from itertools import chain
+from typing import List, Optional
+import zlib
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.constants import _MAX_VARINT_3_BYTES, _MAX_UNCOMPRESSED_SERVERBOUND
+from codec.packets.packet import Packet
+from network.buffer_pool import _DEFAULT_CHUNK_SIZE, BufferPool
+
+# Largest slice of a field handed to zlib at once, bounding each output burst
+_FEED_SIZE = 64 * 1024
+
+
+class SpooledFrame:
+    """A serialized frame held as a header plus pooled chunks.
+
+    The header (Packet Length and, with compression, Data Length) is only
+    known once the body is complete, so it is kept apart from the spooled
+    payload. Pooled chunks go back to the pool, and their reservation is
+    released, on `release` (or after `write_to`).
+
+    Attributes:
+        header (bytes): Frame header.
+        size (int): Total frame size in bytes, header included.
+    """
+
+    __slots__ = ("header", "size", "_chunks", "_tail", "_pool", "_pooled")
+
+    def __init__(
+        self,
+        header: bytes,
+        chunks: List[bytearray],
+        tail: int,
+        pool: Optional[BufferPool],
+        pooled: int = 0,
+    ):
+        self.header = header
+        self._chunks = chunks
+        self._tail = tail
+        self._pool = pool
+        self._pooled = pooled
+        self.size = len(header) + sum(map(len, chunks)) - (len(chunks[-1]) - tail if chunks else 0)
+
+    def views(self) -> List[memoryview]:
+        """Return the payload as memoryviews over the chunks (valid until `release`)."""
+        if not self._chunks:
+            return []
+        views = [memoryview(chunk) for chunk in self._chunks]
+        views[-1] = views[-1][: self._tail]
+        return views
+
+    def write_to(self, writer) -> None:
+        """
+        Write the frame to a stream writer or transport, then release the chunks.
+
+        Chunks are copied as they are written: some transports keep
+        references to what they are given, and the chunks are reused.
+
+        Args:
+            writer: Object with a `write(bytes)` method.
+        """
+        writer.write(self.header)
+        for view in self.views():
+            writer.write(bytes(view))
+            view.release()
+        self.release()
+
+    def release(self) -> None:
+        """Return the pooled chunks and their reservation to the pool."""
+        _give_back(self._pool, self._chunks, self._pooled)
+        self._chunks = []
+        self._pooled = 0
+
+    def __bytes__(self) -> bytes:
+        """Return the whole frame as one bytes object (does not release)."""
+        return self.header + b"".join(self.views())
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class _Spool:
+    """Appends bytes into fixed-size pooled chunks.
+
+    Each chunk is reserved in the pool's budget before it is taken. Once
+    the budget is exhausted the remaining chunks are plain allocations
+    (a send cannot wait for memory), so the pooled ones are always the
+    first `pooled`.
+    """
+
+    __slots__ = ("pool", "chunk_size", "chunks", "tail", "pooled")
+
+    def __init__(self, pool: Optional[BufferPool], chunk_size: int):
+        self.pool = pool
+        self.chunk_size = chunk_size
+        self.chunks: List[bytearray] = []
+        self.tail = chunk_size  # no current chunk
+        self.pooled = 0
+
+    def write(self, data) -> None:
+        view = memoryview(data)
+        while view:
+            if self.tail == self.chunk_size:
+                pool = self.pool
+                if pool is not None and self.pooled == len(self.chunks) and pool.try_reserve(self.chunk_size):
+                    chunk = pool.take_chunk()
+                    self.pooled += 1
+                else:
+                    chunk = bytearray(self.chunk_size)
+                self.chunks.append(chunk)
+                self.tail = 0
+            size = min(len(view), self.chunk_size - self.tail)
+            self.chunks[-1][self.tail : self.tail + size] = view[:size]
+            self.tail += size
+            view = view[size:]
+
+    @property
+    def size(self) -> int:
+        return (len(self.chunks) - 1) * self.chunk_size + self.tail if self.chunks else 0
+
+    def discard(self) -> None:
+        _give_back(self.pool, self.chunks, self.pooled)
+        self.chunks = []
+        self.pooled = 0
+
+
+def _give_back(pool: Optional[BufferPool], chunks: List[bytearray], pooled: int) -> None:
+    """Return the first `pooled` chunks to the pool and release their reservation."""
+    if pool is None or not pooled:
+        return
+    for chunk in chunks[:pooled]:
+        pool.give_chunk(chunk)
+    pool.release(pooled * pool.chunk_size)
+
+
+def serialize_streaming(
+    packet: Packet,
+    compression_threshold: Optional[int] = None,
+    pool: Optional[BufferPool] = None,
+    level: int = zlib.Z_DEFAULT_COMPRESSION,
+    packet_id: Optional[VarInt] = None,
+) -> SpooledFrame:
+    """
+    Serialize a packet without materializing its body.
+
+    Fields from `packet._iter_fields()` are fed to a `zlib.compressobj`
+    as they are produced and the compressed output is spooled into pool
+    chunks, so neither the whole uncompressed body nor a second full copy
+    of the frame exists at any time. Until the body reaches
+    `compression_threshold` it is held back (it may yet be sent
+    uncompressed); without compression the body itself is spooled. The
+    header is built last, from the final sizes.
+
+    The frame is byte-for-byte what `Packet.serialize` produces except that
+    the zlib stream may be split into blocks differently.
+
+    Args:
+        packet: Packet to serialize.
+        compression_threshold: As for `Packet.serialize`.
+        pool: Source of spool chunks, each reserved in its budget with
+            `try_reserve` until the frame is released; plain `bytearray`s
+            of the pool's (or the default) chunk size without one or once
+            its budget is exhausted.
+        level: zlib compression level.
+        packet_id: Wire ID to write instead of the packet's own.
+
+    Returns:
+        SpooledFrame: Header and spooled payload.
+
+    Raises:
+        ValueError: If the packet exceeds protocol size limits or the
+            compression threshold is invalid.
+    """
+    if compression_threshold is not None and compression_threshold < 0:
+        raise ValueError("compression_threshold must be >= 0 or None")
+
+    spool = _Spool(pool, pool.chunk_size if pool is not None else _DEFAULT_CHUNK_SIZE)
+    compressor = None
+    pending: List[bytes] = []  # body held back while below the threshold
+    pending_size = 0
+    body_len = 0
+    try:
+        packet_id = packet.packet_id if packet_id is None else packet_id
+        for field in chain((packet_id,), packet._iter_fields()):
+            field = memoryview(bytes(field))
+            body_len += len(field)
+            if body_len > _MAX_UNCOMPRESSED_SERVERBOUND:
+                raise ValueError(
+                    f"Uncompressed packet too large: at least {body_len} bytes "
+                    f"(max {_MAX_UNCOMPRESSED_SERVERBOUND})"
+                )
+            if compression_threshold is None:
+                spool.write(field)
+                continue
+            if compressor is None:
+                pending.append(bytes(field))
+                pending_size += len(field)
+                if pending_size < compression_threshold:
+                    continue
+                compressor = zlib.compressobj(level)
+                field = memoryview(b"".join(pending))
+                pending = []
+            for start in range(0, len(field), _FEED_SIZE):
+                out = compressor.compress(field[start : start + _FEED_SIZE])
+                if out:
+                    spool.write(out)
+
+        if compression_threshold is None:
+            header = _length(body_len)
+        elif compressor is None:
+            # Below the threshold: uncompressed with Data Length = 0
+            body = b"".join(pending)
+            spool.write(body)
+            header = _length(1 + body_len) + b"\x00"
+        else:
+            spool.write(compressor.flush())
+            data_length = bytes(VarInt._trusted(body_len))
+            header = _length(len(data_length) + spool.size) + data_length
+    except BaseException:
+        spool.discard()
+        raise
+    return SpooledFrame(header, spool.chunks, spool.tail, pool, spool.pooled)
+
+
+def _length(value: int) -> bytes:
+    """Encode the Packet Length, enforcing the 3-byte VarInt limit."""
+    if value > _MAX_VARINT_3_BYTES:
+        raise ValueError(
+            f"Packet length exceeds maximum allowed: {value} bytes (max {_MAX_VARINT_3_BYTES})"
+        )
+    return bytes(VarInt._trusted(value))
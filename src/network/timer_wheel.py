@@ -0,0 +1,176 @@
+# src/network/timer_wheel.py
+
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+_DEFAULT_TICK = 0.1  # seconds
+_DEFAULT_SLOTS = 512  # 51.2 s per revolution at the default tick
+
+
+class Timer:
+    """Handle of a callback scheduled on a `TimerWheel`.
+
+    Attributes:
+        deadline (int): Tick at which the callback runs.
+    """
+
+    __slots__ = ("deadline", "_callback", "_args", "_slot", "_wheel")
+
+    def __init__(
+        self,
+        deadline: int,
+        callback: Callable,
+        args: tuple,
+        slot: Dict["Timer", None],
+        wheel: "TimerWheel",
+    ):
+        self.deadline = deadline
+        self._callback = callback
+        self._args = args
+        self._slot: Optional[Dict["Timer", None]] = slot
+        self._wheel = wheel
+
+    def cancel(self) -> None:
+        """Unschedule the callback; does nothing if it already ran."""
+        if self._slot is not None:
+            del self._slot[self]
+            self._slot = None
+            self._wheel._pending -= 1
+
+    def cancelled(self) -> bool:
+        """Return True once the timer was cancelled or has fired."""
+        return self._slot is None
+
+
+class TimerWheel:
+    """Hashed timing wheel shared by many connections.
+
+    Time is divided into ticks of `tick` seconds and timers are hashed into
+    `slots` buckets by deadline tick. Scheduling and cancelling are O(1)
+    dictionary operations; each tick one `loop.call_at` callback visits
+    the current bucket and fires the timers that are due, keeping those
+    hashed there for a later revolution. Deadlines are rounded up to the
+    next tick, so timers fire up to one tick late and never early.
+
+    Thousands of read timeouts and keepalives thus cost one asyncio timer
+    instead of one each. The wheel only runs its tick callback while timers
+    are pending.
+
+    Attributes:
+        tick (float): Tick length in seconds.
+        ticks (int): Current tick, a coarse clock usable for activity stamps.
+    """
+
+    def __init__(
+        self,
+        tick: float = _DEFAULT_TICK,
+        slots: int = _DEFAULT_SLOTS,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Initialize an empty wheel.
+
+        Args:
+            tick: Tick length in seconds (timer resolution).
+            slots: Number of buckets; one revolution spans `tick * slots` seconds.
+            loop: Event loop; the running loop on first use by default.
+
+        Raises:
+            ValueError: If `tick` or `slots` is not positive.
+        """
+        if tick <= 0 or slots < 1:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self._slots: List[Dict[Timer, None]] = [{} for _ in range(slots)]
+        self._loop = loop
+        self._origin: Optional[float] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._pending = 0
+        self._firing = False
+        self.ticks = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending timers."""
+        return self._pending
+
+    def _now_tick(self) -> int:
+        """Return the tick containing the current loop time."""
+        # The epsilon absorbs call_at firing within the clock resolution of a boundary
+        return int((self._loop.time() - self._origin) / self.tick + 1e-6)
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """
+        Call `callback(*args)` after `delay` seconds.
+
+        Args:
+            delay: Seconds from now; rounded up to a whole tick.
+            callback: Plain function; exceptions propagate to the loop's handler.
+            *args: Arguments for `callback`.
+
+        Returns:
+            Timer: Handle for cancellation.
+        """
+        if self._handle is None:
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            if self._origin is None:
+                self._origin = self._loop.time()
+            self.ticks = self._now_tick()
+            self._arm()
+        if self._firing:
+            # Re-arming from a callback: count from its tick so periods do not drift
+            elapsed = self.ticks * self.tick + delay
+        else:
+            elapsed = self._loop.time() - self._origin + delay
+        deadline = max(self.ticks + 1, -int(-elapsed // self.tick))
+        slot = self._slots[deadline % len(self._slots)]
+        timer = Timer(deadline, callback, args, slot, self)
+        slot[timer] = None
+        self._pending += 1
+        return timer
+
+    def _arm(self) -> None:
+        """Schedule the loop callback for the next tick."""
+        when = self._origin + (self.ticks + 1) * self.tick
+        self._handle = self._loop.call_at(when, self._advance)
+
+    def _advance(self) -> None:
+        """Fire due timers of every tick elapsed since the last call."""
+        target = self._now_tick()
+        slots = self._slots
+        self._firing = True
+        while self.ticks < target:
+            self.ticks += 1
+            slot = slots[self.ticks % len(slots)]
+            if not slot:
+                continue
+            due = [timer for timer in slot if timer.deadline <= self.ticks]
+            for timer in due:
+                # A callback may have cancelled a later timer of this batch
+                if timer._slot is None:
+                    continue
+                del slot[timer]
+                timer._slot = None
+                self._pending -= 1
+                try:
+                    timer._callback(*timer._args)
+                except Exception as exc:
+                    self._loop.call_exception_handler(
+                        {"message": "TimerWheel callback failed", "exception": exc}
+                    )
+        self._firing = False
+        if self._pending:
+            self._arm()
+        else:
+            self._handle = None
+
+    def close(self) -> None:
+        """Cancel every pending timer and stop ticking."""
+        for slot in self._slots:
+            for timer in slot:
+                timer._slot = None
+            slot.clear()
+        self._pending = 0
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
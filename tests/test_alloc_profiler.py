@@ -0,0 +1,50 @@
+# tests/test_alloc_profiler.py
+
+import socket
+import threading
+
+from codec.packets.alloc_profiler import AllocationProfiler
+from codec.packets.play.serverbound.ping_request import PingRequest
+from network.packet_io import PacketIO
+
+
+def test_send_packet_with_profiler_installed():
+    ours, theirs = socket.socketpair()
+    theirs.settimeout(5)
+    try:
+        client = PacketIO(ours, initial_state="Play", role="client")
+        server = PacketIO(theirs, initial_state="Play", role="server")
+        with AllocationProfiler() as profiler:
+            client.send_packet(PingRequest(5))
+            client.send("0x25", data=6)
+        assert [server.read().timestamp for _ in range(2)] == [5, 6]
+        assert profiler.stats()["Play/serverbound/PingRequest"]["encode"]["calls"] == 2
+    finally:
+        ours.close()
+        theirs.close()
+
+
+def test_writer_thread_with_profiler_installed():
+    ours, theirs = socket.socketpair()
+    theirs.settimeout(5)
+    client = PacketIO(ours, initial_state="Play", role="client")
+    writer = client.start_writer()
+    try:
+        server = PacketIO(theirs, initial_state="Play", role="server")
+        with AllocationProfiler() as profiler:
+            threads = [
+                threading.Thread(target=lambda: [client.send_packet(PingRequest(i)) for i in range(50)])
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert writer.flush(timeout=5)
+        assert writer.error is None
+        assert sorted(server.read().timestamp for _ in range(100)) == sorted(list(range(50)) * 2)
+        assert profiler.stats()["Play/serverbound/PingRequest"]["encode"]["calls"] == 100
+    finally:
+        writer.close()
+        ours.close()
+        theirs.close()
@@ -0,0 +1,102 @@
+# tests/test_buffer_pool.py
+
+import asyncio
+
+import pytest
+
+from network.buffer_pool import BudgetExceeded, BufferPool, ConnectionBudget
+from network.connection_manager import Connection
+
+_CHUNK = 1024
+
+
+class _Writer:
+    def get_extra_info(self, name):
+        return None
+
+    def close(self):
+        pass
+
+    def is_closing(self):
+        return False
+
+
+def _framed(body: bytes) -> bytes:
+    length, prefix = len(body), bytearray()
+    while True:
+        byte = length & 0x7F
+        length >>= 7
+        prefix.append(byte | (0x80 if length else 0))
+        if not length:
+            return bytes(prefix) + body
+
+
+def _connection(pool: BufferPool):
+    reader = asyncio.StreamReader()
+    budget = ConnectionBudget(pool)
+    return reader, budget, Connection(reader, _Writer(), budget=budget)
+
+
+def test_frames_stay_reserved_until_next_read():
+    async def run():
+        pool = BufferPool(chunk_size=_CHUNK, max_bytes=1 << 20)
+        reader, budget, connection = _connection(pool)
+        large, small = b"\x00" + b"x" * 5000, b"\x00" + b"y" * 10
+        reader.feed_data(_framed(large) + _framed(small))
+
+        assert await connection.read_frame() == large
+        assert budget.in_use == pool.reserved == len(large)
+        # chunks (rounded up) plus the joined copy were reserved while reading
+        assert budget.high_water == 5 * _CHUNK + len(large)
+        assert pool.stats()["free_chunks"] == 5
+
+        assert await connection.read_frame() == small
+        assert budget.in_use == len(small)
+        connection.close()
+        assert budget.in_use == pool.reserved == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_read_releases_and_propagates():
+    async def run():
+        pool = BufferPool(chunk_size=_CHUNK, max_bytes=1 << 20)
+        reader, budget, connection = _connection(pool)
+        task = asyncio.ensure_future(connection.read_frame())
+        reader.feed_data(_framed(b"\x00" * 4000)[:2000])
+        await asyncio.sleep(0.01)
+        assert budget.in_use > 0
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert budget.in_use == pool.reserved == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_reserve_is_not_swallowed():
+    async def run():
+        pool = BufferPool(max_bytes=10, wait_timeout=5)
+        await pool.reserve(10)
+        task = asyncio.ensure_future(pool.reserve(5))
+        await asyncio.sleep(0)
+        pool.release(10)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pool.reserved == 0
+
+    asyncio.run(run())
+
+
+def test_connection_limit():
+    async def run():
+        pool = BufferPool(chunk_size=_CHUNK, max_bytes=1 << 20)
+        budget = ConnectionBudget(pool, limit=100)
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"x" * 200)
+        with pytest.raises(BudgetExceeded):
+            await budget.read_chunked(reader, 101)
+        assert pool.reserved == 0
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+# tests/test_columnar_store.py
+
+import pytest
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.columnar_store import PacketColumns
+from codec.packets.packet import Packet
+
+
+class _Sample(Packet):
+    __slots__ = ("name", "flag", "count")
+
+    def __init__(self, name, flag, count):
+        Packet.__init__(self, VarInt(0))
+        self.name = name
+        self.flag = flag
+        self.count = count
+
+    def _iter_fields(self):
+        return iter(())
+
+
+def test_failed_append_leaves_columns_aligned():
+    table = PacketColumns(_Sample)
+    table.append(_Sample("a", None, 1))
+    view = memoryview(table.column("count").data)  # as a `values()` view would
+    with pytest.raises(BufferError):
+        table.append(_Sample("bb", True, 2))
+    assert len(table) == 1
+    assert [len(column) for column in table.columns.values()] == [1, 1, 1]
+    assert table.row(0) == {"name": "a", "flag": None, "count": 1}
+
+    view.release()
+    table.append(_Sample("bb", True, 2))
+    assert table.row(1) == {"name": "bb", "flag": True, "count": 2}
+    assert table.aggregate("count", "sum") == 3
+
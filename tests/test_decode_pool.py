@@ -0,0 +1,107 @@
+# tests/test_decode_pool.py
+
+import threading
+import time
+
+import pytest
+
+from codec.packets.handshaking.serverbound.intention import Intention
+from codec.packets.status.clientbound.pong_response import PongResponse
+from codec.packets.status.clientbound.status_response import StatusResponse
+from codec.packets.status.serverbound.status_request import StatusRequest
+from network.decode_pool import DecodePool
+from network.packet_codec import PacketCodec
+
+_THRESHOLD = 256
+_STATUS = {"version": {"name": "1.21.10", "protocol": 773}, "description": {"text": "Decode pool"}}
+
+
+def _frame(framed: bytes) -> bytes:
+    """Strip the Packet Length prefix."""
+    length_size = next(i for i, byte in enumerate(framed) if byte < 0x80) + 1
+    return framed[length_size:]
+
+
+@pytest.fixture
+def pool():
+    pool = DecodePool(workers=2)
+    yield pool
+    pool.close()
+
+
+def test_frames_behind_a_state_switch_are_redecoded(pool):
+    codec = PacketCodec(initial_state="Handshaking", role="server")
+    stream = pool.stream(codec)
+    stream.submit(_frame(Intention(773, "localhost", 25565, 1).serialize()))
+    stream.submit(_frame(StatusRequest().serialize()))
+
+    assert isinstance(stream.get(timeout=5), Intention)
+    codec.set_state("Status")
+    assert isinstance(stream.get(timeout=5), StatusRequest)
+    assert stream.redecoded == 1
+
+
+def test_frames_behind_set_compression_are_redecoded(pool):
+    codec = PacketCodec(initial_state="Status", role="client")
+    stream = pool.stream(codec)
+    stream.submit(_frame(StatusResponse.from_status(_STATUS).serialize()))
+    stream.submit(_frame(PongResponse(42).serialize(_THRESHOLD)))
+
+    assert isinstance(stream.get(timeout=5), StatusResponse)
+    codec.compression_threshold = _THRESHOLD
+    pong = stream.get(timeout=5)
+    assert isinstance(pong, PongResponse)
+    assert pong.timestamp == 42
+    assert stream.redecoded == 1
+
+
+def test_unchanged_state_is_not_redecoded(pool):
+    codec = PacketCodec(_THRESHOLD, "Status", role="client")
+    stream = pool.stream(codec)
+    for payload in range(10):
+        stream.submit(_frame(PongResponse(payload).serialize(_THRESHOLD)))
+    assert [stream.get(timeout=5).timestamp for _ in range(10)] == list(range(10))
+    assert stream.redecoded == 0
+
+
+def test_submit_blocks_at_max_pending(pool):
+    codec = PacketCodec(_THRESHOLD, "Status", role="client")
+    stream = pool.stream(codec, max_pending=2)
+    frames = [_frame(PongResponse(payload).serialize(_THRESHOLD)) for payload in range(6)]
+    frames_iter = iter(frames)
+
+    def read_frame() -> bytes:
+        frame = next(frames_iter, None)
+        if frame is None:
+            raise ConnectionError
+        return frame
+
+    reader = threading.Thread(target=stream.pump, args=(read_frame,), daemon=True)
+    reader.start()
+    time.sleep(0.1)
+    assert stream.pending == 2
+    assert reader.is_alive()
+
+    assert [packet.timestamp for packet in stream] == list(range(6))
+    reader.join(5)
+    assert not reader.is_alive()
+
+
+def test_close_releases_a_blocked_submit(pool):
+    stream = pool.stream(PacketCodec(_THRESHOLD, "Status", role="client"), max_pending=1)
+    frame = _frame(PongResponse(1).serialize(_THRESHOLD))
+    stream.submit(frame)
+    errors = []
+
+    def submit() -> None:
+        try:
+            stream.submit(frame)
+        except ConnectionError as exc:
+            errors.append(exc)
+
+    reader = threading.Thread(target=submit, daemon=True)
+    reader.start()
+    time.sleep(0.05)
+    stream.close()
+    reader.join(5)
+    assert len(errors) == 1
@@ -0,0 +1,77 @@
+# tests/test_latency_probe.py
+
+import asyncio
+import json
+
+import pytest
+
+from codec.packets.registry import PacketRegistry
+from network.connection_manager import Connection
+from network.latency_probe import LatencyProbe
+
+_PONG = "codec.packets.play.clientbound.pong_response.PongResponse"
+_VERSION = 9999
+
+
+def _framed(body: bytes) -> bytes:
+    return bytes([len(body)]) + body  # bodies here are shorter than 128 bytes
+
+
+class _EchoWriter:
+    """Answers each Play Ping Request (0x25) with a pong of `pong_id`, after a decoy frame."""
+
+    def __init__(self, reader: asyncio.StreamReader, pong_id: int):
+        self.reader = reader
+        self.pong_id = pong_id
+
+    def write(self, data: bytes) -> None:
+        data = bytes(data)
+        while data:
+            length = data[0]
+            packet_id, payload = data[1], data[2 : 1 + length]
+            data = data[1 + length :]
+            if packet_id == 0x25:
+                self.reader.feed_data(_framed(bytes([0x3C]) + b"\xff" * 8))
+                self.reader.feed_data(_framed(bytes([self.pong_id]) + payload))
+
+    async def drain(self) -> None:
+        pass
+
+    def get_extra_info(self, name):
+        return None
+
+
+def _registry(tmp_path, pong_ids: dict) -> PacketRegistry:
+    spec = {"packets": {"Play": {"clientbound": pong_ids}}}
+    (tmp_path / f"{_VERSION}.json").write_text(json.dumps(spec))
+    return PacketRegistry(versions_dir=str(tmp_path))
+
+
+def _connection(registry: PacketRegistry, pong_id: int) -> Connection:
+    reader = asyncio.StreamReader()
+    connection = Connection(
+        reader, _EchoWriter(reader, pong_id), initial_state="Play", role="client", registry=registry
+    )
+    connection.bind_version(_VERSION)
+    return connection
+
+
+def test_pong_id_comes_from_the_bound_version(tmp_path):
+    registry = _registry(tmp_path, {"0x3C": None, "0x40": _PONG})
+
+    async def scenario():
+        probe = LatencyProbe(_connection(registry, 0x40))
+        histogram = await probe.run(count=3, timeout=2)
+        return probe.lost, histogram.count
+
+    assert asyncio.run(scenario()) == (0, 3)
+
+
+def test_version_without_pong_is_rejected(tmp_path):
+    registry = _registry(tmp_path, {"0x3C": None})
+
+    async def scenario():
+        await LatencyProbe(_connection(registry, 0x3C)).run(count=1, timeout=1)
+
+    with pytest.raises(ValueError, match="no Play pong"):
+        asyncio.run(scenario())
@@ -0,0 +1,102 @@
+# tests/test_nbt.py
+
+import struct
+
+import pytest
+
+from codec.data_types.complex import nbt as nbt_module
+from codec.data_types.complex.nbt import (
+    TAG_BYTE_ARRAY,
+    TAG_COMPOUND,
+    TAG_INT_ARRAY,
+    TAG_LIST,
+    TAG_LONG_ARRAY,
+    TAG_SHORT,
+    Nbt,
+    NbtCompound,
+    NbtList,
+    NbtTypedList,
+)
+
+_VALUE = {
+    "name": "minecraft:plains",
+    "id": 1,
+    "big": 1 << 40,
+    "scale": 0.5,
+    "flags": b"\x01\x02",
+    "effects": {"sky_color": 7907327, "mood": {"tick_delay": 6000}},
+    "tags": ["a", "b"],
+    "nested": [{"x": 1}, {"x": 2}],
+}
+
+
+def _nested_compounds(depth: int) -> bytes:
+    """Root compound wrapping `depth - 1` further compounds under key "a"."""
+    entry = bytes((TAG_COMPOUND,)) + struct.pack(">H", 1) + b"a"
+    return bytes((TAG_COMPOUND,)) + entry * (depth - 1) + b"\x00" * depth
+
+
+def _nested_lists(depth: int) -> bytes:
+    """Root list of lists, `depth` levels, the innermost empty."""
+    return bytes((TAG_LIST,)) + (bytes((TAG_LIST,)) + struct.pack(">i", 1)) * (depth - 1) + b"\x00" + struct.pack(">i", 0)
+
+
+def test_round_trip_and_lazy_access():
+    data = bytes(Nbt(_VALUE)) + b"trailing"
+    decoded, size = Nbt.from_bytes(data)
+    assert size == len(data) - len(b"trailing")
+    root = decoded.value
+    assert isinstance(root, NbtCompound)
+    assert root["effects"]["mood"]["tick_delay"] == 6000
+    assert isinstance(root["nested"], NbtList)
+    assert root["nested"][1]["x"] == 2
+    assert root.to_python() == _VALUE
+    assert bytes(decoded) == data[:size]
+    assert Nbt.skip(data) == size
+
+
+def test_numeric_list_keeps_element_tag():
+    payload = bytes((TAG_SHORT,)) + struct.pack(">i", 3) + struct.pack(">3h", 1, -2, 3)
+    data = bytes((TAG_COMPOUND,)) + bytes((TAG_LIST,)) + struct.pack(">H", 1) + b"s" + payload + b"\x00"
+    value = Nbt.from_bytes(data)[0].value["s"]
+    assert isinstance(value, NbtTypedList)
+    assert value.element_type == TAG_SHORT
+    assert value.tolist() == [1, -2, 3]
+    assert bytes(Nbt({"s": value})) == data
+
+
+@pytest.mark.parametrize("build", [_nested_compounds, _nested_lists])
+def test_depth_limit(build):
+    deepest = build(512)
+    assert Nbt.from_bytes(deepest)[1] == len(deepest)
+    assert Nbt.skip(deepest) == len(deepest)
+    with pytest.raises(ValueError, match="deeper than 512"):
+        Nbt.from_bytes(build(513))
+    with pytest.raises(ValueError, match="deeper than 512"):
+        Nbt.from_bytes(build(5000))
+
+
+@pytest.mark.parametrize("tag", [TAG_BYTE_ARRAY, TAG_INT_ARRAY, TAG_LONG_ARRAY])
+@pytest.mark.parametrize("numpy", [True, False])
+def test_negative_array_length(monkeypatch, tag, numpy):
+    if not numpy:
+        monkeypatch.setattr(nbt_module, "np", None)
+    payload = struct.pack(">i", -1) + bytes(16)
+    with pytest.raises(ValueError, match="Negative NBT array length"):
+        Nbt.from_bytes(bytes((tag,)) + payload)
+    compound = bytes((TAG_COMPOUND, tag)) + struct.pack(">H", 1) + b"v" + payload + b"\x00"
+    with pytest.raises(ValueError, match="Negative NBT array length"):
+        Nbt.from_bytes(compound)
+
+
+def test_negative_list_length_is_empty():
+    data = bytes((TAG_LIST, TAG_COMPOUND)) + struct.pack(">i", -5)
+    value, size = Nbt.from_bytes(data)
+    assert size == len(data)
+    assert list(value.value) == []
+
+
+def test_truncated():
+    data = bytes(Nbt(_VALUE))
+    with pytest.raises(ValueError):
+        Nbt.from_bytes(data[:-3])
@@ -0,0 +1,57 @@
+# tests/test_outbound_scheduler.py
+
+from codec.packets.frozen import FrozenPacket
+from codec.packets.play.clientbound.pong_response import PongResponse
+from codec.packets.play.serverbound.ping_request import PingRequest
+from network.outbound_scheduler import BULK, CONTROL, NORMAL, OutboundScheduler
+
+_PONG = "codec.packets.play.clientbound.pong_response.PongResponse"
+_PING = "codec.packets.play.serverbound.ping_request.PingRequest"
+
+
+def _scheduler() -> OutboundScheduler:
+    return OutboundScheduler(priorities={_PING: CONTROL}, barriers=frozenset({_PONG}))
+
+
+def _drain(scheduler: OutboundScheduler) -> list:
+    items = []
+    while scheduler:
+        items.append(scheduler.popleft()[0])
+    return items
+
+
+def test_frozen_packets_keep_their_classification():
+    scheduler = _scheduler()
+    for packet in (PongResponse(1), FrozenPacket(PongResponse(1))):
+        assert scheduler.classify(packet) == (NORMAL, True, False)
+    for packet in (PingRequest(1), FrozenPacket(PingRequest(1))):
+        assert scheduler.classify(packet) == (CONTROL, False, False)
+
+
+def test_frozen_barrier_keeps_order():
+    scheduler = _scheduler()
+    barrier = FrozenPacket(PongResponse(7))
+    ping = FrozenPacket(PingRequest(1))
+    scheduler.append((b"before",), BULK)
+    scheduler.append((barrier,))
+    scheduler.append((ping,))
+    assert _drain(scheduler) == [b"before", barrier, ping]
+
+
+def test_frozen_control_goes_first():
+    scheduler = _scheduler()
+    ping = FrozenPacket(PingRequest(1))
+    scheduler.append((b"chunk",), BULK)
+    scheduler.append((b"move",), NORMAL)
+    scheduler.append((ping,))
+    assert _drain(scheduler)[0] is ping
+
+
+def test_barrier_orders_classes():
+    scheduler = _scheduler()
+    barrier = PongResponse(7)
+    scheduler.append((b"bulk",), BULK)
+    scheduler.append((barrier,))
+    scheduler.append((b"control",), CONTROL)
+    scheduler.append((b"normal",), NORMAL)
+    assert _drain(scheduler) == [b"bulk", barrier, b"control", b"normal"]
@@ -0,0 +1,40 @@
+# tests/test_packet_writer.py
+
+import socket
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from codec.packets.status.clientbound.pong_response import PongResponse
+from network.packet_writer import PacketWriter
+
+
+class _Broken(Packet):
+    def __init__(self):
+        Packet.__init__(self, VarInt(0))
+
+    def _iter_fields(self):
+        raise ValueError("cannot encode")
+
+
+def test_serialization_failure_skips_only_that_packet():
+    ours, theirs = socket.socketpair()
+    writer = PacketWriter(ours)
+    try:
+        writer.put(PongResponse(1))
+        writer.put(_Broken())
+        writer.put(PongResponse(2))
+        assert writer.flush(timeout=5)
+        assert writer.error is None
+        assert writer.failed == 1
+        assert writer.stats()["failed"] == 1
+
+        expected = PongResponse(1).serialize() + PongResponse(2).serialize()
+        received = b""
+        theirs.settimeout(5)
+        while len(received) < len(expected):
+            received += theirs.recv(len(expected) - len(received))
+        assert received == expected
+    finally:
+        writer.close()
+        ours.close()
+        theirs.close()
@@ -0,0 +1,81 @@
+# tests/test_prefork.py
+
+import asyncio
+import time
+
+import pytest
+
+from network.prefork import PreforkServer
+
+
+class _Manager:
+    """Stand-in for `ConnectionManager` whose shutdown takes a while."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {"accepted": 0, "open_connections": 0, "frames": 0}
+
+    async def shutdown(self, drain_timeout: float) -> None:
+        await asyncio.sleep(0.5)
+
+
+@pytest.fixture
+def server():
+    server = PreforkServer(
+        host="127.0.0.1",
+        port=0,
+        workers=2,
+        factory=_Manager,
+        drain_timeout=2.0,
+        health_interval=0.02,
+        health_timeout=2.0,
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+def _live(server):
+    return [worker for worker in server._workers if not worker.stopping]
+
+
+def test_reload_during_drain(server):
+    server.reload()
+    server.reload()  # the first old generation is still draining
+    assert server.generation == 3
+    assert [worker.generation for worker in _live(server)] == [3, 3]
+    assert len(server._workers) <= 2 * server.workers
+    assert len({worker.slot for worker in server._workers}) == len(server._workers)
+
+
+def test_respawn_during_reload(server):
+    server.reload()
+    crashed = _live(server)[0]
+    crashed.process.kill()
+    crashed.process.join()
+    server.supervise()
+    assert server.restarts == 1
+    assert [worker.generation for worker in _live(server)] == [2, 2]
+
+
+def test_crashed_old_worker_is_not_respawned(server):
+    server._workers[0].process.kill()
+    server._workers[0].process.join()
+    server.reload()
+    server.supervise()
+    assert server.restarts == 0
+    assert [worker.generation for worker in _live(server)] == [2, 2]
+
+
+def test_no_free_slot_raises(server):
+    server._spawn(server.generation)
+    server._spawn(server.generation)
+    deadline = time.monotonic() + 2
+    with pytest.raises(RuntimeError, match="No free worker slot"):
+        server._spawn(server.generation)
+    assert time.monotonic() < deadline
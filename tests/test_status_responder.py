@@ -0,0 +1,45 @@
+# tests/test_status_responder.py
+
+import pytest
+
+from codec.packets.status.clientbound.status_response import StatusResponse
+from network.status_responder import StatusResponder
+
+_VERSION = {"name": "1.21.10", "protocol": 773}
+_SAMPLE = [{"name": "Player_1", "id": "00000000-0000-0000-0000-000000000001"}]
+
+_SHAPES = [
+    {"version": _VERSION, "description": {"text": "No players"}},
+    {"version": _VERSION, "players": {"max": 20, "online": 3}},
+    {"version": _VERSION, "players": {"max": 20, "online": 1, "sample": _SAMPLE}},
+    {"version": _VERSION, "players": {"online": 5, "max": 10, "sample": []}},
+    {"version": _VERSION, "players": {"online": 7}},
+    {"version": _VERSION, "players": {}},
+    {"players": {"max": 100, "online": 0, "sample": _SAMPLE}, "version": _VERSION, "enforcesSecureChat": True},
+]
+
+
+def _expected(status: dict) -> bytes:
+    return StatusResponse.from_status(status).serialize()
+
+
+@pytest.mark.parametrize("status", _SHAPES)
+def test_matches_status_response(status):
+    assert StatusResponder(status).response() == _expected(status)
+
+
+def test_matches_across_shape_changes():
+    responder = StatusResponder(_SHAPES[0])
+    for status in _SHAPES + _SHAPES[::-1]:
+        assert responder.response_for(status) == _expected(status)
+
+
+def test_absent_fields_are_not_spliced():
+    responder = StatusResponder(_SHAPES[0])
+    assert responder.response(online=4, max_players=8, sample=_SAMPLE) == _expected(_SHAPES[0])
+
+
+def test_counts_override_present_fields():
+    responder = StatusResponder(_SHAPES[2])
+    status = {"version": _VERSION, "players": {"max": 30, "online": 9, "sample": _SAMPLE}}
+    assert responder.response(online=9, max_players=30) == _expected(status)
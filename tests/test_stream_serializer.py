@@ -0,0 +1,106 @@
+# tests/test_stream_serializer.py
+
+import asyncio
+
+import pytest
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.packet import Packet
+from network.buffer_pool import BufferPool, ConnectionBudget
+from network.connection_manager import Connection
+from network.stream_serializer import serialize_streaming
+
+_CHUNK = 1024
+
+
+class _Blob(Packet):
+    __slots__ = ("data", "fail")
+
+    def __init__(self, data: bytes, fail: bool = False):
+        super().__init__(VarInt._trusted(0x7F))
+        self.data = data
+        self.fail = fail
+
+    def _iter_fields(self):
+        yield self.data
+        if self.fail:
+            raise RuntimeError("field failed")
+
+
+class _Writer:
+    def __init__(self):
+        self.written = bytearray()
+
+    def write(self, data):
+        self.written += data
+
+    def get_extra_info(self, name):
+        return None
+
+
+def _blob(size: int) -> _Blob:
+    return _Blob(bytes(i % 251 for i in range(size)))
+
+
+@pytest.mark.parametrize("threshold", [None, 256])
+def test_pooled_chunks_are_reserved_until_release(threshold):
+    pool = BufferPool(chunk_size=_CHUNK)
+    packet = _blob(5000)
+    frame = serialize_streaming(packet, threshold, pool)
+    chunks = len(frame.views())
+    assert chunks and pool.reserved == chunks * _CHUNK
+    if threshold is None:
+        assert bytes(frame) == packet.serialize()
+
+    frame.release()
+    assert pool.reserved == 0
+    assert pool.stats()["free_chunks"] == chunks
+
+
+def test_exhausted_budget_falls_back_to_plain_chunks():
+    pool = BufferPool(chunk_size=_CHUNK, max_bytes=2 * _CHUNK)
+    packet = _blob(5000)
+    frame = serialize_streaming(packet, None, pool)
+    assert pool.reserved == 2 * _CHUNK
+    assert pool.rejections == 0
+    assert bytes(frame) == packet.serialize()
+
+    frame.release()
+    assert pool.reserved == 0
+    assert pool.stats()["free_chunks"] == 2
+
+
+def test_failed_serialize_releases_reservation():
+    pool = BufferPool(chunk_size=_CHUNK)
+    with pytest.raises(RuntimeError):
+        serialize_streaming(_Blob(bytes(5000), fail=True), None, pool)
+    assert pool.reserved == 0
+
+
+def test_try_reserve_does_not_overtake_waiters():
+    async def scenario():
+        pool = BufferPool(chunk_size=_CHUNK, max_bytes=2 * _CHUNK)
+        assert pool.try_reserve(2 * _CHUNK)
+        waiting = asyncio.ensure_future(pool.reserve(_CHUNK))
+        await asyncio.sleep(0)
+        pool.release(_CHUNK)
+        assert not pool.try_reserve(_CHUNK)
+        await waiting
+        assert pool.reserved == 2 * _CHUNK
+
+    asyncio.run(scenario())
+
+
+def test_send_streaming_releases_after_write():
+    async def scenario():
+        pool = BufferPool(chunk_size=_CHUNK)
+        writer = _Writer()
+        connection = Connection(asyncio.StreamReader(), writer, budget=ConnectionBudget(pool))
+        connection.set_state("Play")
+        packet = _blob(5000)
+        connection.send_streaming(packet)
+        assert pool.reserved == 0
+        assert pool.high_water >= 5 * _CHUNK
+        assert writer.written == packet.serialize()
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+# tests/test_text_component.py
+
+import json
+
+import pytest
+
+from codec.data_types.complex.text_component import TextComponent
+from codec.packets.status.clientbound.status_response import StatusResponse
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"text": "Hi ", "extra": ["there", {"text": "!"}]}, "Hi there!"),
+        ({"translate": "%s vs %2$s", "with": ["a", {"text": "b"}]}, "a vs b"),
+        ({"score": {"name": "x", "objective": "o", "value": 7}}, "7"),
+        ({"score": "12"}, "12"),
+        ({"translate": "hello %s", "with": "world"}, "hello world"),
+        ({"translate": "hello %s", "with": {"text": "world"}}, "hello world"),
+        ({"translate": "bad %0$s index"}, "bad  index"),
+        ({"text": "a", "extra": "b"}, "ab"),
+        ({"text": "a", "extra": {"text": "b"}}, "ab"),
+        ({"text": "a", "extra": 3}, "a3"),
+        ({"text": "a", "extra": [None, 1, ["b"]]}, "a1b"),
+    ],
+)
+def test_plain_text_renders_malformed_components(value, expected):
+    assert TextComponent(value, form="json").plain_text == expected
+    assert TextComponent.from_json(json.dumps(value)).plain_text == expected
+
+
+def test_nbt_component_renders_leniently():
+    component = TextComponent({"text": "a", "extra": [{"score": "b"}]})
+    decoded, _ = TextComponent.from_bytes(bytes(component))
+    assert decoded.plain_text == "ab"
+
+
+def test_status_response_renders_description_lazily():
+    status = {"version": {"name": "1.21.10", "protocol": 773}, "description": {"text": "motd", "extra": 5}}
+    response = StatusResponse.from_status(status)
+    assert response.description_component._plain is None
+    assert response.description == "motd5"
+    assert StatusResponse.from_status({"version": status["version"]}).description == ""
@@ -0,0 +1,80 @@
+# tests/test_version_ids.py
+
+import json
+import socket
+
+import pytest
+
+from codec.data_types.primitives.varint import VarInt
+from codec.packets.frozen import FrozenPacket
+from codec.packets.play.serverbound.ping_request import PingRequest
+from codec.packets.registry import PacketRegistry
+from network.packet_io import PacketIO
+
+_PING_REQUEST = "codec.packets.play.serverbound.ping_request.PingRequest"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registry whose protocol 774 moves Play Ping Request from 0x25 to 0x26."""
+    spec = {
+        "extends": 773,
+        "packets": {"Play": {"serverbound": {"0x25": None, "0x26": _PING_REQUEST}}},
+    }
+    (tmp_path / "774.json").write_text(json.dumps(spec))
+    return PacketRegistry(versions_dir=str(tmp_path))
+
+
+@pytest.fixture
+def pair(registry):
+    ours, theirs = socket.socketpair()
+    client = PacketIO(ours, initial_state="Play", role="client", registry=registry)
+    server = PacketIO(theirs, initial_state="Play", role="server", registry=registry)
+    client.bind_version(774)
+    server.bind_version(774)
+    yield client, server
+    ours.close()
+    theirs.close()
+
+
+def _packet_id(frame: bytes) -> int:
+    length, size = VarInt.from_bytes(frame, 0)
+    return VarInt.from_bytes(frame, size)[0].value
+
+
+def test_encode_uses_bound_version_id(pair):
+    client, _ = pair
+    assert _packet_id(client._encode_packet("0x26", data=7)) == 0x26
+
+
+@pytest.mark.parametrize("wrap", [lambda packet: packet, FrozenPacket])
+def test_send_packet_round_trip(pair, wrap):
+    client, server = pair
+    client.send_packet(wrap(PingRequest(1234)))
+    packet = server.read()
+    assert isinstance(packet, PingRequest)
+    assert packet.timestamp == 1234
+
+
+def test_default_version_keeps_class_id(registry):
+    ours, theirs = socket.socketpair()
+    try:
+        client = PacketIO(ours, initial_state="Play", role="client", registry=registry)
+        assert client._outbound_id(PingRequest(0)).value == 0x25
+    finally:
+        ours.close()
+        theirs.close()
+
+
+def test_packet_missing_from_bound_version(tmp_path):
+    spec = {"extends": 773, "packets": {"Play": {"serverbound": {"0x25": None}}}}
+    (tmp_path / "774.json").write_text(json.dumps(spec))
+    ours, theirs = socket.socketpair()
+    try:
+        client = PacketIO(ours, initial_state="Play", role="client", registry=PacketRegistry(str(tmp_path)))
+        client.bind_version(774)
+        with pytest.raises(ValueError):
+            client.send_packet(PingRequest(0))
+    finally:
+        ours.close()
+        theirs.close()